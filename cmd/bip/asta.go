@@ -1,9 +1,6 @@
 package main
 
-import (
-	"github.com/joho/godotenv"
-	"github.com/spf13/cobra"
-)
+import "github.com/spf13/cobra"
 
 var astaHuman bool
 
@@ -30,9 +27,6 @@ the search endpoint may time out. Register at https://allenai.org/asta/resources
 }
 
 func init() {
-	// Load .env file if present (for BIP_ASTA_API_KEY / ASTA_API_KEY)
-	_ = godotenv.Load()
-
 	astaCmd.PersistentFlags().BoolVar(&astaHuman, "human", false, "Output human-readable format instead of JSON")
 	rootCmd.AddCommand(astaCmd)
 }
@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -90,8 +91,9 @@ func runBoardList(cmd *cobra.Command, args []string) {
 	}
 
 	allItems := make(map[string][]flow.BoardItem)
-	for _, key := range boards {
-		items, err := board.ListBoardItems(key)
+	boardItems, boardErrs := board.ListBoardsItems(boards)
+	for i, key := range boards {
+		items, err := boardItems[i], boardErrs[i]
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "Warning: failed to list board %s: %v\n", key, err)
 			continue
@@ -111,9 +113,12 @@ func runBoardList(cmd *cobra.Command, args []string) {
 		allItems[key] = items
 	}
 
-	// Output
+	// Buffer output so it goes out in large writes rather than one per line.
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
 	if boardListJSON {
-		enc := json.NewEncoder(os.Stdout)
+		enc := json.NewEncoder(out)
 		enc.SetIndent("", "  ")
 		enc.Encode(allItems)
 		return
@@ -128,11 +133,11 @@ func runBoardList(cmd *cobra.Command, args []string) {
 		if channel, ok := channelForBoard[key]; ok {
 			header = fmt.Sprintf("%s (%s)", key, channel)
 		}
-		fmt.Printf("## %s\n\n", header)
+		fmt.Fprintf(out, "## %s\n\n", header)
 
 		if len(items) == 0 {
-			fmt.Println("No items on board.")
-			fmt.Println()
+			fmt.Fprintln(out, "No items on board.")
+			fmt.Fprintln(out)
 			continue
 		}
 
@@ -148,11 +153,11 @@ func runBoardList(cmd *cobra.Command, args []string) {
 
 		for _, status := range statusOrder {
 			statusItems := byStatus[status]
-			fmt.Printf("### %s\n", status)
+			fmt.Fprintf(out, "### %s\n", status)
 			for _, item := range statusItems {
-				fmt.Printf("- %s#%d: %s\n", item.Content.Repository, item.Content.Number, item.Title)
+				fmt.Fprintf(out, "- %s#%d: %s\n", item.Content.Repository, item.Content.Number, item.Title)
 			}
-			fmt.Println()
+			fmt.Fprintln(out)
 		}
 	}
 }
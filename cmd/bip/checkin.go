@@ -3,6 +3,7 @@ package main
 import (
 	"fmt"
 	"os"
+	"strings"
 	"time"
 
 	"github.com/matsen/bipartite/internal/config"
@@ -116,28 +117,31 @@ func runCheckin(cmd *cobra.Command, args []string) {
 	var totalIssues, totalPRs, totalComments int
 	var allItems []flow.ItemDetails
 
-	for _, repo := range repos {
-		items, err := flow.FetchIssues(repo, since)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Error fetching %s: %v\n", repo, err)
+	// Fetch every repo up front (in parallel), then process serially in
+	// repo order so output is deterministic.
+	for _, activity := range flow.FetchReposActivity(repos, since) {
+		repo := activity.Repo
+		if activity.ItemsErr != nil {
+			fmt.Fprintf(os.Stderr, "Error fetching %s: %v\n", repo, activity.ItemsErr)
 			continue
 		}
+		items := activity.Items
 
-		issueComments, err := flow.FetchIssueComments(repo, since)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Warning: failed to fetch issue comments for %s: %v\n", repo, err)
+		if activity.IssueCommentsErr != nil {
+			fmt.Fprintf(os.Stderr, "Warning: failed to fetch issue comments for %s: %v\n", repo, activity.IssueCommentsErr)
 		}
-		prComments, err := flow.FetchPRComments(repo, since)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Warning: failed to fetch PR comments for %s: %v\n", repo, err)
+		if activity.PRCommentsErr != nil {
+			fmt.Fprintf(os.Stderr, "Warning: failed to fetch PR comments for %s: %v\n", repo, activity.PRCommentsErr)
 		}
-		allComments := append(issueComments, prComments...)
+		allComments := append(activity.IssueComments, activity.PRComments...)
 
-		// Split into issues and PRs
+		// Split into issues and PRs, collecting PR numbers in the same pass
 		var issues, prs []flow.GitHubItem
+		var prNumbers []int
 		for _, item := range items {
 			if item.IsPR {
 				prs = append(prs, item)
+				prNumbers = append(prNumbers, item.Number)
 			} else {
 				issues = append(issues, item)
 			}
@@ -148,10 +152,6 @@ func runCheckin(cmd *cobra.Command, args []string) {
 		// For ball-in-court, all reviews are included as actions.
 		var allReviewComments []flow.GitHubComment
 		if len(prs) > 0 {
-			var prNumbers []int
-			for _, pr := range prs {
-				prNumbers = append(prNumbers, pr.Number)
-			}
 			allReviewComments = flow.FetchPRReviewsAsComments(repo, prNumbers, time.Time{})
 			// Add only since-window reviews to display comments
 			for _, rc := range allReviewComments {
@@ -177,25 +177,29 @@ func runCheckin(cmd *cobra.Command, args []string) {
 			// Enrich actions: for items with no actions at all, fetch their
 			// last comment so ball-in-court doesn't fall through to the default.
 			// This fixes the bug where the user's comment predates the since window.
-			itemsForEnrich := append(append([]flow.GitHubItem{}, issues...), prs...)
+			itemsForEnrich := make([]flow.GitHubItem, 0, len(issues)+len(prs))
+			itemsForEnrich = append(append(itemsForEnrich, issues...), prs...)
 			enriched := flow.EnrichActionsWithLastComments(repo, itemsForEnrich, allActions)
 			allActions = append(allActions, enriched...)
 
+			// Index the last action per item once; both item lists (and the
+			// commenter lookup below) are checked against it.
+			lastActions := flow.IndexLastActions(allActions)
 			if checkinBroad {
-				issues = flow.FilterByBallInCourt(issues, allActions, githubUser)
-				prs = flow.FilterByBallInCourt(prs, allActions, githubUser)
+				issues = lastActions.Filter(issues, githubUser)
+				prs = lastActions.Filter(prs, githubUser)
 			} else {
 				// Strict filter: for teammate items with no window activity, require
 				// some signal of involvement. Populate PR requested reviewers and
 				// past commenters for items that would otherwise fall through.
 				prs = enrichPRsWithRequestedReviewers(repo, prs)
 				inv := flow.Involvement{
-					Commenters: fetchCommentersForUnengaged(repo, issues, prs, allActions, githubUser),
+					Commenters: fetchCommentersForUnengaged(repo, issues, prs, lastActions, githubUser),
 				}
-				issues = flow.FilterByBallInCourtStrict(issues, allActions, githubUser, inv)
-				prs = flow.FilterByBallInCourtStrict(prs, allActions, githubUser, inv)
+				issues = lastActions.FilterStrict(issues, githubUser, inv)
+				prs = lastActions.FilterStrict(prs, githubUser, inv)
 			}
-			allComments = flow.FilterCommentsByItems(allComments, append(issues, prs...))
+			allComments = flow.FilterCommentsByItems(allComments, issues, prs)
 		}
 
 		if len(issues) == 0 && len(prs) == 0 && len(allComments) == 0 {
@@ -221,19 +225,20 @@ func runCheckin(cmd *cobra.Command, args []string) {
 
 		fmt.Println()
 
-		// Collect items for summarization
+		// Collect items for summarization; comments are fetched in one
+		// concurrent batch after all repos are processed.
 		if checkinSummarize {
-			for _, item := range append(issues, prs...) {
-				comments, _ := flow.FetchItemComments(repo, item.Number, 10)
-				allItems = append(allItems, flow.ItemDetails{
-					Ref:      fmt.Sprintf("%s#%d", repo, item.Number),
-					Title:    item.Title,
-					Author:   item.User.Login,
-					Body:     item.Body,
-					IsPR:     item.IsPR,
-					State:    item.State,
-					Comments: comments,
-				})
+			for _, list := range [][]flow.GitHubItem{issues, prs} {
+				for _, item := range list {
+					allItems = append(allItems, flow.ItemDetails{
+						Ref:    fmt.Sprintf("%s#%d", repo, item.Number),
+						Title:  item.Title,
+						Author: item.User.Login,
+						Body:   item.Body,
+						IsPR:   item.IsPR,
+						State:  item.State,
+					})
+				}
 			}
 		}
 	}
@@ -255,10 +260,13 @@ func runCheckin(cmd *cobra.Command, args []string) {
 	// Generate take-home summaries if requested
 	if checkinSummarize && len(allItems) > 0 {
 		fmt.Println("\n## Take-home Summaries")
+		flow.FillItemComments(allItems, 10)
 		summaries, err := flow.GenerateTakehomeSummaries(allItems)
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "Error generating summaries: %v\n", err)
-		} else {
+		}
+		// On partial failure, still show the summaries that succeeded.
+		if summaries != nil {
 			printSummariesByRepo(allItems, summaries)
 		}
 	}
@@ -294,25 +302,19 @@ func enrichPRsWithRequestedReviewers(repo string, prs []flow.GitHubItem) []flow.
 
 // fetchCommentersForUnengaged returns commenter logins for teammate items with
 // no actions in the window. These are the items the strict filter routes
-// through HasInvolvement — past commenters only change the outcome when
-// `len(itemActions) == 0`; if anyone has acted, the last-actor rule decides
-// and involvement is not consulted.
+// through HasInvolvement — past commenters only change the outcome when the
+// item has no entry in lastActions; if anyone has acted, the last-actor rule
+// decides and involvement is not consulted.
 //
 // Only items that (a) have no actions from any participant AND (b) are authored
 // by someone other than githubUser are queried.
-func fetchCommentersForUnengaged(repo string, issues, prs []flow.GitHubItem, actions []flow.ItemAction, githubUser string) map[int][]string {
-	// Which items have any action in the window (from anyone)?
-	itemHasActions := make(map[int]bool)
-	for _, a := range actions {
-		itemHasActions[a.ItemNumber] = true
-	}
-
+func fetchCommentersForUnengaged(repo string, issues, prs []flow.GitHubItem, lastActions flow.LastActions, githubUser string) map[int][]string {
 	var targets []int
 	for _, it := range issues {
 		if it.User.Login == githubUser {
 			continue
 		}
-		if itemHasActions[it.Number] {
+		if _, acted := lastActions[it.Number]; acted {
 			continue
 		}
 		targets = append(targets, it.Number)
@@ -321,7 +323,7 @@ func fetchCommentersForUnengaged(repo string, issues, prs []flow.GitHubItem, act
 		if it.User.Login == githubUser {
 			continue
 		}
-		if itemHasActions[it.Number] {
+		if _, acted := lastActions[it.Number]; acted {
 			continue
 		}
 		targets = append(targets, it.Number)
@@ -341,29 +343,23 @@ func fetchCommentersForUnengaged(repo string, issues, prs []flow.GitHubItem, act
 
 // printSummariesByRepo prints summaries grouped by repo with clickable URLs.
 func printSummariesByRepo(items []flow.ItemDetails, summaries flow.TakehomeSummary) {
-	// Build lookup for item info (IsPR) by ref
-	itemInfo := make(map[string]flow.ItemDetails)
-	for _, item := range items {
-		itemInfo[item.Ref] = item
-	}
-
-	// Group refs by repo (preserving order)
+	// Group item indices by repo (preserving order). Holding indices avoids
+	// copying each ItemDetails into a ref-keyed lookup map.
 	type repoItems struct {
-		repo string
-		refs []string
+		repo    string
+		indices []int
 	}
 	var repoOrder []repoItems
 	repoMap := make(map[string]int) // repo -> index in repoOrder
 
-	for _, item := range items {
-		ref := item.Ref
+	for i, item := range items {
 		// Extract repo from ref (e.g., "org/repo#123" -> "org/repo")
-		repo := extractRepoFromRef(ref)
+		repo := extractRepoFromRef(item.Ref)
 		if idx, exists := repoMap[repo]; exists {
-			repoOrder[idx].refs = append(repoOrder[idx].refs, ref)
+			repoOrder[idx].indices = append(repoOrder[idx].indices, i)
 		} else {
 			repoMap[repo] = len(repoOrder)
-			repoOrder = append(repoOrder, repoItems{repo: repo, refs: []string{ref}})
+			repoOrder = append(repoOrder, repoItems{repo: repo, indices: []int{i}})
 		}
 	}
 
@@ -372,17 +368,17 @@ func printSummariesByRepo(items []flow.ItemDetails, summaries flow.TakehomeSumma
 		repoName := flow.ExtractRepoName(ri.repo)
 		fmt.Printf("\n  %s\n\n", repoName)
 
-		for _, ref := range ri.refs {
-			summary, ok := summaries[ref]
+		for _, i := range ri.indices {
+			item := &items[i]
+			summary, ok := summaries[item.Ref]
 			if !ok {
 				continue
 			}
 
 			// Generate URL
-			info := itemInfo[ref]
-			number := extractNumberFromRef(ref)
+			number := extractNumberFromRef(item.Ref)
 			itemType := "issue"
-			if info.IsPR {
+			if item.IsPR {
 				itemType = "pr"
 			}
 			url := flow.GitHubURL(ri.repo, number, itemType)
@@ -422,6 +418,7 @@ func extractNumberFromRef(ref string) int {
 func printItems(items []flow.GitHubItem, label string, since time.Time) {
 	fmt.Printf("\n### %s (%d)\n", label, len(items))
 
+	now := time.Now()
 	limit := 10
 	for i, item := range items {
 		if i >= limit {
@@ -434,7 +431,7 @@ func printItems(items []flow.GitHubItem, label string, since time.Time) {
 			marker = "NEW"
 		}
 
-		timeAgo := flow.FormatTimeAgo(item.UpdatedAt)
+		timeAgo := flow.FormatTimeAgoAt(item.UpdatedAt, now)
 		fmt.Printf("  [%s] %s - %s (%s)\n", marker, item.HTMLURL, item.Title, timeAgo)
 	}
 }
@@ -442,32 +439,16 @@ func printItems(items []flow.GitHubItem, label string, since time.Time) {
 func printComments(comments []flow.GitHubComment) {
 	fmt.Printf("\n### Comments (%d)\n", len(comments))
 
-	// Group by item
-	byItem := make(map[int][]flow.GitHubComment)
-	for _, c := range comments {
-		num := getItemNumber(c)
-		byItem[num] = append(byItem[num], c)
-	}
+	itemOrder, byItem := flow.GroupCommentsByItem(comments)
 
+	now := time.Now()
 	limit := 10
-	count := 0
-	for itemNum, itemComments := range byItem {
-		if count >= limit {
-			fmt.Printf("  ... and %d more items with comments\n", len(byItem)-limit)
+	for i, itemNum := range itemOrder {
+		if i >= limit {
+			fmt.Printf("  ... and %d more items with comments\n", len(itemOrder)-limit)
 			break
 		}
-
-		// Get URL from first comment
-		url := itemComments[0].HTMLURL
-		// Strip comment anchor
-		if idx := len(url) - 1; idx > 0 {
-			for i := len(url) - 1; i >= 0; i-- {
-				if url[i] == '#' {
-					url = url[:i]
-					break
-				}
-			}
-		}
+		itemComments := byItem[itemNum]
 
 		fmt.Printf("  #%d: %d new comment(s)\n", itemNum, len(itemComments))
 
@@ -475,7 +456,7 @@ func printComments(comments []flow.GitHubComment) {
 			if j >= 3 {
 				break
 			}
-			timeAgo := flow.FormatTimeAgo(c.UpdatedAt)
+			timeAgo := flow.FormatTimeAgoAt(c.UpdatedAt, now)
 			preview := c.Body
 			if len(preview) > 80 {
 				preview = preview[:80]
@@ -483,43 +464,15 @@ func printComments(comments []flow.GitHubComment) {
 			preview = oneLine(preview)
 			fmt.Printf("    @%s (%s): %s...\n", c.User.Login, timeAgo, preview)
 		}
-
-		count++
 	}
 }
 
-func getItemNumber(c flow.GitHubComment) int {
-	url := c.IssueURL
-	if url == "" {
-		url = c.PRURL
-	}
-	if url == "" {
-		return 0
-	}
-
-	// Extract number from URL
-	for i := len(url) - 1; i >= 0; i-- {
-		if url[i] == '/' {
-			num := 0
-			for _, ch := range url[i+1:] {
-				if ch >= '0' && ch <= '9' {
-					num = num*10 + int(ch-'0')
-				}
-			}
-			return num
-		}
-	}
-	return 0
-}
+// lineBreakReplacer flattens CR and LF to spaces in a single pass.
+var lineBreakReplacer = strings.NewReplacer("\r", " ", "\n", " ")
 
+// oneLine replaces line breaks in s with spaces. Strings without line breaks
+// are returned as-is, without copying. Unlike a rune-by-rune rebuild, this
+// leaves multi-byte UTF-8 characters intact.
 func oneLine(s string) string {
-	result := make([]byte, 0, len(s))
-	for _, c := range s {
-		if c == '\n' || c == '\r' {
-			result = append(result, ' ')
-		} else {
-			result = append(result, byte(c))
-		}
-	}
-	return string(result)
+	return lineBreakReplacer.Replace(s)
 }
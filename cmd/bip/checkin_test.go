@@ -0,0 +1,21 @@
+package main
+
+import "testing"
+
+func TestOneLine(t *testing.T) {
+	cases := []struct {
+		in   string
+		want string
+	}{
+		{"plain", "plain"},
+		{"a\nb", "a b"},
+		{"a\r\nb", "a  b"},
+		{"héllo\nwörld", "héllo wörld"},
+		{"", ""},
+	}
+	for _, c := range cases {
+		if got := oneLine(c.in); got != c.want {
+			t.Errorf("oneLine(%q) = %q, want %q", c.in, got, c.want)
+		}
+	}
+}
@@ -130,21 +130,14 @@ func runDigest(cmd *cobra.Command, args []string) {
 	fmt.Printf("Scanning %d repos...\n", len(repos))
 
 	// Fetch digest items from GitHub activity
-	items, err := fetchDigestItems(repos, since, digestVerbose)
+	// Closed issues are filtered out (merged PRs and open items are kept)
+	// before contributor lookup, so none are fetched for discarded items.
+	items, found, err := fetchDigestItems(repos, since, digestVerbose)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "error: building digest items: %v\n", err)
 		os.Exit(1)
 	}
-	// Filter out closed issues (keep merged PRs, open items)
-	var filtered []flow.DigestItem
-	for _, item := range items {
-		if item.State == "closed" && !item.IsPR {
-			continue
-		}
-		filtered = append(filtered, item)
-	}
-	fmt.Printf("Found %d items (%d after filtering closed issues)\n", len(items), len(filtered))
-	items = filtered
+	fmt.Printf("Found %d items (%d after filtering closed issues)\n", found, len(items))
 
 	// Generate summaries if verbose mode
 	if digestVerbose && len(items) > 0 {
@@ -197,81 +190,118 @@ func runDigest(cmd *cobra.Command, args []string) {
 }
 
 // fetchDigestItems fetches GitHub activity and transforms it into digest items.
-// For each repo, it fetches issues/PRs updated since the given time, collects
-// contributors (author, commenters, reviewers), and builds DigestItem structs.
+// For each repo, it fetches issues/PRs updated since the given time, drops
+// closed issues, collects contributors (author, commenters, reviewers) for
+// the rest with one batched query per repo, and builds DigestItem structs.
+// Repos are fetched concurrently; results and warnings are emitted in the
+// original repo/item order. Also returns the number of items found before
+// filtering.
 // Returns an error if all repo fetches fail (to distinguish from "no activity").
-func fetchDigestItems(repos []string, since time.Time, includeBody bool) ([]flow.DigestItem, error) {
-	var items []flow.DigestItem
-	var successfulFetches int
+func fetchDigestItems(repos []string, since time.Time, includeBody bool) ([]flow.DigestItem, int, error) {
+	type repoJob struct {
+		items    []flow.DigestItem
+		found    int
+		err      error
+		warnings []string
+	}
 
-	for _, repo := range repos {
-		allItems, err := flow.FetchIssues(repo, since)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Warning: failed to fetch %s: %v\n", repo, err)
+	jobs := make([]repoJob, len(repos))
+	flow.ForEachParallel(len(repos), flow.MaxRepoFetchConcurrency, func(i int) {
+		jobs[i].items, jobs[i].found, jobs[i].warnings, jobs[i].err = fetchRepoDigestItems(repos[i], since, includeBody)
+	})
+
+	var items []flow.DigestItem
+	var found, successfulFetches int
+	for i, job := range jobs {
+		if job.err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: failed to fetch %s: %v\n", repos[i], job.err)
 			continue // Skip repos with errors
 		}
 		successfulFetches++
+		for _, w := range job.warnings {
+			fmt.Fprintln(os.Stderr, w)
+		}
+		found += job.found
+		items = append(items, job.items...)
+	}
 
-		for _, item := range allItems {
-			// Collect contributors
-			contributors := make(map[string]bool)
-			contributors[item.User.Login] = true
-
-			commenters, err := flow.FetchItemCommenters(repo, item.Number)
-			if err != nil {
-				fmt.Fprintf(os.Stderr, "Warning: failed to fetch commenters for %s#%d: %v\n", repo, item.Number, err)
-			} else {
-				for _, c := range commenters {
-					contributors[c] = true
-				}
-			}
-
-			if item.IsPR {
-				reviewers, err := flow.FetchPRReviewers(repo, item.Number)
-				if err != nil {
-					fmt.Fprintf(os.Stderr, "Warning: failed to fetch reviewers for %s#%d: %v\n", repo, item.Number, err)
-				} else {
-					for _, r := range reviewers {
-						contributors[r] = true
-					}
-				}
-			}
+	// Fail if all repos failed to fetch (distinguishes from "no activity")
+	if successfulFetches == 0 && len(repos) > 0 {
+		return nil, 0, fmt.Errorf("failed to fetch activity from all %d repos", len(repos))
+	}
 
-			// Remove "unknown" and sort
-			delete(contributors, "unknown")
-			delete(contributors, "")
-			var sortedContributors []string
-			for c := range contributors {
-				sortedContributors = append(sortedContributors, c)
-			}
-			sort.Strings(sortedContributors)
-
-			digestItem := flow.DigestItem{
-				Ref:          fmt.Sprintf("%s#%d", repo, item.Number),
-				Number:       item.Number,
-				Title:        item.Title,
-				Author:       item.User.Login,
-				IsPR:         item.IsPR,
-				State:        item.State,
-				Merged:       item.IsPR && item.State == "closed",
-				HTMLURL:      item.HTMLURL,
-				CreatedAt:    item.CreatedAt.Format(time.RFC3339),
-				UpdatedAt:    item.UpdatedAt.Format(time.RFC3339),
-				Contributors: sortedContributors,
-			}
+	return items, found, nil
+}
 
-			if includeBody {
-				digestItem.Body = item.Body
-			}
+// fetchRepoDigestItems fetches one repo's activity, drops closed issues, and
+// looks up contributors for what remains. Returns the kept items and the
+// number fetched before filtering. A failed contributor lookup is returned
+// as a warning line, and items fall back to listing just their author.
+func fetchRepoDigestItems(repo string, since time.Time, includeBody bool) ([]flow.DigestItem, int, []string, error) {
+	allItems, err := flow.FetchIssues(repo, since)
+	if err != nil {
+		return nil, 0, nil, err
+	}
 
-			items = append(items, digestItem)
+	// Filter out closed issues (keep merged PRs, open items)
+	kept := make([]flow.GitHubItem, 0, len(allItems))
+	numbers := make([]int, 0, len(allItems))
+	for _, item := range allItems {
+		if item.State == "closed" && !item.IsPR {
+			continue
 		}
+		kept = append(kept, item)
+		numbers = append(numbers, item.Number)
 	}
 
-	// Fail if all repos failed to fetch (distinguishes from "no activity")
-	if successfulFetches == 0 && len(repos) > 0 {
-		return nil, fmt.Errorf("failed to fetch activity from all %d repos", len(repos))
+	var warnings []string
+	contributors, err := flow.FetchItemsContributors(repo, numbers)
+	if err != nil {
+		warnings = append(warnings, fmt.Sprintf("Warning: failed to fetch contributors for %s: %v", repo, err))
+	}
+
+	items := make([]flow.DigestItem, 0, len(kept))
+	for _, item := range kept {
+		items = append(items, buildDigestItem(repo, item, contributors[item.Number], includeBody))
+	}
+	return items, len(allItems), warnings, nil
+}
+
+// buildDigestItem builds a DigestItem from an item and the commenter and
+// reviewer logins collected for it. The author is always a contributor.
+func buildDigestItem(repo string, item flow.GitHubItem, logins []string, includeBody bool) flow.DigestItem {
+	contributors := make(map[string]bool, len(logins)+1)
+	contributors[item.User.Login] = true
+	for _, login := range logins {
+		contributors[login] = true
+	}
+
+	// Remove "unknown" and sort
+	delete(contributors, "unknown")
+	delete(contributors, "")
+	var sortedContributors []string
+	for c := range contributors {
+		sortedContributors = append(sortedContributors, c)
+	}
+	sort.Strings(sortedContributors)
+
+	digestItem := flow.DigestItem{
+		Ref:          fmt.Sprintf("%s#%d", repo, item.Number),
+		Number:       item.Number,
+		Title:        item.Title,
+		Author:       item.User.Login,
+		IsPR:         item.IsPR,
+		State:        item.State,
+		Merged:       item.IsPR && item.State == "closed",
+		HTMLURL:      item.HTMLURL,
+		CreatedAt:    item.CreatedAt.Format(time.RFC3339),
+		UpdatedAt:    item.UpdatedAt.Format(time.RFC3339),
+		Contributors: sortedContributors,
+	}
+
+	if includeBody {
+		digestItem.Body = item.Body
 	}
 
-	return items, nil
+	return digestItem
 }
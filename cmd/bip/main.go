@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"os"
 
+	"github.com/joho/godotenv"
 	"github.com/matsen/bipartite/internal/config"
 	"github.com/matsen/bipartite/internal/embedding"
 	"github.com/matsen/bipartite/internal/semantic"
@@ -20,6 +21,11 @@ var Version = "dev"
 var humanOutput bool
 
 func main() {
+	// Load .env file if present (S2_API_KEY, BIP_ASTA_API_KEY / ASTA_API_KEY,
+	// SLACK_BOT_TOKEN, webhooks). Loaded once here rather than from each
+	// command group's init().
+	_ = godotenv.Load()
+
 	if err := rootCmd.Execute(); err != nil {
 		// Print the error since we have SilenceErrors: true
 		// This ensures Cobra errors (like missing required flags) are visible
@@ -1,9 +1,6 @@
 package main
 
-import (
-	"github.com/joho/godotenv"
-	"github.com/spf13/cobra"
-)
+import "github.com/spf13/cobra"
 
 // Exit codes specific to s2 commands (from contracts/cli.md)
 const (
@@ -25,8 +22,5 @@ Use --human flag for human-readable output.`,
 }
 
 func init() {
-	// Load .env file if present (for S2_API_KEY)
-	_ = godotenv.Load()
-
 	rootCmd.AddCommand(s2Cmd)
 }
@@ -1,9 +1,6 @@
 package main
 
-import (
-	"github.com/joho/godotenv"
-	"github.com/spf13/cobra"
-)
+import "github.com/spf13/cobra"
 
 // Exit codes specific to slack commands (from spec.md)
 const (
@@ -31,8 +28,5 @@ Use --human flag for human-readable output.`,
 }
 
 func init() {
-	// Load .env file if present (for SLACK_BOT_TOKEN)
-	_ = godotenv.Load()
-
 	rootCmd.AddCommand(slackCmd)
 }
@@ -5,7 +5,6 @@ import (
 	"errors"
 	"fmt"
 	"os"
-	"os/exec"
 	"path/filepath"
 	"strings"
 	"time"
@@ -87,6 +86,14 @@ func runSpawn(cmd *cobra.Command, args []string) {
 		os.Exit(1)
 	}
 
+	// The PR prompt needs the current user. Look it up in the background so
+	// it overlaps the type detection and item fetch instead of following
+	// them. Issues and custom prompts never need it.
+	githubUser := func() string { return "" }
+	if ref.ItemType != "issue" && spawnPrompt == "" {
+		githubUser = prefetchGitHubUser()
+	}
+
 	// Resolve working directory. Three paths:
 	//   --dir override: skip the resolver entirely.
 	//   default:        early-resolve to validate the repo is in sources.yml
@@ -121,31 +128,23 @@ func runSpawn(cmd *cobra.Command, args []string) {
 		// repoPath is filled in below once we know the issue/PR context.
 	}
 
-	// Detect item type if not known from URL
-	itemType := ref.ItemType
-	if itemType == "" {
+	// Fetch data. When the URL didn't say whether this is an issue or a PR,
+	// the same query resolves the type.
+	if ref.ItemType == "" {
 		fmt.Fprintf(os.Stderr, "Detecting type for %s#%d...\n", ref.Repo, ref.Number)
-		var err error
-		itemType, err = flow.DetectItemType(ref.Repo, ref.Number)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Error: Could not find issue or PR #%d: %v\n", ref.Number, err)
-			os.Exit(1)
-		}
-		fmt.Fprintf(os.Stderr, "  → %s\n", itemType)
-	}
-
-	// Fetch data
-	var data *ItemData
-	var err error
-	if itemType == "pr" {
-		data, err = fetchPRData(ref.Repo, ref.Number)
-	} else {
-		data, err = fetchIssueData(ref.Repo, ref.Number)
 	}
+	data, itemType, err := fetchItemData(ref.Repo, ref.Number, ref.ItemType)
 	if err != nil {
-		fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+		if ref.ItemType == "" {
+			fmt.Fprintf(os.Stderr, "Error: Could not find issue or PR #%d: %v\n", ref.Number, err)
+		} else {
+			fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+		}
 		os.Exit(1)
 	}
+	if ref.ItemType == "" {
+		fmt.Fprintf(os.Stderr, "  → %s\n", itemType)
+	}
 
 	// Final path resolution: now we have a title (and so a slug) plus a
 	// confirmed item type. The resolver picks the canonical clone in clone
@@ -203,7 +202,7 @@ func runSpawn(cmd *cobra.Command, args []string) {
 	if spawnPrompt != "" {
 		prompt = buildCustomPrompt(ref.Repo, ref.Number, itemType, spawnPrompt)
 	} else if itemType == "pr" {
-		prompt = buildPRPrompt(ref.Repo, ref.Number, data)
+		prompt = buildPRPrompt(ref.Repo, ref.Number, data, githubUser())
 	} else {
 		prompt = buildIssuePrompt(ref.Repo, ref.Number, data)
 	}
@@ -225,6 +224,22 @@ func runSpawn(cmd *cobra.Command, args []string) {
 	fmt.Println(url)
 }
 
+// prefetchGitHubUser starts looking up the authenticated GitHub user in the
+// background and returns a function that waits for the login. A failed
+// lookup yields "", which buildPRPrompt treats as "not engaged".
+func prefetchGitHubUser() func() string {
+	done := make(chan struct{})
+	var user string
+	go func() {
+		defer close(done)
+		user, _ = flow.GetGitHubUser()
+	}()
+	return func() string {
+		<-done
+		return user
+	}
+}
+
 func runAdhocSpawn() {
 	windowName := spawnName
 	if windowName == "" {
@@ -289,7 +304,13 @@ type ItemData struct {
 	Author    string
 	Labels    []string
 	CreatedAt time.Time
-	Comments  []CommentData
+	Comments  []CommentData // the most recent maxCommentsDisplay comments
+	// CommentCount is the total number of comments, including those not
+	// fetched into Comments.
+	CommentCount int
+	// Commenters lists the authors of recent comments (up to 100), so
+	// engagement can be detected beyond the displayed comments.
+	Commenters []string
 	// PR-specific
 	Files     []FileData
 	Reviews   []ReviewData
@@ -316,104 +337,75 @@ type ReviewData struct {
 	Body   string
 }
 
-func fetchIssueData(repo string, number int) (*ItemData, error) {
-	cmd := exec.Command("gh", "issue", "view", fmt.Sprintf("%d", number),
-		"--repo", repo,
-		"--json", "title,body,state,comments,labels,author,createdAt")
-
-	output, err := cmd.Output()
-	if err != nil {
-		if exitErr, ok := err.(*exec.ExitError); ok {
-			return nil, fmt.Errorf("fetching issue: %s", string(exitErr.Stderr))
-		}
-		return nil, err
-	}
-
-	var raw struct {
-		Title     string                  `json:"title"`
-		Body      string                  `json:"body"`
-		State     string                  `json:"state"`
-		Author    struct{ Login string }  `json:"author"`
-		CreatedAt time.Time               `json:"createdAt"`
-		Labels    []struct{ Name string } `json:"labels"`
-		Comments  []struct {
+// maxCommentsDisplay is the number of most recent comments shown in a
+// spawn prompt.
+const maxCommentsDisplay = 10
+
+// spawnItemFields is the GraphQL selection shared by issues and PRs. Only
+// the comments that will be displayed are fetched with their bodies; the
+// commenters alias fetches just the logins of the last 100 for
+// userHasEngaged. Like the flow package's batch queries, labels are capped
+// at 100.
+var spawnItemFields = fmt.Sprintf(`title body state createdAt
+      author { login }
+      labels(first: 100) { nodes { name } }
+      comments(last: %d) { totalCount nodes { author { login } body createdAt } }
+      commenters: comments(last: 100) { nodes { author { login } } }`, maxCommentsDisplay)
+
+// spawnPRFields is the additional GraphQL selection for PRs.
+const spawnPRFields = `additions deletions
+      commits { totalCount }
+      files(first: 100) { nodes { path additions deletions } }
+      reviews(first: 100) { nodes { author { login } state body } }`
+
+// rawItem is the GraphQL shape of an issue or PR selected with
+// spawnItemFields (plus spawnPRFields for PRs).
+type rawItem struct {
+	Typename  string                 `json:"__typename"`
+	Title     string                 `json:"title"`
+	Body      string                 `json:"body"`
+	State     string                 `json:"state"`
+	Author    struct{ Login string } `json:"author"`
+	CreatedAt time.Time              `json:"createdAt"`
+	Labels    struct {
+		Nodes []struct{ Name string } `json:"nodes"`
+	} `json:"labels"`
+	Comments struct {
+		TotalCount int `json:"totalCount"`
+		Nodes      []struct {
 			Author    struct{ Login string } `json:"author"`
 			Body      string                 `json:"body"`
 			CreatedAt time.Time              `json:"createdAt"`
-		} `json:"comments"`
-	}
-
-	if err := json.Unmarshal(output, &raw); err != nil {
-		return nil, fmt.Errorf("parsing issue: %w", err)
-	}
-
-	data := &ItemData{
-		Title:     raw.Title,
-		Body:      raw.Body,
-		State:     raw.State,
-		Author:    raw.Author.Login,
-		CreatedAt: raw.CreatedAt,
-	}
-
-	for _, l := range raw.Labels {
-		data.Labels = append(data.Labels, l.Name)
-	}
-
-	for _, c := range raw.Comments {
-		data.Comments = append(data.Comments, CommentData{
-			Author:    c.Author.Login,
-			Body:      c.Body,
-			CreatedAt: c.CreatedAt,
-		})
-	}
-
-	return data, nil
-}
-
-func fetchPRData(repo string, number int) (*ItemData, error) {
-	cmd := exec.Command("gh", "pr", "view", fmt.Sprintf("%d", number),
-		"--repo", repo,
-		"--json", "title,body,state,comments,labels,author,createdAt,files,reviews,additions,deletions,commits")
-
-	output, err := cmd.Output()
-	if err != nil {
-		if exitErr, ok := err.(*exec.ExitError); ok {
-			return nil, fmt.Errorf("fetching PR: %s", string(exitErr.Stderr))
-		}
-		return nil, err
-	}
-
-	var raw struct {
-		Title     string                  `json:"title"`
-		Body      string                  `json:"body"`
-		State     string                  `json:"state"`
-		Author    struct{ Login string }  `json:"author"`
-		CreatedAt time.Time               `json:"createdAt"`
-		Labels    []struct{ Name string } `json:"labels"`
-		Comments  []struct {
-			Author    struct{ Login string } `json:"author"`
-			Body      string                 `json:"body"`
-			CreatedAt time.Time              `json:"createdAt"`
-		} `json:"comments"`
-		Files []struct {
+		} `json:"nodes"`
+	} `json:"comments"`
+	Commenters struct {
+		Nodes []struct {
+			Author struct{ Login string } `json:"author"`
+		} `json:"nodes"`
+	} `json:"commenters"`
+	Files struct {
+		Nodes []struct {
 			Path      string `json:"path"`
 			Additions int    `json:"additions"`
 			Deletions int    `json:"deletions"`
-		} `json:"files"`
-		Reviews []struct {
+		} `json:"nodes"`
+	} `json:"files"`
+	Reviews struct {
+		Nodes []struct {
 			Author struct{ Login string } `json:"author"`
 			State  string                 `json:"state"`
 			Body   string                 `json:"body"`
-		} `json:"reviews"`
-		Additions int        `json:"additions"`
-		Deletions int        `json:"deletions"`
-		Commits   []struct{} `json:"commits"`
-	}
-
-	if err := json.Unmarshal(output, &raw); err != nil {
-		return nil, fmt.Errorf("parsing PR: %w", err)
-	}
+		} `json:"nodes"`
+	} `json:"reviews"`
+	Additions int `json:"additions"`
+	Deletions int `json:"deletions"`
+	Commits   struct {
+		TotalCount int `json:"totalCount"`
+	} `json:"commits"`
+}
 
+// itemData converts a GraphQL issue or PR into ItemData.
+func (raw *rawItem) itemData() *ItemData {
 	data := &ItemData{
 		Title:     raw.Title,
 		Body:      raw.Body,
@@ -422,14 +414,16 @@ func fetchPRData(repo string, number int) (*ItemData, error) {
 		CreatedAt: raw.CreatedAt,
 		Additions: raw.Additions,
 		Deletions: raw.Deletions,
-		Commits:   len(raw.Commits),
+		Commits:   raw.Commits.TotalCount,
+
+		CommentCount: raw.Comments.TotalCount,
 	}
 
-	for _, l := range raw.Labels {
+	for _, l := range raw.Labels.Nodes {
 		data.Labels = append(data.Labels, l.Name)
 	}
 
-	for _, c := range raw.Comments {
+	for _, c := range raw.Comments.Nodes {
 		data.Comments = append(data.Comments, CommentData{
 			Author:    c.Author.Login,
 			Body:      c.Body,
@@ -437,7 +431,11 @@ func fetchPRData(repo string, number int) (*ItemData, error) {
 		})
 	}
 
-	for _, f := range raw.Files {
+	for _, c := range raw.Commenters.Nodes {
+		data.Commenters = append(data.Commenters, c.Author.Login)
+	}
+
+	for _, f := range raw.Files.Nodes {
 		data.Files = append(data.Files, FileData{
 			Path:      f.Path,
 			Additions: f.Additions,
@@ -445,7 +443,7 @@ func fetchPRData(repo string, number int) (*ItemData, error) {
 		})
 	}
 
-	for _, r := range raw.Reviews {
+	for _, r := range raw.Reviews.Nodes {
 		data.Reviews = append(data.Reviews, ReviewData{
 			Author: r.Author.Login,
 			State:  r.State,
@@ -453,9 +451,121 @@ func fetchPRData(repo string, number int) (*ItemData, error) {
 		})
 	}
 
-	return data, nil
+	return data
+}
+
+// fetchItemData fetches an issue or PR with one GraphQL query. itemType is
+// "issue", "pr", or "" when unknown, in which case issueOrPullRequest
+// resolves it in the same round trip; the resolved type is returned.
+// flow.GHGraphQL goes over the shared HTTP client when a token is
+// available, so this costs no gh subprocess.
+func fetchItemData(repo string, number int, itemType string) (*ItemData, string, error) {
+	parts := strings.SplitN(repo, "/", 2)
+	if len(parts) != 2 {
+		return nil, "", fmt.Errorf("invalid repo format %q, expected owner/name", repo)
+	}
+
+	var field, selection string
+	switch itemType {
+	case "pr":
+		field = "pullRequest"
+		selection = spawnItemFields + "\n      " + spawnPRFields
+	case "issue":
+		field = "issue"
+		selection = spawnItemFields
+	default:
+		field = "issueOrPullRequest"
+		selection = fmt.Sprintf(`... on Issue { %s }
+      ... on PullRequest { %s
+      %s }`, spawnItemFields, spawnItemFields, spawnPRFields)
+	}
+
+	query := fmt.Sprintf(`query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    item: %s(number: $number) {
+      __typename
+      %s
+    }
+  }
+}`, field, selection)
+
+	output, err := flow.GHGraphQL(query, map[string]interface{}{
+		"owner":  parts[0],
+		"name":   parts[1],
+		"number": number,
+	})
+	if err != nil {
+		return nil, "", fmt.Errorf("fetching %s#%d: %w", repo, number, err)
+	}
+
+	var resp struct {
+		Data struct {
+			Repository struct {
+				Item *rawItem `json:"item"`
+			} `json:"repository"`
+		} `json:"data"`
+	}
+	if err := json.Unmarshal(output, &resp); err != nil {
+		return nil, "", fmt.Errorf("parsing %s#%d: %w", repo, number, err)
+	}
+	raw := resp.Data.Repository.Item
+	if raw == nil {
+		return nil, "", fmt.Errorf("%s#%d not found", repo, number)
+	}
+
+	itemType = "issue"
+	if raw.Typename == "PullRequest" {
+		itemType = "pr"
+	}
+	return raw.itemData(), itemType, nil
 }
 
+// Task sections closing the spawn prompts. The shared instructions are
+// separate constants so the variants can't drift apart.
+const (
+	issueAnalysisOnly = "Do NOT make changes, close, or comment on the issue. Analysis only."
+
+	issueTaskWithComments = `Your task:
+1. Read the issue and all comments carefully
+2. Prepare the user to respond to the latest comment
+3. If anything is unclear, explore the codebase to understand it
+4. Summarize the discussion and suggest a response
+
+` + issueAnalysisOnly
+
+	issueTaskNoComments = `Your task:
+1. Read the issue carefully
+2. Summarize what the issue is asking for
+3. If anything is unclear from the issue itself, explore the codebase to understand it
+
+` + issueAnalysisOnly
+
+	prSummarizeStep = `2. Start by summarizing the PR description — surface any results, benchmarks,
+   or data the author included. Do not skip over this content.`
+
+	prCommentCheckStep = `6. Before presenting your final review, run /comment-check and paste your
+   draft review into the subagent so it can fact-check your claims against
+   the actual code. Fix any errors it finds before presenting to the user.
+
+Do NOT approve, merge, comment, or make changes. Analysis only.`
+
+	prTaskEngaged = `Your task:
+1. Read the PR and all comments/reviews carefully
+` + prSummarizeStep + `
+3. Prepare the user to respond to the latest activity
+4. If anything is unclear, explore the codebase to understand it
+5. Summarize the discussion and suggest a response
+` + prCommentCheckStep
+
+	prTaskReview = `Your task:
+1. Check @CLAUDE.md in this repo for PR review guidelines and follow them
+` + prSummarizeStep + `
+3. If no guidelines exist, review the PR for correctness, style, and potential issues
+4. Summarize what the PR does and any concerns
+5. Prepare a draft review
+` + prCommentCheckStep
+)
+
 func buildIssuePrompt(repo string, number int, data *ItemData) string {
 	body := data.Body
 	if body == "" {
@@ -468,25 +578,12 @@ func buildIssuePrompt(repo string, number int, data *ItemData) string {
 	}
 
 	relativeCreated := flow.FormatRelativeTime(data.CreatedAt)
-	commentsSection := formatComments(data.Comments)
+	commentsSection := formatComments(data.Comments, data.CommentCount)
 
 	hasComments := len(data.Comments) > 0
-	var taskSection string
+	taskSection := issueTaskNoComments
 	if hasComments {
-		taskSection = `Your task:
-1. Read the issue and all comments carefully
-2. Prepare the user to respond to the latest comment
-3. If anything is unclear, explore the codebase to understand it
-4. Summarize the discussion and suggest a response
-
-Do NOT make changes, close, or comment on the issue. Analysis only.`
-	} else {
-		taskSection = `Your task:
-1. Read the issue carefully
-2. Summarize what the issue is asking for
-3. If anything is unclear from the issue itself, explore the codebase to understand it
-
-Do NOT make changes, close, or comment on the issue. Analysis only.`
+		taskSection = issueTaskWithComments
 	}
 
 	return fmt.Sprintf(`GitHub issue: %s
@@ -507,7 +604,7 @@ Created: %s
 %s`, data.Title, repo, repo, number, data.State, data.Author, labelsStr, relativeCreated, body, commentsSection, taskSection)
 }
 
-func buildPRPrompt(repo string, number int, data *ItemData) string {
+func buildPRPrompt(repo string, number int, data *ItemData, githubUser string) string {
 	body := data.Body
 	if body == "" {
 		body = "(No description)"
@@ -519,41 +616,16 @@ func buildPRPrompt(repo string, number int, data *ItemData) string {
 	}
 
 	relativeCreated := flow.FormatRelativeTime(data.CreatedAt)
-	commentsSection := formatComments(data.Comments)
+	commentsSection := formatComments(data.Comments, data.CommentCount)
 	filesSection := formatFiles(data.Files)
 	reviewsSection := formatReviews(data.Reviews)
 
 	// Determine if user has engaged
-	githubUser, _ := flow.GetGitHubUser()
 	engaged := userHasEngaged(data, githubUser)
 
-	var taskSection string
+	taskSection := prTaskReview
 	if engaged {
-		taskSection = `Your task:
-1. Read the PR and all comments/reviews carefully
-2. Start by summarizing the PR description — surface any results, benchmarks,
-   or data the author included. Do not skip over this content.
-3. Prepare the user to respond to the latest activity
-4. If anything is unclear, explore the codebase to understand it
-5. Summarize the discussion and suggest a response
-6. Before presenting your final review, run /comment-check and paste your
-   draft review into the subagent so it can fact-check your claims against
-   the actual code. Fix any errors it finds before presenting to the user.
-
-Do NOT approve, merge, comment, or make changes. Analysis only.`
-	} else {
-		taskSection = `Your task:
-1. Check @CLAUDE.md in this repo for PR review guidelines and follow them
-2. Start by summarizing the PR description — surface any results, benchmarks,
-   or data the author included. Do not skip over this content.
-3. If no guidelines exist, review the PR for correctness, style, and potential issues
-4. Summarize what the PR does and any concerns
-5. Prepare a draft review
-6. Before presenting your final review, run /comment-check and paste your
-   draft review into the subagent so it can fact-check your claims against
-   the actual code. Fix any errors it finds before presenting to the user.
-
-Do NOT approve, merge, comment, or make changes. Analysis only.`
+		taskSection = prTaskEngaged
 	}
 
 	return fmt.Sprintf(`GitHub PR: %s
@@ -592,28 +664,35 @@ URL: %s
 %s`, itemLabel, repo, number, url, customPrompt)
 }
 
-func formatComments(comments []CommentData) string {
+// formatComments renders the most recent comments. total is the item's full
+// comment count, which may exceed len(comments) since only the last
+// maxCommentsDisplay are fetched.
+func formatComments(comments []CommentData, total int) string {
 	if len(comments) == 0 {
 		return "(No comments)"
 	}
 
-	limit := 10
+	limit := maxCommentsDisplay
 	display := comments
-	header := fmt.Sprintf("(%d total)", len(comments))
 	if len(comments) > limit {
 		display = comments[len(comments)-limit:]
-		header = fmt.Sprintf("(%d total, showing last %d)", len(comments), limit)
+	}
+	total = max(total, len(comments))
+	header := fmt.Sprintf("(%d total)", total)
+	if total > len(display) {
+		header = fmt.Sprintf("(%d total, showing last %d)", total, len(display))
 	}
 
+	now := time.Now()
 	var sb strings.Builder
-	sb.WriteString(fmt.Sprintf("## Comments %s\n", header))
+	fmt.Fprintf(&sb, "## Comments %s\n", header)
 	for _, c := range display {
 		author := c.Author
 		if author == "" {
 			author = "unknown"
 		}
-		relTime := flow.FormatRelativeTime(c.CreatedAt)
-		sb.WriteString(fmt.Sprintf("\n@%s (%s):\n%s\n", author, relTime, c.Body))
+		relTime := flow.FormatRelativeTimeAt(c.CreatedAt, now)
+		fmt.Fprintf(&sb, "\n@%s (%s):\n%s\n", author, relTime, c.Body)
 	}
 
 	return sb.String()
@@ -633,9 +712,9 @@ func formatFiles(files []FileData) string {
 	}
 
 	var sb strings.Builder
-	sb.WriteString(fmt.Sprintf("## Files Changed %s\n", header))
+	fmt.Fprintf(&sb, "## Files Changed %s\n", header)
 	for _, f := range display {
-		sb.WriteString(fmt.Sprintf("  %s (+%d/-%d)\n", f.Path, f.Additions, f.Deletions))
+		fmt.Fprintf(&sb, "  %s (+%d/-%d)\n", f.Path, f.Additions, f.Deletions)
 	}
 
 	return sb.String()
@@ -647,19 +726,19 @@ func formatReviews(reviews []ReviewData) string {
 	}
 
 	var sb strings.Builder
-	sb.WriteString(fmt.Sprintf("## Reviews (%d total)\n", len(reviews)))
+	fmt.Fprintf(&sb, "## Reviews (%d total)\n", len(reviews))
 	for _, r := range reviews {
 		author := r.Author
 		if author == "" {
 			author = "unknown"
 		}
-		sb.WriteString(fmt.Sprintf("\n@%s: %s\n", author, r.State))
-		if r.Body != "" {
-			body := r.Body
-			if len(body) > 200 {
-				body = body[:200] + "..."
-			}
-			sb.WriteString(fmt.Sprintf("  %s\n", body))
+		fmt.Fprintf(&sb, "\n@%s: %s\n", author, r.State)
+		// Long bodies are cut at 200 bytes. The "..." marker goes into the
+		// format string, so truncating doesn't build a copy of the body.
+		if len(r.Body) > 200 {
+			fmt.Fprintf(&sb, "  %s...\n", r.Body[:200])
+		} else if r.Body != "" {
+			fmt.Fprintf(&sb, "  %s\n", r.Body)
 		}
 	}
 
@@ -671,8 +750,8 @@ func userHasEngaged(data *ItemData, username string) bool {
 		return false
 	}
 
-	for _, c := range data.Comments {
-		if c.Author == username {
+	for _, login := range data.Commenters {
+		if login == username {
 			return true
 		}
 	}
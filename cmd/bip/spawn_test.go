@@ -1,6 +1,7 @@
 package main
 
 import (
+	"encoding/json"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -119,3 +120,69 @@ func mustRun(t *testing.T, dir, name string, args ...string) {
 		t.Fatalf("%s %s: %v\n%s", name, strings.Join(args, " "), err, out)
 	}
 }
+
+func TestRawItemData(t *testing.T) {
+	input := `{
+		"title": "Fix it", "body": "details", "state": "OPEN",
+		"createdAt": "2024-01-02T03:04:05Z",
+		"author": {"login": "alice"},
+		"labels": {"nodes": [{"name": "bug"}]},
+		"comments": {"totalCount": 12, "nodes": [{"author": {"login": "bob"}, "body": "+1", "createdAt": "2024-01-03T00:00:00Z"}]},
+		"commenters": {"nodes": [{"author": {"login": "dave"}}, {"author": {"login": "bob"}}]},
+		"files": {"nodes": [{"path": "main.go", "additions": 3, "deletions": 1}]},
+		"reviews": {"nodes": [{"author": {"login": "carol"}, "state": "APPROVED", "body": ""}]},
+		"additions": 3, "deletions": 1,
+		"commits": {"totalCount": 2}
+	}`
+	var raw rawItem
+	if err := json.Unmarshal([]byte(input), &raw); err != nil {
+		t.Fatal(err)
+	}
+	data := raw.itemData()
+
+	if data.Title != "Fix it" || data.Author != "alice" || data.State != "OPEN" {
+		t.Errorf("header fields = %+v", data)
+	}
+	if len(data.Labels) != 1 || data.Labels[0] != "bug" {
+		t.Errorf("Labels = %v, want [bug]", data.Labels)
+	}
+	if len(data.Comments) != 1 || data.Comments[0].Author != "bob" || data.CommentCount != 12 {
+		t.Errorf("Comments = %+v (count %d)", data.Comments, data.CommentCount)
+	}
+	if !userHasEngaged(data, "dave") || userHasEngaged(data, "alice") {
+		t.Errorf("userHasEngaged should match commenters only, Commenters = %v", data.Commenters)
+	}
+	if len(data.Files) != 1 || data.Files[0].Path != "main.go" {
+		t.Errorf("Files = %+v", data.Files)
+	}
+	if len(data.Reviews) != 1 || data.Reviews[0].State != "APPROVED" {
+		t.Errorf("Reviews = %+v", data.Reviews)
+	}
+	if data.Commits != 2 || data.Additions != 3 || data.Deletions != 1 {
+		t.Errorf("stats = +%d/-%d in %d, want +3/-1 in 2", data.Additions, data.Deletions, data.Commits)
+	}
+}
+
+func TestFormatCommentsHeader(t *testing.T) {
+	comments := []CommentData{{Author: "bob", Body: "+1"}}
+	if got := formatComments(comments, 1); !strings.HasPrefix(got, "## Comments (1 total)\n") {
+		t.Errorf("formatComments(1 of 1) = %q", got)
+	}
+	if got := formatComments(comments, 25); !strings.HasPrefix(got, "## Comments (25 total, showing last 1)\n") {
+		t.Errorf("formatComments(1 of 25) = %q", got)
+	}
+}
+
+func TestFormatReviewsTruncatesLongBody(t *testing.T) {
+	long := strings.Repeat("x", 250)
+	got := formatReviews([]ReviewData{
+		{Author: "carol", State: "COMMENTED", Body: long},
+		{Author: "dave", State: "APPROVED", Body: "lgtm"},
+	})
+	if !strings.Contains(got, "  "+long[:200]+"...\n") || strings.Contains(got, long[:201]) {
+		t.Errorf("long review body not truncated to 200 bytes:\n%s", got)
+	}
+	if !strings.Contains(got, "  lgtm\n") || strings.Contains(got, "lgtm...") {
+		t.Errorf("short review body should be shown as-is:\n%s", got)
+	}
+}
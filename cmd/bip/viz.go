@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bytes"
 	"fmt"
 	"os"
 
@@ -58,21 +59,22 @@ func runViz(cmd *cobra.Command, args []string) error {
 		return fmt.Errorf("building graph data: %w", err)
 	}
 
-	// Generate HTML (validates options internally)
+	// Generate HTML (validates options internally). The buffer is written
+	// out as-is rather than copied into a string and back into bytes.
 	opts := viz.HTMLOptions{
 		Layout:  vizLayout,
 		Offline: vizOffline,
 	}
-	html, err := viz.GenerateHTML(graph, opts)
-	if err != nil {
+	var html bytes.Buffer
+	if err := viz.WriteHTML(&html, graph, opts); err != nil {
 		return fmt.Errorf("generating HTML: %w", err)
 	}
 
 	// Output
 	if vizOutput == "" {
-		fmt.Print(html)
+		os.Stdout.Write(html.Bytes())
 	} else {
-		if err := os.WriteFile(vizOutput, []byte(html), 0644); err != nil {
+		if err := os.WriteFile(vizOutput, html.Bytes(), 0644); err != nil {
 			return fmt.Errorf("writing output file: %w", err)
 		}
 		if !humanOutput {
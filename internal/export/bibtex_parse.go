@@ -7,6 +7,13 @@ import (
 	"strings"
 )
 
+var (
+	// entryStartRegex matches an entry start: @type{key,
+	entryStartRegex = regexp.MustCompile(`@\w+\{([^,]+),`)
+	// doiFieldRegex matches a DOI field: doi = {value} or doi = "value"
+	doiFieldRegex = regexp.MustCompile(`(?i)^\s*doi\s*=\s*[\{"]([^\}"]+)[\}"]`)
+)
+
 // BibTeXIndex indexes existing BibTeX entries for deduplication.
 type BibTeXIndex struct {
 	// Keys maps citation keys to true for existence check
@@ -51,22 +58,19 @@ func ParseBibTeXFile(path string) (*BibTeXIndex, error) {
 	}
 	defer file.Close()
 
-	// Regex patterns
-	// Match entry start: @type{key,
-	entryStartRegex := regexp.MustCompile(`@\w+\{([^,]+),`)
-	// Match DOI field: doi = {value} or doi = "value"
-	doiFieldRegex := regexp.MustCompile(`(?i)^\s*doi\s*=\s*[\{"]([^\}"]+)[\}"]`)
-
 	scanner := bufio.NewScanner(file)
 	var currentKey string
 
 	for scanner.Scan() {
 		line := scanner.Text()
 
-		// Check for entry start
-		if matches := entryStartRegex.FindStringSubmatch(line); len(matches) > 1 {
-			currentKey = strings.TrimSpace(matches[1])
-			idx.Keys[currentKey] = true
+		// Check for entry start (most lines are fields, so skip the regex
+		// unless the line has an '@')
+		if strings.IndexByte(line, '@') >= 0 {
+			if matches := entryStartRegex.FindStringSubmatch(line); len(matches) > 1 {
+				currentKey = strings.TrimSpace(matches[1])
+				idx.Keys[currentKey] = true
+			}
 		}
 
 		// Check for DOI field
@@ -1,6 +1,8 @@
 package export
 
 import (
+	"os"
+	"path/filepath"
 	"strings"
 	"testing"
 
@@ -312,3 +314,39 @@ func TestToBibTeX_NoAuthors(t *testing.T) {
 		t.Errorf("ToBibTeX() should still include year, got:\n%s", got)
 	}
 }
+
+func TestParseBibTeXFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "refs.bib")
+	content := `@article{Smith2026-ab,
+  author = {Smith, John},
+  DOI = {https://doi.org/10.1234/ABC}
+}
+
+@misc{NoDOI2025,
+  title = {Email me at someone@example.com}
+}
+`
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	idx, err := ParseBibTeXFile(path)
+	if err != nil {
+		t.Fatalf("ParseBibTeXFile() error = %v", err)
+	}
+	if !idx.Keys["Smith2026-ab"] || !idx.Keys["NoDOI2025"] || len(idx.Keys) != 2 {
+		t.Errorf("Keys = %v, want Smith2026-ab and NoDOI2025", idx.Keys)
+	}
+	if got := idx.DOIs["10.1234/abc"]; got != "Smith2026-ab" {
+		t.Errorf("DOIs[10.1234/abc] = %q, want Smith2026-ab", got)
+	}
+	if !idx.HasEntry("Other", "10.1234/ABC") {
+		t.Error("HasEntry() should match by normalized DOI")
+	}
+
+	// A missing file yields an empty index.
+	idx, err = ParseBibTeXFile(filepath.Join(t.TempDir(), "missing.bib"))
+	if err != nil || len(idx.Keys) != 0 {
+		t.Errorf("ParseBibTeXFile(missing) = %v, %v; want empty index", idx.Keys, err)
+	}
+}
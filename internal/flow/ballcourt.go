@@ -4,9 +4,9 @@ import (
 	"fmt"
 	"os"
 	"regexp"
-	"sort"
 	"strconv"
 	"strings"
+	"sync"
 )
 
 // CommentsToActions converts GitHubComments to ItemActions.
@@ -19,7 +19,7 @@ import (
 func CommentsToActions(comments []GitHubComment) []ItemAction {
 	actions := make([]ItemAction, 0, len(comments))
 	for _, c := range comments {
-		itemNum := getCommentItemNumber(c)
+		itemNum := CommentItemNumber(c)
 		if itemNum == 0 {
 			// Skip malformed comment (no item URL)
 			continue
@@ -50,22 +50,39 @@ func CommentsToActions(comments []GitHubComment) []ItemAction {
 //
 // Actions include comments, close events, and merge events.
 func BallInMyCourt(item GitHubItem, actions []ItemAction, githubUser string) bool {
-	author := item.User.Login
-	isMyItem := author == githubUser
-
-	// Filter actions to only those on this item
-	itemActions := filterActionsForItem(actions, item.Number)
+	last, ok := lastActionFor(actions, item.Number)
+	return ballInCourtGivenLast(item, last, ok, githubUser)
+}
 
-	if len(itemActions) == 0 {
+// ballInCourtGivenLast applies the BallInMyCourt truth table given the most
+// recent action on the item (ok is false when the item has no actions).
+func ballInCourtGivenLast(item GitHubItem, last ItemAction, ok bool, githubUser string) bool {
+	if !ok {
 		// No actions: show their items (need review), hide mine (waiting for feedback)
-		return !isMyItem
+		return item.User.Login != githubUser
 	}
 
 	// Has actions: show if last actor is not me (they're waiting for my response)
-	sortActionsByTime(itemActions)
-	lastActor := itemActions[len(itemActions)-1].Actor
+	return last.Actor != "" && last.Actor != githubUser
+}
+
+// LastActions maps an item number to the most recent action on that item.
+// Build it once with IndexLastActions so per-item ball-in-court checks are
+// a map lookup instead of a scan and sort over every action.
+type LastActions map[int]ItemAction
 
-	return lastActor != "" && lastActor != githubUser
+// IndexLastActions builds a LastActions index in a single pass.
+// When two actions on an item share a timestamp, the later one in the slice
+// wins.
+func IndexLastActions(actions []ItemAction) LastActions {
+	index := make(LastActions)
+	for _, a := range actions {
+		if prev, ok := index[a.ItemNumber]; ok && a.Timestamp.Before(prev.Timestamp) {
+			continue
+		}
+		index[a.ItemNumber] = a
+	}
+	return index
 }
 
 // Involvement captures all the signals that indicate a user has some connection
@@ -113,24 +130,42 @@ func HasInvolvement(item GitHubItem, user string, inv Involvement) bool {
 // @mentions inside these don't count as real mentions.
 var fencedCodeBlock = regexp.MustCompile("(?s)(```.*?```|~~~.*?~~~)")
 
-// inlineCode matches single-backtick inline code spans.
+// inlineCode matches single-backtick inline code spans. It runs after
+// fencedCodeBlock: in a single alternation, an unmatched inline backtick
+// before a fence would pair with the fence's first backtick and expose the
+// block's contents.
 var inlineCode = regexp.MustCompile("`[^`]*`")
 
+// mentionPatterns caches the compiled @mention regexp per user; the same
+// handful of logins are checked against every item body.
+var mentionPatterns sync.Map // map[string]*regexp.Regexp
+
+// mentionPattern returns the compiled @mention regexp for user.
+func mentionPattern(user string) *regexp.Regexp {
+	if re, ok := mentionPatterns.Load(user); ok {
+		return re.(*regexp.Regexp)
+	}
+	// Reject handle continuations in [A-Za-z0-9_-] so "@alice" doesn't match
+	// inside "@alice-bot" (a different GitHub user) or "@alice_bot" (underscore
+	// isn't valid in GitHub handles but rejecting it is defense-in-depth). The
+	// leading char class similarly prevents substring matches like "foo@alice"
+	// (email-like patterns).
+	re := regexp.MustCompile(`(?i)(^|[^A-Za-z0-9_-])@` + regexp.QuoteMeta(user) + `($|[^A-Za-z0-9_-])`)
+	actual, _ := mentionPatterns.LoadOrStore(user, re)
+	return actual.(*regexp.Regexp)
+}
+
 // bodyMentionsUser reports whether body contains an @user mention outside code
 // spans or fenced code blocks.
 func bodyMentionsUser(body, user string) bool {
-	if body == "" || user == "" {
+	// Most bodies mention nobody; without an '@' there is nothing to find,
+	// so skip stripping code spans and running the regex.
+	if user == "" || strings.IndexByte(body, '@') < 0 {
 		return false
 	}
 	stripped := fencedCodeBlock.ReplaceAllString(body, "")
 	stripped = inlineCode.ReplaceAllString(stripped, "")
-	// Reject handle continuations in [A-Za-z0-9_-] so "@alice" doesn't match
-	// inside "@alice-bot" (a different GitHub user) or "@alice_bot" (underscore
-	// isn't valid in GitHub handles but rejecting it is defense-in-depth). The
-	// leading char class similarly prevents substring matches like "foo@alice"
-	// (email-like patterns).
-	pattern := regexp.MustCompile(`(?i)(^|[^A-Za-z0-9_-])@` + regexp.QuoteMeta(user) + `($|[^A-Za-z0-9_-])`)
-	return pattern.MatchString(stripped)
+	return mentionPattern(user).MatchString(stripped)
 }
 
 // BallInMyCourtStrict is like BallInMyCourt but adds an involvement check for
@@ -142,48 +177,73 @@ func bodyMentionsUser(body, user string) bool {
 // window, the last actor decides; if it's my item with no actions, it's not
 // ball-in-court.
 func BallInMyCourtStrict(item GitHubItem, actions []ItemAction, githubUser string, inv Involvement) bool {
-	author := item.User.Login
-	isMyItem := author == githubUser
-
-	itemActions := filterActionsForItem(actions, item.Number)
+	last, ok := lastActionFor(actions, item.Number)
+	return ballInCourtStrictGivenLast(item, last, ok, githubUser, inv)
+}
 
-	if len(itemActions) == 0 {
-		if isMyItem {
-			return false
-		}
+// ballInCourtStrictGivenLast is the BallInMyCourtStrict counterpart of
+// ballInCourtGivenLast.
+func ballInCourtStrictGivenLast(item GitHubItem, last ItemAction, ok bool, githubUser string, inv Involvement) bool {
+	if !ok && item.User.Login != githubUser {
 		return HasInvolvement(item, githubUser, inv)
 	}
-
-	sortActionsByTime(itemActions)
-	lastActor := itemActions[len(itemActions)-1].Actor
-
-	return lastActor != "" && lastActor != githubUser
+	return ballInCourtGivenLast(item, last, ok, githubUser)
 }
 
 // FilterByBallInCourtStrict applies BallInMyCourtStrict to each item.
 func FilterByBallInCourtStrict(items []GitHubItem, actions []ItemAction, githubUser string, inv Involvement) []GitHubItem {
+	return IndexLastActions(actions).FilterStrict(items, githubUser, inv)
+}
+
+// FilterStrict is FilterByBallInCourtStrict against a prebuilt index, for
+// callers that filter several item lists against the same actions.
+func (index LastActions) FilterStrict(items []GitHubItem, githubUser string, inv Involvement) []GitHubItem {
 	var filtered []GitHubItem
 	for _, item := range items {
-		if BallInMyCourtStrict(item, actions, githubUser, inv) {
+		last, ok := index[item.Number]
+		if ballInCourtStrictGivenLast(item, last, ok, githubUser, inv) {
 			filtered = append(filtered, item)
 		}
 	}
 	return filtered
 }
 
-// filterActionsForItem returns actions that belong to the given item number.
-func filterActionsForItem(actions []ItemAction, itemNumber int) []ItemAction {
-	var filtered []ItemAction
+// lastActionFor returns the most recent action on itemNumber, if any.
+// Ties are broken the same way as IndexLastActions.
+func lastActionFor(actions []ItemAction, itemNumber int) (ItemAction, bool) {
+	var last ItemAction
+	found := false
 	for _, a := range actions {
-		if a.ItemNumber == itemNumber {
-			filtered = append(filtered, a)
+		if a.ItemNumber != itemNumber {
+			continue
+		}
+		if found && a.Timestamp.Before(last.Timestamp) {
+			continue
 		}
+		last, found = a, true
 	}
-	return filtered
+	return last, found
+}
+
+// CommentItemNumber returns the issue/PR number a comment belongs to, or 0 if
+// the comment has no item URL. It uses the ItemNumber cached at fetch time
+// when present, so repeated filtering passes don't re-parse the URL.
+func CommentItemNumber(comment GitHubComment) int {
+	if comment.ItemNumber != 0 {
+		return comment.ItemNumber
+	}
+	return parseCommentItemNumber(comment)
 }
 
-// getCommentItemNumber extracts the issue/PR number a comment belongs to.
-func getCommentItemNumber(comment GitHubComment) int {
+// annotateCommentItemNumbers fills in ItemNumber on each comment in place.
+func annotateCommentItemNumbers(comments []GitHubComment) {
+	for i := range comments {
+		comments[i].ItemNumber = parseCommentItemNumber(comments[i])
+	}
+}
+
+// parseCommentItemNumber extracts the issue/PR number from a comment's URL.
+func parseCommentItemNumber(comment GitHubComment) int {
 	url := comment.IssueURL
 	if url == "" {
 		url = comment.PRURL
@@ -192,28 +252,25 @@ func getCommentItemNumber(comment GitHubComment) int {
 		return 0
 	}
 
-	// Extract number from URL like ".../issues/123"
-	parts := strings.Split(url, "/")
-	if len(parts) == 0 {
-		return 0
-	}
-	numStr := parts[len(parts)-1]
+	// Extract number from URL like ".../issues/123". Only the last segment
+	// matters, so slice after the final '/' rather than splitting them all.
+	numStr := url[strings.LastIndexByte(url, '/')+1:]
 	n, _ := strconv.Atoi(numStr)
 	return n
 }
 
-// sortActionsByTime sorts actions by timestamp.
-func sortActionsByTime(actions []ItemAction) {
-	sort.Slice(actions, func(i, j int) bool {
-		return actions[i].Timestamp.Before(actions[j].Timestamp)
-	})
-}
-
 // FilterByBallInCourt filters items to only those where ball is in user's court.
 func FilterByBallInCourt(items []GitHubItem, actions []ItemAction, githubUser string) []GitHubItem {
+	return IndexLastActions(actions).Filter(items, githubUser)
+}
+
+// Filter is FilterByBallInCourt against a prebuilt index, for callers that
+// filter several item lists against the same actions.
+func (index LastActions) Filter(items []GitHubItem, githubUser string) []GitHubItem {
 	var filtered []GitHubItem
 	for _, item := range items {
-		if BallInMyCourt(item, actions, githubUser) {
+		last, ok := index[item.Number]
+		if ballInCourtGivenLast(item, last, ok, githubUser) {
 			filtered = append(filtered, item)
 		}
 	}
@@ -235,13 +292,28 @@ func EnrichActionsWithLastComments(repo string, items []GitHubItem, existingActi
 		hasActions[a.ItemNumber] = true
 	}
 
-	var enriched []ItemAction
+	var pending []GitHubItem
 	for _, item := range items {
-		if hasActions[item.Number] {
-			continue
+		if !hasActions[item.Number] {
+			pending = append(pending, item)
 		}
+	}
+
+	// Fetch last comments in parallel; each gh call is an independent
+	// subprocess round trip.
+	type lastComment struct {
+		comment *GitHubComment
+		err     error
+	}
+	results := make([]lastComment, len(pending))
+	ForEachParallel(len(pending), maxItemFetchConcurrency, func(i int) {
+		comment, err := FetchLastItemComment(repo, pending[i].Number)
+		results[i] = lastComment{comment, err}
+	})
 
-		comment, err := FetchLastItemComment(repo, item.Number)
+	var enriched []ItemAction
+	for i, item := range pending {
+		comment, err := results[i].comment, results[i].err
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "Warning: failed to fetch last comment for %s#%d: %v\n", repo, item.Number, err)
 			continue
@@ -253,7 +325,7 @@ func EnrichActionsWithLastComments(repo string, items []GitHubItem, existingActi
 			continue
 		}
 
-		itemNum := getCommentItemNumber(*comment)
+		itemNum := CommentItemNumber(*comment)
 		if itemNum == 0 {
 			// Should not occur unless the API returns a comment without issue_url;
 			// fall back to the known item number.
@@ -269,18 +341,45 @@ func EnrichActionsWithLastComments(repo string, items []GitHubItem, existingActi
 	return enriched
 }
 
-// FilterCommentsByItems returns comments that belong to the given items.
-func FilterCommentsByItems(comments []GitHubComment, items []GitHubItem) []GitHubComment {
-	itemNumbers := make(map[int]bool)
-	for _, item := range items {
-		itemNumbers[item.Number] = true
+// FilterCommentsByItems returns comments that belong to any of the given
+// item lists. Passing issues and PRs as separate lists avoids concatenating
+// them just to build the membership set.
+func FilterCommentsByItems(comments []GitHubComment, itemLists ...[]GitHubItem) []GitHubComment {
+	n := 0
+	for _, items := range itemLists {
+		n += len(items)
+	}
+	if n == 0 {
+		return nil
+	}
+
+	itemNumbers := make(map[int]struct{}, n)
+	for _, items := range itemLists {
+		for _, item := range items {
+			itemNumbers[item.Number] = struct{}{}
+		}
 	}
 
 	var filtered []GitHubComment
 	for _, c := range comments {
-		if itemNumbers[getCommentItemNumber(c)] {
+		if _, ok := itemNumbers[CommentItemNumber(c)]; ok {
 			filtered = append(filtered, c)
 		}
 	}
 	return filtered
 }
+
+// GroupCommentsByItem buckets comments by issue/PR number in a single pass.
+// order lists item numbers in first-seen order so callers can iterate the
+// buckets deterministically.
+func GroupCommentsByItem(comments []GitHubComment) (order []int, byItem map[int][]GitHubComment) {
+	byItem = make(map[int][]GitHubComment)
+	for _, c := range comments {
+		num := CommentItemNumber(c)
+		if _, seen := byItem[num]; !seen {
+			order = append(order, num)
+		}
+		byItem[num] = append(byItem[num], c)
+	}
+	return order, byItem
+}
@@ -1,6 +1,7 @@
 package flow
 
 import (
+	"fmt"
 	"testing"
 	"time"
 )
@@ -77,6 +78,13 @@ func TestBallInMyCourt(t *testing.T) {
 			expected:   false,
 			reason:     "waiting for their reply",
 		},
+		{
+			name:       "their item, unknown actor acted last",
+			itemAuthor: them,
+			actions:    []ItemAction{makeAction("", 1)},
+			expected:   false,
+			reason:     "an empty actor is never treated as someone waiting on me",
+		},
 	}
 
 	for _, tt := range tests {
@@ -637,6 +645,9 @@ func TestBodyMentionsUser(t *testing.T) {
 		{"inside fenced block", "```\n@alice\n```", "alice", false},
 		{"inside inline code", "use `@alice` as handle", "alice", false},
 		{"mixed: mention + code", "`@alice` means @alice", "alice", true},
+		{"inside tilde fence", "~~~\n@alice\n~~~", "alice", false},
+		{"fence then inline then mention", "```\nx\n``` and `y` cc @alice", "alice", true},
+		{"stray backtick before fence", "it's a ` and then\n```\n@alice\n```", "alice", false},
 		{"empty body", "", "alice", false},
 		{"empty user", "hey @alice", "", false},
 	}
@@ -716,3 +727,163 @@ func TestFilterByBallInCourt(t *testing.T) {
 		t.Errorf("Expected item #1, got #%d", filtered[0].Number)
 	}
 }
+
+func TestIndexLastActions(t *testing.T) {
+	base := time.Date(2026, 1, 20, 12, 0, 0, 0, time.UTC)
+
+	actions := []ItemAction{
+		{ItemNumber: 1, Actor: "alice", Timestamp: base.Add(2 * time.Hour)},
+		{ItemNumber: 1, Actor: "bob", Timestamp: base}, // older, out of order
+		{ItemNumber: 2, Actor: "carol", Timestamp: base},
+		{ItemNumber: 2, Actor: "dave", Timestamp: base}, // tie: later entry wins
+	}
+
+	index := IndexLastActions(actions)
+
+	if len(index) != 2 {
+		t.Fatalf("len(index) = %d, want 2", len(index))
+	}
+	if got := index[1].Actor; got != "alice" {
+		t.Errorf("index[1].Actor = %q, want %q", got, "alice")
+	}
+	if got := index[2].Actor; got != "dave" {
+		t.Errorf("index[2].Actor = %q, want %q", got, "dave")
+	}
+	if _, ok := index[3]; ok {
+		t.Error("index[3] should be absent")
+	}
+}
+
+func TestFilterByBallInCourtMatchesPerItem(t *testing.T) {
+	me := "me"
+	base := time.Date(2026, 1, 20, 12, 0, 0, 0, time.UTC)
+
+	var items []GitHubItem
+	var actions []ItemAction
+	for n := 1; n <= 20; n++ {
+		author := "them"
+		if n%3 == 0 {
+			author = me
+		}
+		items = append(items, GitHubItem{Number: n, User: GitHubUser{Login: author}})
+		// Interleave actors and timestamps so the last actor is not simply
+		// the last entry in the slice.
+		for k := 0; k < n%4; k++ {
+			actor := me
+			if (n+k)%2 == 0 {
+				actor = "them"
+			}
+			actions = append(actions, ItemAction{
+				ItemNumber: n,
+				Actor:      actor,
+				Timestamp:  base.Add(time.Duration((n*7+k*5)%11) * time.Minute),
+			})
+		}
+	}
+
+	inv := Involvement{Commenters: map[int][]string{4: {me}, 8: {me}}}
+
+	var want, wantStrict []int
+	for _, item := range items {
+		if BallInMyCourt(item, actions, me) {
+			want = append(want, item.Number)
+		}
+		if BallInMyCourtStrict(item, actions, me, inv) {
+			wantStrict = append(wantStrict, item.Number)
+		}
+	}
+
+	var got, gotStrict []int
+	for _, item := range FilterByBallInCourt(items, actions, me) {
+		got = append(got, item.Number)
+	}
+	for _, item := range FilterByBallInCourtStrict(items, actions, me, inv) {
+		gotStrict = append(gotStrict, item.Number)
+	}
+
+	if fmt.Sprint(got) != fmt.Sprint(want) {
+		t.Errorf("FilterByBallInCourt = %v, per-item BallInMyCourt = %v", got, want)
+	}
+	if fmt.Sprint(gotStrict) != fmt.Sprint(wantStrict) {
+		t.Errorf("FilterByBallInCourtStrict = %v, per-item BallInMyCourtStrict = %v", gotStrict, wantStrict)
+	}
+}
+
+func TestCommentItemNumber(t *testing.T) {
+	tests := []struct {
+		name     string
+		comment  GitHubComment
+		expected int
+	}{
+		{"issue URL", GitHubComment{IssueURL: "https://api.github.com/repos/org/repo/issues/42"}, 42},
+		{"PR URL fallback", GitHubComment{PRURL: "https://api.github.com/repos/org/repo/pulls/7"}, 7},
+		{"no URL", GitHubComment{}, 0},
+		{"bare number", GitHubComment{IssueURL: "12"}, 12},
+		{"trailing slash", GitHubComment{IssueURL: "https://api.github.com/repos/org/repo/issues/"}, 0},
+		{"cached number wins", GitHubComment{IssueURL: "https://api.github.com/repos/org/repo/issues/42", ItemNumber: 9}, 9},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := CommentItemNumber(tt.comment); got != tt.expected {
+				t.Errorf("CommentItemNumber() = %d, want %d", got, tt.expected)
+			}
+		})
+	}
+
+	t.Run("annotate fills cache", func(t *testing.T) {
+		comments := []GitHubComment{
+			{IssueURL: "https://api.github.com/repos/org/repo/issues/3"},
+			{},
+		}
+		annotateCommentItemNumbers(comments)
+		if comments[0].ItemNumber != 3 || comments[1].ItemNumber != 0 {
+			t.Errorf("ItemNumber = %d, %d; want 3, 0", comments[0].ItemNumber, comments[1].ItemNumber)
+		}
+	})
+}
+
+func TestGroupCommentsByItem(t *testing.T) {
+	comments := []GitHubComment{
+		{ID: 1, ItemNumber: 5},
+		{ID: 2, ItemNumber: 3},
+		{ID: 3, ItemNumber: 5},
+		{ID: 4, IssueURL: "https://api.github.com/repos/org/repo/issues/3"},
+	}
+
+	order, byItem := GroupCommentsByItem(comments)
+
+	if fmt.Sprint(order) != "[5 3]" {
+		t.Errorf("order = %v, want [5 3]", order)
+	}
+	if len(byItem[5]) != 2 || byItem[5][0].ID != 1 || byItem[5][1].ID != 3 {
+		t.Errorf("byItem[5] = %+v, want comments 1 and 3 in order", byItem[5])
+	}
+	if len(byItem[3]) != 2 || byItem[3][1].ID != 4 {
+		t.Errorf("byItem[3] = %+v, want comments 2 and 4 in order", byItem[3])
+	}
+}
+
+func TestFilterCommentsByItems(t *testing.T) {
+	comments := []GitHubComment{
+		{ID: 1, ItemNumber: 1},
+		{ID: 2, ItemNumber: 2},
+		{ID: 3, ItemNumber: 3},
+		{ID: 4, ItemNumber: 2},
+	}
+	issues := []GitHubItem{{Number: 1}}
+	prs := []GitHubItem{{Number: 2}}
+
+	got := FilterCommentsByItems(comments, issues, prs)
+	var ids []int64
+	for _, c := range got {
+		ids = append(ids, c.ID)
+	}
+	if fmt.Sprint(ids) != "[1 2 4]" {
+		t.Errorf("FilterCommentsByItems() IDs = %v, want [1 2 4]", ids)
+	}
+
+	if got := FilterCommentsByItems(comments); got != nil {
+		t.Errorf("FilterCommentsByItems() with no items = %v, want nil", got)
+	}
+}
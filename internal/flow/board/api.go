@@ -4,9 +4,9 @@ package board
 import (
 	"encoding/json"
 	"fmt"
-	"os/exec"
 	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/matsen/bipartite/internal/flow"
 )
@@ -20,20 +20,37 @@ func ParseBoardKey(boardKey string) (owner, number string, err error) {
 	return parts[0], parts[1], nil
 }
 
-// FetchProjectID fetches the GraphQL node ID for a project.
+var (
+	projectIDMu    sync.Mutex
+	projectIDCache = map[string]string{} // "owner/number" -> project node ID
+)
+
+// FetchProjectID fetches the GraphQL node ID for a project. Project IDs
+// never change, so they are memoized per process.
 func FetchProjectID(owner, projectNum string) (string, error) {
+	key := owner + "/" + projectNum
+	projectIDMu.Lock()
+	cached, ok := projectIDCache[key]
+	projectIDMu.Unlock()
+	if ok {
+		return cached, nil
+	}
+
 	// Convert project number to int for GraphQL
 	projectNumInt, err := strconv.Atoi(projectNum)
 	if err != nil {
 		return "", fmt.Errorf("invalid project number %q: %w", projectNum, err)
 	}
 
-	// Try org first
+	// repositoryOwner resolves both orgs and users, so one query covers
+	// either owner type without probing the organization first.
 	query := `
 	query($owner: String!, $number: Int!) {
-	  organization(login: $owner) {
-	    projectV2(number: $number) {
-	      id
+	  repositoryOwner(login: $owner) {
+	    ... on ProjectV2Owner {
+	      projectV2(number: $number) {
+	        id
+	      }
 	    }
 	  }
 	}`
@@ -42,57 +59,37 @@ func FetchProjectID(owner, projectNum string) (string, error) {
 		"owner":  owner,
 		"number": projectNumInt,
 	})
-	if err == nil {
-		var result struct {
-			Data struct {
-				Organization struct {
-					ProjectV2 struct {
-						ID string `json:"id"`
-					} `json:"projectV2"`
-				} `json:"organization"`
-			} `json:"data"`
-		}
-		if json.Unmarshal(data, &result) == nil && result.Data.Organization.ProjectV2.ID != "" {
-			return result.Data.Organization.ProjectV2.ID, nil
-		}
-	}
-
-	// Try user
-	query = `
-	query($owner: String!, $number: Int!) {
-	  user(login: $owner) {
-	    projectV2(number: $number) {
-	      id
-	    }
-	  }
-	}`
-
-	data, err = flow.GHGraphQL(query, map[string]interface{}{
-		"owner":  owner,
-		"number": projectNumInt,
-	})
 	if err != nil {
 		return "", err
 	}
 
 	var result struct {
 		Data struct {
-			User struct {
+			RepositoryOwner struct {
 				ProjectV2 struct {
 					ID string `json:"id"`
 				} `json:"projectV2"`
-			} `json:"user"`
+			} `json:"repositoryOwner"`
 		} `json:"data"`
 	}
 	if err := json.Unmarshal(data, &result); err != nil {
 		return "", err
 	}
 
-	if result.Data.User.ProjectV2.ID == "" {
+	projectID := result.Data.RepositoryOwner.ProjectV2.ID
+	if projectID == "" {
 		return "", fmt.Errorf("project not found: %s/%s", owner, projectNum)
 	}
 
-	return result.Data.User.ProjectV2.ID, nil
+	rememberProjectID(owner, projectNum, projectID)
+	return projectID, nil
+}
+
+// rememberProjectID records a resolved project ID for FetchProjectID.
+func rememberProjectID(owner, projectNum, projectID string) {
+	projectIDMu.Lock()
+	projectIDCache[owner+"/"+projectNum] = projectID
+	projectIDMu.Unlock()
 }
 
 // BoardMetadata contains cached board information.
@@ -105,12 +102,9 @@ type BoardMetadata struct {
 	ItemIDs       map[string]string `json:"item_ids"`       // "repo#number" -> item ID
 }
 
-// FetchProjectFields fetches field IDs and status options for a project.
-func FetchProjectFields(projectID string) (*BoardMetadata, error) {
-	query := `
-	query($projectId: ID!) {
-	  node(id: $projectId) {
-	    ... on ProjectV2 {
+// projectFieldsSelection selects a ProjectV2's fields and single-select
+// options, shared by FetchProjectFields and fetchBoardMetadata.
+const projectFieldsSelection = `
 	      fields(first: 20) {
 	        nodes {
 	          ... on ProjectV2Field {
@@ -126,7 +120,50 @@ func FetchProjectFields(projectID string) (*BoardMetadata, error) {
 	            }
 	          }
 	        }
-	      }
+	      }`
+
+// projectFields is the decoded form of projectFieldsSelection.
+type projectFields struct {
+	Nodes []struct {
+		ID      string `json:"id"`
+		Name    string `json:"name"`
+		Options []struct {
+			ID   string `json:"id"`
+			Name string `json:"name"`
+		} `json:"options,omitempty"`
+	} `json:"nodes"`
+}
+
+// newBoardMetadata builds BoardMetadata from a project's fields.
+func newBoardMetadata(projectID string, fields projectFields) *BoardMetadata {
+	meta := &BoardMetadata{
+		ProjectID:     projectID,
+		FieldIDs:      make(map[string]string),
+		StatusOptions: make(map[string]string),
+		ItemIDs:       make(map[string]string),
+	}
+
+	for _, field := range fields.Nodes {
+		if field.Name != "" && field.ID != "" {
+			meta.FieldIDs[field.Name] = field.ID
+		}
+
+		if field.Name == "Status" && len(field.Options) > 0 {
+			for _, opt := range field.Options {
+				meta.StatusOptions[strings.ToLower(opt.Name)] = opt.ID
+			}
+		}
+	}
+
+	return meta
+}
+
+// FetchProjectFields fetches field IDs and status options for a project.
+func FetchProjectFields(projectID string) (*BoardMetadata, error) {
+	query := `
+	query($projectId: ID!) {
+	  node(id: $projectId) {
+	    ... on ProjectV2 {` + projectFieldsSelection + `
 	    }
 	  }
 	}`
@@ -139,16 +176,7 @@ func FetchProjectFields(projectID string) (*BoardMetadata, error) {
 	var result struct {
 		Data struct {
 			Node struct {
-				Fields struct {
-					Nodes []struct {
-						ID      string `json:"id"`
-						Name    string `json:"name"`
-						Options []struct {
-							ID   string `json:"id"`
-							Name string `json:"name"`
-						} `json:"options,omitempty"`
-					} `json:"nodes"`
-				} `json:"fields"`
+				Fields projectFields `json:"fields"`
 			} `json:"node"`
 		} `json:"data"`
 	}
@@ -157,100 +185,374 @@ func FetchProjectFields(projectID string) (*BoardMetadata, error) {
 		return nil, err
 	}
 
-	meta := &BoardMetadata{
-		ProjectID:     projectID,
-		FieldIDs:      make(map[string]string),
-		StatusOptions: make(map[string]string),
-		ItemIDs:       make(map[string]string),
+	return newBoardMetadata(projectID, result.Data.Node.Fields), nil
+}
+
+// fetchBoardMetadata fetches a project's ID and fields in one query. Going
+// through repositoryOwner resolves org- and user-owned projects alike, so
+// there is no org-then-user probe and no separate fields round-trip.
+func fetchBoardMetadata(owner, projectNum string) (*BoardMetadata, error) {
+	projectNumInt, err := strconv.Atoi(projectNum)
+	if err != nil {
+		return nil, fmt.Errorf("invalid project number %q: %w", projectNum, err)
 	}
 
-	for _, field := range result.Data.Node.Fields.Nodes {
-		if field.Name != "" && field.ID != "" {
-			meta.FieldIDs[field.Name] = field.ID
-		}
+	query := `
+	query($owner: String!, $number: Int!) {
+	  repositoryOwner(login: $owner) {
+	    ... on ProjectV2Owner {
+	      projectV2(number: $number) {
+	        id` + projectFieldsSelection + `
+	      }
+	    }
+	  }
+	}`
 
-		if field.Name == "Status" && len(field.Options) > 0 {
-			for _, opt := range field.Options {
-				meta.StatusOptions[strings.ToLower(opt.Name)] = opt.ID
-			}
-		}
+	data, err := flow.GHGraphQL(query, map[string]interface{}{
+		"owner":  owner,
+		"number": projectNumInt,
+	})
+	if err != nil {
+		return nil, err
 	}
 
+	var result struct {
+		Data struct {
+			RepositoryOwner struct {
+				ProjectV2 struct {
+					ID     string        `json:"id"`
+					Fields projectFields `json:"fields"`
+				} `json:"projectV2"`
+			} `json:"repositoryOwner"`
+		} `json:"data"`
+	}
+	if err := json.Unmarshal(data, &result); err != nil {
+		return nil, err
+	}
+
+	project := result.Data.RepositoryOwner.ProjectV2
+	if project.ID == "" {
+		return nil, fmt.Errorf("project not found: %s/%s", owner, projectNum)
+	}
+
+	rememberProjectID(owner, projectNum, project.ID)
+	meta := newBoardMetadata(project.ID, project.Fields)
+	meta.Owner = owner
+	meta.ProjectNum = projectNum
 	return meta, nil
 }
 
-// ListBoardItems lists all items on a board using gh CLI.
-func ListBoardItems(boardKey string) ([]flow.BoardItem, error) {
+var (
+	boardMetaMu    sync.Mutex
+	boardMetaCache = map[string]*BoardMetadata{}
+)
+
+// boardMetadata returns the project ID, field IDs, and status options for a
+// board, fetched once per process so repeated mutations against the same
+// board don't re-query them each time. Errors are not cached. Callers must
+// not modify the returned metadata.
+func boardMetadata(boardKey string) (*BoardMetadata, error) {
+	boardMetaMu.Lock()
+	cached, ok := boardMetaCache[boardKey]
+	boardMetaMu.Unlock()
+	if ok {
+		return cached, nil
+	}
+
 	owner, projectNum, err := ParseBoardKey(boardKey)
 	if err != nil {
 		return nil, err
 	}
 
-	cmd := exec.Command("gh", "project", "item-list", projectNum, "--owner", owner, "--format", "json")
-	output, err := cmd.Output()
+	meta, err := fetchBoardMetadata(owner, projectNum)
 	if err != nil {
-		if exitErr, ok := err.(*exec.ExitError); ok {
-			return nil, fmt.Errorf("listing board items: %s", string(exitErr.Stderr))
-		}
 		return nil, err
 	}
 
-	var result struct {
-		Items []struct {
-			ID      string `json:"id"`
-			Title   string `json:"title"`
-			Status  string `json:"status"`
-			Content struct {
-				Type       string `json:"type"`
-				Repository string `json:"repository"`
-				Number     int    `json:"number"`
-			} `json:"content"`
-		} `json:"items"`
-	}
-
-	if err := json.Unmarshal(output, &result); err != nil {
-		return nil, err
+	boardMetaMu.Lock()
+	boardMetaCache[boardKey] = meta
+	boardMetaMu.Unlock()
+	return meta, nil
+}
+
+// prefetchBoardMetadata starts resolving a board's metadata in the
+// background and returns a function that waits for the result. Mutations
+// use it to overlap the metadata query with their other lookups.
+func prefetchBoardMetadata(boardKey string) func() (*BoardMetadata, error) {
+	done := make(chan struct{})
+	var meta *BoardMetadata
+	var err error
+	go func() {
+		defer close(done)
+		meta, err = boardMetadata(boardKey)
+	}()
+	return func() (*BoardMetadata, error) {
+		<-done
+		return meta, err
 	}
+}
+
+// boardItemsPageSize is the number of items requested per page (the
+// GraphQL maximum).
+const boardItemsPageSize = 100
+
+// maxBoardFetchConcurrency limits how many boards are paged or retried in
+// parallel by ListBoardsItems.
+const maxBoardFetchConcurrency = 8
+
+// boardItemsSelection selects one page of a ProjectV2's items, requesting
+// only the fields BoardItem carries. It expects a $cursor variable.
+var boardItemsSelection = fmt.Sprintf(`
+	      items(first: %d, after: $cursor) {
+	        pageInfo {
+	          hasNextPage
+	          endCursor
+	        }
+	        nodes {
+	          id
+	          status: fieldValueByName(name: "Status") {
+	            ... on ProjectV2ItemFieldSingleSelectValue {
+	              name
+	            }
+	          }
+	          content {
+	            __typename
+	            ... on Issue {
+	              title
+	              number
+	              repository { nameWithOwner }
+	            }
+	            ... on PullRequest {
+	              title
+	              number
+	              repository { nameWithOwner }
+	            }
+	            ... on DraftIssue {
+	              title
+	            }
+	          }
+	        }
+	      }`, boardItemsPageSize)
+
+// boardItemsPage is the decoded form of boardItemsSelection.
+type boardItemsPage struct {
+	PageInfo struct {
+		HasNextPage bool   `json:"hasNextPage"`
+		EndCursor   string `json:"endCursor"`
+	} `json:"pageInfo"`
+	Nodes []struct {
+		ID     string `json:"id"`
+		Status struct {
+			Name string `json:"name"`
+		} `json:"status"`
+		Content struct {
+			Typename   string `json:"__typename"`
+			Title      string `json:"title"`
+			Number     int    `json:"number"`
+			Repository struct {
+				NameWithOwner string `json:"nameWithOwner"`
+			} `json:"repository"`
+		} `json:"content"`
+	} `json:"nodes"`
+}
 
-	var items []flow.BoardItem
-	for _, item := range result.Items {
+// appendItems appends the page's items to items.
+func (p *boardItemsPage) appendItems(items []flow.BoardItem) []flow.BoardItem {
+	for _, item := range p.Nodes {
 		items = append(items, flow.BoardItem{
 			ID:     item.ID,
-			Title:  item.Title,
-			Status: item.Status,
+			Title:  item.Content.Title,
+			Status: item.Status.Name,
 			Content: flow.BoardContent{
-				Type:       item.Content.Type,
-				Repository: item.Content.Repository,
+				Type:       item.Content.Typename,
+				Repository: item.Content.Repository.NameWithOwner,
 				Number:     item.Content.Number,
 			},
 		})
 	}
+	return items
+}
 
-	return items, nil
+// nextCursor returns the cursor for the following page, or "" on the last.
+func (p *boardItemsPage) nextCursor() string {
+	if !p.PageInfo.HasNextPage {
+		return ""
+	}
+	return p.PageInfo.EndCursor
 }
 
-// AddIssueToBoard adds an issue to a board.
-func AddIssueToBoard(boardKey string, issueNumber int, repo string, status string) error {
-	owner, projectNum, err := ParseBoardKey(boardKey)
+// ListBoardItems lists all items on a board, paging through the project's
+// items over GraphQL.
+func ListBoardItems(boardKey string) ([]flow.BoardItem, error) {
+	items, errs := ListBoardsItems([]string{boardKey})
+	return items[0], errs[0]
+}
+
+// ListBoardsItems lists the items on several boards. The first page of
+// every board comes back from a single GraphQL query (one aliased
+// repositoryOwner lookup per board), so listing n boards costs one
+// round-trip plus one per extra page rather than n item-list calls.
+// Results and errors are indexed like boardKeys. If the combined query
+// fails, each board is retried on its own so one bad board doesn't hide
+// the others.
+func ListBoardsItems(boardKeys []string) ([][]flow.BoardItem, []error) {
+	items := make([][]flow.BoardItem, len(boardKeys))
+	errs := make([]error, len(boardKeys))
+	owners := make([]string, len(boardKeys))
+	projectNums := make([]string, len(boardKeys))
+
+	var aliases strings.Builder
+	var params []string
+	variables := make(map[string]interface{}, 2*len(boardKeys))
+	for i, key := range boardKeys {
+		owner, projectNum, err := ParseBoardKey(key)
+		if err != nil {
+			errs[i] = err
+			continue
+		}
+		number, err := strconv.Atoi(projectNum)
+		if err != nil {
+			errs[i] = fmt.Errorf("invalid project number %q: %w", projectNum, err)
+			continue
+		}
+		owners[i], projectNums[i] = owner, projectNum
+		fmt.Fprintf(&aliases, `
+	  b%d: repositoryOwner(login: $owner%d) {
+	    ... on ProjectV2Owner {
+	      projectV2(number: $number%d) {
+	        id`, i, i, i)
+		aliases.WriteString(boardItemsSelection)
+		aliases.WriteString(`
+	      }
+	    }
+	  }`)
+		params = append(params, fmt.Sprintf("$owner%d: String!, $number%d: Int!", i, i))
+		variables[fmt.Sprintf("owner%d", i)] = owner
+		variables[fmt.Sprintf("number%d", i)] = number
+	}
+	if len(params) == 0 {
+		return items, errs
+	}
+
+	query := "query(" + strings.Join(params, ", ") + ", $cursor: String) {" + aliases.String() + "\n\t}"
+	data, err := flow.GHGraphQL(query, variables)
 	if err != nil {
-		return err
+		if len(params) == 1 {
+			for i := range boardKeys {
+				if errs[i] == nil {
+					errs[i] = fmt.Errorf("listing board items: %w", err)
+				}
+			}
+			return items, errs
+		}
+		forEachBoard(boardKeys, errs, func(i int) {
+			one, oneErrs := ListBoardsItems([]string{boardKeys[i]})
+			items[i], errs[i] = one[0], oneErrs[0]
+		})
+		return items, errs
 	}
 
-	issueURL := fmt.Sprintf("https://github.com/%s/issues/%d", repo, issueNumber)
+	var result struct {
+		Data map[string]*struct {
+			ProjectV2 *struct {
+				ID    string         `json:"id"`
+				Items boardItemsPage `json:"items"`
+			} `json:"projectV2"`
+		} `json:"data"`
+	}
+	if err := json.Unmarshal(data, &result); err != nil {
+		for i := range boardKeys {
+			if errs[i] == nil {
+				errs[i] = err
+			}
+		}
+		return items, errs
+	}
 
-	// Try gh project item-add first
-	cmd := exec.Command("gh", "project", "item-add", projectNum, "--owner", owner, "--url", issueURL)
-	output, err := cmd.Output()
+	for i, key := range boardKeys {
+		if errs[i] != nil {
+			continue
+		}
+		owner := result.Data[fmt.Sprintf("b%d", i)]
+		if owner == nil || owner.ProjectV2 == nil || owner.ProjectV2.ID == "" {
+			errs[i] = fmt.Errorf("project not found: %s", key)
+			continue
+		}
+		rememberProjectID(owners[i], projectNums[i], owner.ProjectV2.ID)
+		items[i] = owner.ProjectV2.Items.appendItems(nil)
+	}
 
-	var itemID string
-	if err == nil && len(output) > 0 {
-		itemID = strings.TrimSpace(string(output))
-	} else {
-		// Fall back to GraphQL
-		itemID, err = addIssueViaGraphQL(boardKey, issueNumber, repo)
+	// Boards with more than one page continue independently.
+	forEachBoard(boardKeys, errs, func(i int) {
+		project := result.Data[fmt.Sprintf("b%d", i)].ProjectV2
+		if cursor := project.Items.nextCursor(); cursor != "" {
+			items[i], errs[i] = fetchBoardItemPages(project.ID, cursor, items[i])
+		}
+	})
+
+	return items, errs
+}
+
+// forEachBoard runs fn for every board index whose err is still nil, up to
+// maxBoardFetchConcurrency at a time. fn may only write to index i of
+// shared slices.
+func forEachBoard(boardKeys []string, errs []error, fn func(i int)) {
+	flow.ForEachParallel(len(boardKeys), maxBoardFetchConcurrency, func(i int) {
+		if errs[i] == nil {
+			fn(i)
+		}
+	})
+}
+
+// fetchBoardItemPages pages through a project's items starting after
+// cursor, appending them to items.
+func fetchBoardItemPages(projectID, cursor string, items []flow.BoardItem) ([]flow.BoardItem, error) {
+	query := `
+	query($projectId: ID!, $cursor: String) {
+	  node(id: $projectId) {
+	    ... on ProjectV2 {` + boardItemsSelection + `
+	    }
+	  }
+	}`
+
+	variables := map[string]interface{}{"projectId": projectID}
+	for cursor != "" {
+		variables["cursor"] = cursor
+		data, err := flow.GHGraphQL(query, variables)
 		if err != nil {
-			return err
+			return nil, fmt.Errorf("listing board items: %w", err)
+		}
+
+		var result struct {
+			Data struct {
+				Node struct {
+					Items boardItemsPage `json:"items"`
+				} `json:"node"`
+			} `json:"data"`
+		}
+		if err := json.Unmarshal(data, &result); err != nil {
+			return nil, err
 		}
+
+		page := &result.Data.Node.Items
+		items = page.appendItems(items)
+		cursor = page.nextCursor()
+	}
+
+	return items, nil
+}
+
+// AddIssueToBoard adds an issue to a board.
+func AddIssueToBoard(boardKey string, issueNumber int, repo string, status string) error {
+	if _, _, err := ParseBoardKey(boardKey); err != nil {
+		return err
+	}
+
+	// The addProjectV2ItemById mutation returns the new item's ID directly,
+	// unlike gh project item-add, whose plain-text output isn't an item ID.
+	itemID, err := addIssueViaGraphQL(boardKey, issueNumber, repo)
+	if err != nil {
+		return err
 	}
 
 	// Apply status if specified
@@ -263,22 +565,17 @@ func AddIssueToBoard(boardKey string, issueNumber int, repo string, status strin
 
 // addIssueViaGraphQL adds an issue to a board using GraphQL.
 func addIssueViaGraphQL(boardKey string, issueNumber int, repo string) (string, error) {
-	owner, projectNum, err := ParseBoardKey(boardKey)
-	if err != nil {
-		return "", err
-	}
-
-	// Get project ID
-	projectID, err := FetchProjectID(owner, projectNum)
-	if err != nil {
-		return "", err
-	}
+	waitMeta := prefetchBoardMetadata(boardKey)
 
 	// Get issue node ID
 	issueNodeID, err := flow.GetIssueNodeID(repo, issueNumber)
+	meta, metaErr := waitMeta()
 	if err != nil {
 		return "", err
 	}
+	if metaErr != nil {
+		return "", metaErr
+	}
 
 	mutation := `
 	mutation($projectId: ID!, $contentId: ID!) {
@@ -290,7 +587,7 @@ func addIssueViaGraphQL(boardKey string, issueNumber int, repo string) (string,
 	}`
 
 	data, err := flow.GHGraphQL(mutation, map[string]interface{}{
-		"projectId": projectID,
+		"projectId": meta.ProjectID,
 		"contentId": issueNodeID,
 	})
 	if err != nil {
@@ -311,22 +608,14 @@ func addIssueViaGraphQL(boardKey string, issueNumber int, repo string) (string,
 		return "", err
 	}
 
-	return result.Data.AddProjectV2ItemById.Item.ID, nil
+	itemID := result.Data.AddProjectV2ItemById.Item.ID
+	setIndexedItemID(boardKey, itemRef{repo, issueNumber}, itemID)
+	return itemID, nil
 }
 
 // SetItemStatus sets the status of a board item.
 func SetItemStatus(boardKey, itemID, status string) error {
-	owner, projectNum, err := ParseBoardKey(boardKey)
-	if err != nil {
-		return err
-	}
-
-	projectID, err := FetchProjectID(owner, projectNum)
-	if err != nil {
-		return err
-	}
-
-	meta, err := FetchProjectFields(projectID)
+	meta, err := boardMetadata(boardKey)
 	if err != nil {
 		return err
 	}
@@ -360,7 +649,7 @@ func SetItemStatus(boardKey, itemID, status string) error {
 	}`
 
 	_, err = flow.GHGraphQL(mutation, map[string]interface{}{
-		"projectId": projectID,
+		"projectId": meta.ProjectID,
 		"itemId":    itemID,
 		"fieldId":   statusFieldID,
 		"optionId":  optionID,
@@ -369,47 +658,111 @@ func SetItemStatus(boardKey, itemID, status string) error {
 	return err
 }
 
-// GetItemID finds the board item ID for an issue.
-func GetItemID(boardKey string, issueNumber int, repo string) (string, error) {
+var (
+	itemIndexMu    sync.Mutex
+	itemIndexCache = map[string]map[itemRef]string{} // board key -> item ref -> item ID
+)
+
+// itemRef is the item index key for an issue or PR. A struct key is
+// hashed directly, with no per-lookup string formatting.
+type itemRef struct {
+	repo   string
+	number int
+}
+
+// boardItemIndex returns the item ref -> item ID index for a board,
+// built from one ListBoardItems call per process. Callers must hold
+// itemIndexMu while reading the returned map.
+func boardItemIndex(boardKey string) (map[itemRef]string, error) {
+	itemIndexMu.Lock()
+	index, ok := itemIndexCache[boardKey]
+	itemIndexMu.Unlock()
+	if ok {
+		return index, nil
+	}
+
 	items, err := ListBoardItems(boardKey)
 	if err != nil {
-		return "", err
+		return nil, err
 	}
 
+	index = make(map[itemRef]string, len(items))
 	for _, item := range items {
-		if item.Content.Repository == repo && item.Content.Number == issueNumber {
-			return item.ID, nil
+		if item.Content.Repository != "" {
+			index[itemRef{item.Content.Repository, item.Content.Number}] = item.ID
 		}
 	}
 
-	return "", fmt.Errorf("issue #%d not found on board", issueNumber)
+	itemIndexMu.Lock()
+	defer itemIndexMu.Unlock()
+	if existing, ok := itemIndexCache[boardKey]; ok {
+		// Another goroutine built it first; keep its updates.
+		return existing, nil
+	}
+	itemIndexCache[boardKey] = index
+	return index, nil
+}
+
+// setIndexedItemID records (or, with an empty itemID, forgets) an item in a
+// board's index, if the index has been built.
+func setIndexedItemID(boardKey string, ref itemRef, itemID string) {
+	itemIndexMu.Lock()
+	defer itemIndexMu.Unlock()
+	index, ok := itemIndexCache[boardKey]
+	if !ok {
+		return
+	}
+	if itemID == "" {
+		delete(index, ref)
+	} else {
+		index[ref] = itemID
+	}
+}
+
+// GetItemID finds the board item ID for an issue. The board is listed once
+// per process; later lookups are served from an index.
+func GetItemID(boardKey string, issueNumber int, repo string) (string, error) {
+	index, err := boardItemIndex(boardKey)
+	if err != nil {
+		return "", err
+	}
+
+	itemIndexMu.Lock()
+	itemID, ok := index[itemRef{repo, issueNumber}]
+	itemIndexMu.Unlock()
+	if !ok {
+		return "", fmt.Errorf("issue #%d not found on board", issueNumber)
+	}
+
+	return itemID, nil
 }
 
 // MoveItem moves a board item to a new status.
 func MoveItem(boardKey string, issueNumber int, status, repo string) error {
+	// Warm the metadata SetItemStatus needs while the item is looked up.
+	waitMeta := prefetchBoardMetadata(boardKey)
 	itemID, err := GetItemID(boardKey, issueNumber, repo)
+	_, metaErr := waitMeta()
 	if err != nil {
 		return err
 	}
+	if metaErr != nil {
+		return metaErr
+	}
 
 	return SetItemStatus(boardKey, itemID, status)
 }
 
 // RemoveIssueFromBoard removes an issue from a board.
 func RemoveIssueFromBoard(boardKey string, issueNumber int, repo string) error {
-	owner, projectNum, err := ParseBoardKey(boardKey)
-	if err != nil {
-		return err
-	}
-
+	waitMeta := prefetchBoardMetadata(boardKey)
 	itemID, err := GetItemID(boardKey, issueNumber, repo)
+	meta, metaErr := waitMeta()
 	if err != nil {
 		return err
 	}
-
-	projectID, err := FetchProjectID(owner, projectNum)
-	if err != nil {
-		return err
+	if metaErr != nil {
+		return metaErr
 	}
 
 	mutation := `
@@ -420,9 +773,13 @@ func RemoveIssueFromBoard(boardKey string, issueNumber int, repo string) error {
 	}`
 
 	_, err = flow.GHGraphQL(mutation, map[string]interface{}{
-		"projectId": projectID,
+		"projectId": meta.ProjectID,
 		"itemId":    itemID,
 	})
+	if err != nil {
+		return err
+	}
 
-	return err
+	setIndexedItemID(boardKey, itemRef{repo, issueNumber}, "")
+	return nil
 }
@@ -71,3 +71,28 @@ func TestParseBoardKey(t *testing.T) {
 		})
 	}
 }
+
+func TestItemIndex(t *testing.T) {
+	itemIndexCache["o/1"] = map[itemRef]string{{"o/r", 1}: "ITEM_1"}
+	t.Cleanup(func() { delete(itemIndexCache, "o/1") })
+
+	if got, err := GetItemID("o/1", 1, "o/r"); err != nil || got != "ITEM_1" {
+		t.Errorf("GetItemID() = %q, %v; want ITEM_1", got, err)
+	}
+
+	setIndexedItemID("o/1", itemRef{"o/r", 2}, "ITEM_2")
+	if got, err := GetItemID("o/1", 2, "o/r"); err != nil || got != "ITEM_2" {
+		t.Errorf("GetItemID() after add = %q, %v; want ITEM_2", got, err)
+	}
+
+	setIndexedItemID("o/1", itemRef{"o/r", 1}, "")
+	if _, err := GetItemID("o/1", 1, "o/r"); err == nil {
+		t.Error("GetItemID() after remove: expected error, got nil")
+	}
+
+	// Boards whose index hasn't been built are left alone.
+	setIndexedItemID("o/2", itemRef{"o/r", 1}, "ITEM_X")
+	if _, ok := itemIndexCache["o/2"]; ok {
+		t.Error("setIndexedItemID() created an index for an unlisted board")
+	}
+}
@@ -179,7 +179,7 @@ func LoadAllRepos(nexusPath string) ([]string, error) {
 		return nil, err
 	}
 
-	var repos []string
+	repos := make([]string, 0, len(sources.Code)+len(sources.Writing))
 	for _, entry := range sources.Code {
 		repos = append(repos, entry.Repo)
 	}
@@ -211,7 +211,7 @@ func LoadReposByCategory(nexusPath, category string) ([]string, error) {
 		return nil, fmt.Errorf("unknown category: %s", category)
 	}
 
-	var repos []string
+	repos := make([]string, 0, len(entries))
 	for _, entry := range entries {
 		repos = append(repos, entry.Repo)
 	}
@@ -392,12 +392,9 @@ func parseConfigFile(path string) (*Config, error) {
 }
 
 // ExtractRepoName extracts the repository name from an org/repo string.
+// The result is a substring of orgRepo, so no allocation is needed.
 func ExtractRepoName(orgRepo string) string {
-	parts := strings.Split(orgRepo, "/")
-	if len(parts) > 1 {
-		return parts[len(parts)-1]
-	}
-	return orgRepo
+	return orgRepo[strings.LastIndexByte(orgRepo, '/')+1:]
 }
 
 // GetRepoLocalPath maps a GitHub repo (org/name) to its canonical clone
@@ -73,6 +73,7 @@ func TestExtractRepoName(t *testing.T) {
 		{"matsengrp/dasm2-experiments", "dasm2-experiments"},
 		{"org/repo-v2", "repo-v2"},
 		{"repo", "repo"},
+		{"org/sub/repo", "repo"},
 	}
 
 	for _, tt := range tests {
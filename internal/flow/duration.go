@@ -29,6 +29,13 @@ func parsePositiveInt(s string) (int, error) {
 	return n, nil
 }
 
+// durationUnits maps a ParseDuration unit suffix to its length.
+var durationUnits = map[byte]time.Duration{
+	'h': time.Hour,
+	'd': 24 * time.Hour,
+	'w': 7 * 24 * time.Hour,
+}
+
 // ParseDuration parses a duration string like "2d", "12h", "1w".
 // Supported units: d (days), h (hours), w (weeks).
 func ParseDuration(s string) (time.Duration, error) {
@@ -45,16 +52,11 @@ func ParseDuration(s string) (time.Duration, error) {
 		return 0, ErrInvalidDuration
 	}
 
-	switch unit {
-	case 'd':
-		return time.Duration(value) * 24 * time.Hour, nil
-	case 'h':
-		return time.Duration(value) * time.Hour, nil
-	case 'w':
-		return time.Duration(value) * 7 * 24 * time.Hour, nil
-	default:
+	multiplier, ok := durationUnits[unit]
+	if !ok {
 		return 0, fmt.Errorf("%w: %c", ErrUnknownUnit, unit)
 	}
+	return time.Duration(value) * multiplier, nil
 }
 
 // FormatDateRange formats a date range for display (e.g., "Jan 12-18").
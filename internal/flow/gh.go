@@ -1,20 +1,48 @@
 package flow
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
 	"os/exec"
+	"strconv"
 	"strings"
 	"time"
 )
 
-// githubAPIPageSize is the default page size for GitHub API requests.
-const githubAPIPageSize = 100
+const (
+	// githubAPIPageSize is the default page size for GitHub API requests.
+	githubAPIPageSize = 100
 
-// GHAPI calls the GitHub API via the gh CLI.
-// Returns the parsed JSON response.
+	// MaxRepoFetchConcurrency limits how many repos are fetched in parallel.
+	// A worker runs its repo's calls one after another, so this is also the
+	// cap on concurrent gh invocations.
+	MaxRepoFetchConcurrency = 8
+
+	// maxItemFetchConcurrency limits parallel per-item gh calls.
+	maxItemFetchConcurrency = 8
+
+	// graphQLBatchSize caps how many item aliases go into one
+	// batched GraphQL query, keeping each query well under node limits.
+	graphQLBatchSize = 50
+)
+
+// GHAPI calls the GitHub API, following pagination. It uses the pooled
+// direct HTTP client when a github.com token is available and otherwise
+// shells out to the gh CLI. Returns the parsed JSON response.
 func GHAPI(endpoint string) (json.RawMessage, error) {
+	if c := directGitHubClient(); c != nil {
+		data, err := c.get(endpoint, true)
+		if err != nil {
+			return nil, fmt.Errorf("gh api %s: %w", endpoint, err)
+		}
+		if len(data) == 0 {
+			return json.RawMessage("[]"), nil
+		}
+		return data, nil
+	}
+
 	cmd := exec.Command("gh", "api", endpoint, "--paginate")
 	output, err := cmd.Output()
 	if err != nil {
@@ -35,37 +63,47 @@ func GHAPI(endpoint string) (json.RawMessage, error) {
 }
 
 // normalizeJSONLines handles paginated gh api output.
-// The --paginate flag can output multiple JSON arrays on separate lines.
+// The --paginate flag can output multiple JSON arrays back to back (usually
+// one per line). Single documents are detected with json.Valid, which doesn't
+// build a throwaway value; otherwise the output is decoded as a stream of
+// documents, so pages need not be newline-separated.
 func normalizeJSONLines(data []byte) json.RawMessage {
-	// Try to parse as single JSON first
-	var single interface{}
-	if err := json.Unmarshal(data, &single); err == nil {
+	if json.Valid(data) {
 		return data
 	}
 
-	// Try parsing as multiple JSON arrays (one per line)
-	lines := strings.Split(strings.TrimSpace(string(data)), "\n")
-	var combined []json.RawMessage
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
-		if line == "" {
-			continue
-		}
-
-		var arr []json.RawMessage
-		if err := json.Unmarshal([]byte(line), &arr); err == nil {
-			combined = append(combined, arr...)
-		} else {
-			// Single object
-			combined = append(combined, json.RawMessage(line))
+	dec := json.NewDecoder(bytes.NewReader(data))
+	combined := []byte{'['}
+	for {
+		var doc json.RawMessage
+		if err := dec.Decode(&doc); err != nil {
+			break
 		}
+		combined = appendJSONElements(combined, doc)
 	}
+	return append(combined, ']')
+}
 
-	result, _ := json.Marshal(combined)
-	return result
+// appendJSONElements appends the elements of doc to buf, an unterminated
+// JSON array that starts with '['. An array doc contributes its elements and
+// any other doc is appended as a single element. Elements are spliced in
+// verbatim rather than decoded and re-encoded.
+func appendJSONElements(buf []byte, doc []byte) []byte {
+	doc = bytes.TrimSpace(doc)
+	if len(doc) >= 2 && doc[0] == '[' && doc[len(doc)-1] == ']' {
+		doc = bytes.TrimSpace(doc[1 : len(doc)-1])
+	}
+	if len(doc) == 0 {
+		return buf
+	}
+	if len(buf) > 1 {
+		buf = append(buf, ',')
+	}
+	return append(buf, doc...)
 }
 
-// GHGraphQL executes a GraphQL query via the gh CLI.
+// GHGraphQL executes a GraphQL query, over the pooled direct HTTP client
+// when a github.com token is available and via the gh CLI otherwise.
 // Variables can be any type: strings use -f flag, other types (int, bool) use -F flag
 // for proper GraphQL type handling.
 func GHGraphQL(query string, variables map[string]interface{}) (json.RawMessage, error) {
@@ -83,6 +121,14 @@ func GHGraphQL(query string, variables map[string]interface{}) (json.RawMessage,
 		}
 	}
 
+	if c := directGitHubClient(); c != nil {
+		data, err := c.graphql(query, variables)
+		if err != nil {
+			return nil, fmt.Errorf("gh graphql: %w", err)
+		}
+		return data, nil
+	}
+
 	cmd := exec.Command("gh", args...)
 	output, err := cmd.Output()
 	if err != nil {
@@ -97,6 +143,14 @@ func GHGraphQL(query string, variables map[string]interface{}) (json.RawMessage,
 
 // GetGitHubUser returns the current authenticated GitHub user's login.
 func GetGitHubUser() (string, error) {
+	if c := directGitHubClient(); c != nil {
+		login, err := c.login()
+		if err != nil {
+			return "", fmt.Errorf("getting GitHub user: %w", err)
+		}
+		return login, nil
+	}
+
 	cmd := exec.Command("gh", "api", "user", "--jq", ".login")
 	output, err := cmd.Output()
 	if err != nil {
@@ -167,6 +221,7 @@ func FetchIssueComments(repo string, since time.Time) ([]GitHubComment, error) {
 	if err := json.Unmarshal(data, &comments); err != nil {
 		return nil, fmt.Errorf("parsing comments: %w", err)
 	}
+	annotateCommentItemNumbers(comments)
 
 	return comments, nil
 }
@@ -185,10 +240,50 @@ func FetchPRComments(repo string, since time.Time) ([]GitHubComment, error) {
 	if err := json.Unmarshal(data, &comments); err != nil {
 		return nil, fmt.Errorf("parsing PR comments: %w", err)
 	}
+	annotateCommentItemNumbers(comments)
 
 	return comments, nil
 }
 
+// RepoActivity holds the issues, PRs, and comments fetched for one repo.
+// Fetch errors are recorded rather than printed so callers can report them
+// in repo order once all fetches have completed.
+type RepoActivity struct {
+	Repo             string
+	Items            []GitHubItem
+	IssueComments    []GitHubComment
+	PRComments       []GitHubComment
+	ItemsErr         error // Non-nil means the repo was skipped entirely
+	IssueCommentsErr error
+	PRCommentsErr    error
+}
+
+// FetchReposActivity fetches issues, issue comments, and PR comments for each
+// repo, running up to MaxRepoFetchConcurrency repos in parallel. Results are
+// returned in the same order as repos so output stays deterministic.
+func FetchReposActivity(repos []string, since time.Time) []RepoActivity {
+	results := make([]RepoActivity, len(repos))
+
+	ForEachParallel(len(repos), MaxRepoFetchConcurrency, func(i int) {
+		results[i] = fetchRepoActivity(repos[i], since)
+	})
+
+	return results
+}
+
+// fetchRepoActivity performs the sequential fetches for a single repo.
+// Comments are not fetched if the issue list itself failed.
+func fetchRepoActivity(repo string, since time.Time) RepoActivity {
+	act := RepoActivity{Repo: repo}
+	act.Items, act.ItemsErr = FetchIssues(repo, since)
+	if act.ItemsErr != nil {
+		return act
+	}
+	act.IssueComments, act.IssueCommentsErr = FetchIssueComments(repo, since)
+	act.PRComments, act.PRCommentsErr = FetchPRComments(repo, since)
+	return act
+}
+
 // FetchIssue fetches a single issue by number.
 func FetchIssue(repo string, number int) (*GitHubItem, error) {
 	endpoint := fmt.Sprintf("/repos/%s/issues/%d", repo, number)
@@ -248,59 +343,171 @@ func GetIssueNodeID(repo string, number int) (string, error) {
 	return result.NodeID, nil
 }
 
-// FetchItemComments fetches comments for a specific issue or PR.
-func FetchItemComments(repo string, number int, limit int) ([]CommentSummary, error) {
-	endpoint := fmt.Sprintf("/repos/%s/issues/%d/comments?per_page=%d", repo, number, limit)
-	data, err := GHAPI(endpoint)
-	if err != nil {
-		return nil, err
+// fetchAliasedItems fetches field(number: N) { selection } for each item
+// number in repo. Each item is aliased item_N, so one GraphQL query covers up
+// to graphQLBatchSize items instead of one request per item. Returns each
+// resolved item's raw JSON keyed by number; items that don't resolve are
+// omitted. A failed batch fails the whole call.
+func fetchAliasedItems(repo, field, selection string, numbers []int) (map[int]json.RawMessage, error) {
+	result := make(map[int]json.RawMessage, len(numbers))
+	if len(numbers) == 0 {
+		return result, nil
 	}
 
-	var rawComments []struct {
-		User      GitHubUser `json:"user"`
-		Body      string     `json:"body"`
-		CreatedAt time.Time  `json:"created_at"`
+	parts := strings.SplitN(repo, "/", 2)
+	if len(parts) != 2 {
+		return nil, fmt.Errorf("invalid repo format %q, expected owner/name", repo)
 	}
-	if err := json.Unmarshal(data, &rawComments); err != nil {
-		return nil, fmt.Errorf("parsing comments: %w", err)
+
+	for start := 0; start < len(numbers); start += graphQLBatchSize {
+		batch := numbers[start:min(start+graphQLBatchSize, len(numbers))]
+		data, err := GHGraphQL(aliasedItemsQuery(field, selection, batch), map[string]interface{}{
+			"owner": parts[0],
+			"name":  parts[1],
+		})
+		if err != nil {
+			return nil, err
+		}
+		if err := decodeAliasedItems(data, batch, result); err != nil {
+			return nil, err
+		}
 	}
+	return result, nil
+}
 
-	// Take the most recent comments
-	var comments []CommentSummary
-	start := 0
-	if len(rawComments) > limit {
-		start = len(rawComments) - limit
+// aliasedItemsQuery builds the query for one fetchAliasedItems batch.
+func aliasedItemsQuery(field, selection string, numbers []int) string {
+	var sb strings.Builder
+	sb.WriteString("query($owner: String!, $name: String!) {\n  repository(owner: $owner, name: $name) {\n")
+	for _, n := range numbers {
+		fmt.Fprintf(&sb, "    item_%d: %s(number: %d) {\n      %s\n    }\n", n, field, n, selection)
 	}
-	for _, c := range rawComments[start:] {
-		comments = append(comments, CommentSummary{
-			Author:    c.User.Login,
-			Body:      c.Body,
-			CreatedAt: c.CreatedAt,
-		})
+	sb.WriteString("  }\n}")
+	return sb.String()
+}
+
+// decodeAliasedItems stores the raw JSON of each non-null item_N alias in a
+// fetchAliasedItems response into result.
+func decodeAliasedItems(data []byte, numbers []int, result map[int]json.RawMessage) error {
+	var top struct {
+		Data struct {
+			Repository map[string]json.RawMessage `json:"repository"`
+		} `json:"data"`
 	}
+	if err := json.Unmarshal(data, &top); err != nil {
+		return fmt.Errorf("parsing response: %w", err)
+	}
+	for _, n := range numbers {
+		raw, ok := top.Data.Repository["item_"+strconv.Itoa(n)]
+		if ok && string(raw) != "null" {
+			result[n] = raw
+		}
+	}
+	return nil
+}
 
-	return comments, nil
+// authorNodes is a GraphQL connection selected as nodes { author { login } }.
+type authorNodes struct {
+	Nodes []struct {
+		Author struct {
+			Login string `json:"login"`
+		} `json:"author"`
+	} `json:"nodes"`
 }
 
-// DetectItemType determines whether a GitHub number is an issue or PR.
-func DetectItemType(repo string, number int) (string, error) {
-	endpoint := fmt.Sprintf("/repos/%s/issues/%d", repo, number)
-	data, err := GHAPI(endpoint)
+// FetchItemsComments fetches the last limit comments for each issue/PR number
+// in repo, using batched GraphQL queries (see fetchAliasedItems) instead of
+// one REST call per item. Returns a map from item number to comments in
+// chronological order; items that don't resolve are omitted.
+func FetchItemsComments(repo string, itemNumbers []int, limit int) (map[int][]CommentSummary, error) {
+	const commentFields = `nodes { author { login } body createdAt }`
+	selection := fmt.Sprintf(`... on Issue { comments(last: %d) { %s } }
+      ... on PullRequest { comments(last: %d) { %s } }`, limit, commentFields, limit, commentFields)
+	raws, err := fetchAliasedItems(repo, "issueOrPullRequest", selection, itemNumbers)
 	if err != nil {
-		return "", err
+		return nil, fmt.Errorf("batch fetching comments for %s: %w", repo, err)
 	}
 
-	var result struct {
-		PullRequest *struct{} `json:"pull_request,omitempty"`
+	result := make(map[int][]CommentSummary, len(raws))
+	for _, n := range itemNumbers {
+		raw, ok := raws[n]
+		if !ok {
+			continue
+		}
+
+		var itemData struct {
+			Comments struct {
+				Nodes []struct {
+					Author struct {
+						Login string `json:"login"`
+					} `json:"author"`
+					Body      string    `json:"body"`
+					CreatedAt time.Time `json:"createdAt"`
+				} `json:"nodes"`
+			} `json:"comments"`
+		}
+		if err := json.Unmarshal(raw, &itemData); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: parsing comments for %s#%d: %v\n", repo, n, err)
+			continue
+		}
+
+		comments := make([]CommentSummary, 0, len(itemData.Comments.Nodes))
+		for _, node := range itemData.Comments.Nodes {
+			comments = append(comments, CommentSummary{
+				Author:    node.Author.Login,
+				Body:      node.Body,
+				CreatedAt: node.CreatedAt,
+			})
+		}
+		result[n] = comments
 	}
-	if err := json.Unmarshal(data, &result); err != nil {
-		return "", err
+	return result, nil
+}
+
+// FillItemComments fetches up to limit recent comments for each item and
+// stores them in items[i].Comments. Items are grouped by repo so each repo
+// costs one batched GraphQL query (see FetchItemsComments), and up to
+// MaxRepoFetchConcurrency repos are queried in parallel. This is
+// best-effort: items whose ref doesn't parse or whose repo fetch fails are
+// left without comments.
+func FillItemComments(items []ItemDetails, limit int) {
+	type repoBatch struct {
+		repo     string
+		indices  []int
+		numbers  []int
+		comments map[int][]CommentSummary
+	}
+	var batches []*repoBatch
+	byRepo := make(map[string]*repoBatch)
+	for i := range items {
+		ref := ParseGitHubRef(items[i].Ref)
+		if ref == nil {
+			continue
+		}
+		b, ok := byRepo[ref.Repo]
+		if !ok {
+			b = &repoBatch{repo: ref.Repo}
+			byRepo[ref.Repo] = b
+			batches = append(batches, b)
+		}
+		b.indices = append(b.indices, i)
+		b.numbers = append(b.numbers, ref.Number)
 	}
 
-	if result.PullRequest != nil {
-		return "pr", nil
+	ForEachParallel(len(batches), MaxRepoFetchConcurrency, func(i int) {
+		b := batches[i]
+		if comments, err := FetchItemsComments(b.repo, b.numbers, limit); err == nil {
+			b.comments = comments
+		}
+	})
+
+	for _, b := range batches {
+		for j, idx := range b.indices {
+			if comments, ok := b.comments[b.numbers[j]]; ok {
+				items[idx].Comments = comments
+			}
+		}
 	}
-	return "issue", nil
 }
 
 // rawPRReview represents a single review from the GitHub API.
@@ -326,84 +533,19 @@ func fetchPRReviews(repo string, number int) ([]rawPRReview, error) {
 	return reviews, nil
 }
 
-// FetchPRReviewers fetches deduplicated reviewer logins for a PR.
-func FetchPRReviewers(repo string, number int) ([]string, error) {
-	reviews, err := fetchPRReviews(repo, number)
-	if err != nil {
-		return nil, err
-	}
-
-	reviewerSet := make(map[string]bool)
-	for _, r := range reviews {
-		if r.User.Login != "" {
-			reviewerSet[r.User.Login] = true
-		}
-	}
-
-	var reviewers []string
-	for login := range reviewerSet {
-		reviewers = append(reviewers, login)
-	}
-	return reviewers, nil
-}
-
-// fetchPRReviewsBatch fetches reviews for multiple PRs in a single GraphQL call.
-// Returns a map from PR number to its reviews. PRs that fail to fetch are omitted.
+// fetchPRReviewsBatch fetches reviews for multiple PRs with batched GraphQL
+// queries. Returns a map from PR number to its reviews. PRs that fail to
+// parse are omitted.
 func fetchPRReviewsBatch(repo string, prNumbers []int) (map[int][]rawPRReview, error) {
-	parts := strings.SplitN(repo, "/", 2)
-	if len(parts) != 2 {
-		return nil, fmt.Errorf("invalid repo format %q, expected owner/name", repo)
-	}
-	owner, name := parts[0], parts[1]
-
-	if len(prNumbers) > 50 {
-		fmt.Fprintf(os.Stderr, "Warning: batching %d PRs in a single GraphQL query; may hit node limits\n", len(prNumbers))
-	}
-
-	// Build aliased query: one pullRequest alias per PR number.
-	var fragments []string
-	for _, n := range prNumbers {
-		fragments = append(fragments, fmt.Sprintf(`pr_%d: pullRequest(number: %d) {
-      reviews(first: 100) {
-        nodes { author { login } submittedAt state body }
-      }
-    }`, n, n))
-	}
-
-	query := fmt.Sprintf(`query($owner: String!, $name: String!) {
-  repository(owner: $owner, name: $name) {
-    %s
-  }
-}`, strings.Join(fragments, "\n    "))
-
-	data, err := GHGraphQL(query, map[string]interface{}{
-		"owner": owner,
-		"name":  name,
-	})
+	raws, err := fetchAliasedItems(repo, "pullRequest",
+		`reviews(first: 100) { nodes { author { login } submittedAt state body } }`, prNumbers)
 	if err != nil {
 		return nil, fmt.Errorf("batch fetching reviews for %s: %w", repo, err)
 	}
 
-	// Parse the dynamic response structure.
-	var top struct {
-		Data struct {
-			Repository json.RawMessage `json:"repository"`
-		} `json:"data"`
-	}
-	if err := json.Unmarshal(data, &top); err != nil {
-		return nil, fmt.Errorf("parsing batch review response: %w", err)
-	}
-
-	// Parse repository as map of aliases -> PR data.
-	var prMap map[string]json.RawMessage
-	if err := json.Unmarshal(top.Data.Repository, &prMap); err != nil {
-		return nil, fmt.Errorf("parsing repository aliases: %w", err)
-	}
-
 	result := make(map[int][]rawPRReview)
 	for _, n := range prNumbers {
-		alias := fmt.Sprintf("pr_%d", n)
-		raw, ok := prMap[alias]
+		raw, ok := raws[n]
 		if !ok {
 			continue
 		}
@@ -486,79 +628,35 @@ func FetchPRReviewsAsComments(repo string, prNumbers []int, since time.Time) []G
 				continue
 			}
 			comments = append(comments, GitHubComment{
-				User:      r.User,
-				UpdatedAt: r.SubmittedAt,
-				CreatedAt: r.SubmittedAt,
-				IssueURL:  issueURL,
-				Body:      r.Body,
+				User:       r.User,
+				UpdatedAt:  r.SubmittedAt,
+				CreatedAt:  r.SubmittedAt,
+				IssueURL:   issueURL,
+				Body:       r.Body,
+				ItemNumber: number,
 			})
 		}
 	}
 	return comments
 }
 
-// FetchPRsRequestedReviewers fetches requested-reviewer logins for a batch of PRs
-// in a single GraphQL call. Returns a map from PR number to reviewer logins.
-// On failure, returns an error; callers may choose to continue without this data.
+// FetchPRsRequestedReviewers fetches requested-reviewer logins for a batch of
+// PRs with batched GraphQL queries. Returns a map from PR number to reviewer
+// logins. On failure, returns an error; callers may choose to continue
+// without this data.
 //
 // Team and mannequin reviewers are omitted — only individual User reviewers are
 // returned (matching how ball-in-court checks a specific GitHub user login).
 func FetchPRsRequestedReviewers(repo string, prNumbers []int) (map[int][]string, error) {
-	if len(prNumbers) == 0 {
-		return map[int][]string{}, nil
-	}
-
-	parts := strings.SplitN(repo, "/", 2)
-	if len(parts) != 2 {
-		return nil, fmt.Errorf("invalid repo format %q, expected owner/name", repo)
-	}
-	owner, name := parts[0], parts[1]
-
-	if len(prNumbers) > 50 {
-		fmt.Fprintf(os.Stderr, "Warning: batching %d PRs in a single GraphQL query; may hit node limits\n", len(prNumbers))
-	}
-
-	var fragments []string
-	for _, n := range prNumbers {
-		fragments = append(fragments, fmt.Sprintf(`pr_%d: pullRequest(number: %d) {
-      reviewRequests(first: 100) {
-        nodes { requestedReviewer { __typename ... on User { login } } }
-      }
-    }`, n, n))
-	}
-
-	query := fmt.Sprintf(`query($owner: String!, $name: String!) {
-  repository(owner: $owner, name: $name) {
-    %s
-  }
-}`, strings.Join(fragments, "\n    "))
-
-	data, err := GHGraphQL(query, map[string]interface{}{
-		"owner": owner,
-		"name":  name,
-	})
+	raws, err := fetchAliasedItems(repo, "pullRequest",
+		`reviewRequests(first: 100) { nodes { requestedReviewer { __typename ... on User { login } } } }`, prNumbers)
 	if err != nil {
 		return nil, fmt.Errorf("batch fetching requested reviewers for %s: %w", repo, err)
 	}
 
-	var top struct {
-		Data struct {
-			Repository json.RawMessage `json:"repository"`
-		} `json:"data"`
-	}
-	if err := json.Unmarshal(data, &top); err != nil {
-		return nil, fmt.Errorf("parsing requested reviewers response: %w", err)
-	}
-
-	var prMap map[string]json.RawMessage
-	if err := json.Unmarshal(top.Data.Repository, &prMap); err != nil {
-		return nil, fmt.Errorf("parsing repository aliases: %w", err)
-	}
-
 	result := make(map[int][]string)
 	for _, n := range prNumbers {
-		alias := fmt.Sprintf("pr_%d", n)
-		raw, ok := prMap[alias]
+		raw, ok := raws[n]
 		if !ok {
 			continue
 		}
@@ -591,101 +689,94 @@ func FetchPRsRequestedReviewers(repo string, prNumbers []int) (map[int][]string,
 }
 
 // FetchItemsCommenters fetches unique commenter logins for each issue/PR number
-// in a single batched GraphQL call. Returns a map from item number to commenter
-// logins. This is more efficient than N calls to FetchItemCommenters.
+// with batched GraphQL queries. Returns a map from item number to commenter
+// logins.
 //
 // Only the first 100 comments per item are fetched; items with more comments may
 // be missing older commenters. For ball-in-court "previously commented" checks,
 // this is acceptable — if the user commented on something with >100 comments, they
 // are almost certainly reachable via other signals (assignment, mention, review).
 func FetchItemsCommenters(repo string, itemNumbers []int) (map[int][]string, error) {
-	if len(itemNumbers) == 0 {
-		return map[int][]string{}, nil
-	}
-
-	parts := strings.SplitN(repo, "/", 2)
-	if len(parts) != 2 {
-		return nil, fmt.Errorf("invalid repo format %q, expected owner/name", repo)
-	}
-	owner, name := parts[0], parts[1]
-
-	if len(itemNumbers) > 50 {
-		fmt.Fprintf(os.Stderr, "Warning: batching %d items in a single GraphQL query; may hit node limits\n", len(itemNumbers))
+	raws, err := fetchAliasedItems(repo, "issueOrPullRequest", `... on Issue { comments(first: 100) { nodes { author { login } } } }
+      ... on PullRequest { comments(first: 100) { nodes { author { login } } } }`, itemNumbers)
+	if err != nil {
+		return nil, fmt.Errorf("batch fetching commenters for %s: %w", repo, err)
 	}
 
-	var fragments []string
+	result := make(map[int][]string)
 	for _, n := range itemNumbers {
-		fragments = append(fragments, fmt.Sprintf(`item_%d: issueOrPullRequest(number: %d) {
-      ... on Issue { comments(first: 100) { nodes { author { login } } } }
-      ... on PullRequest { comments(first: 100) { nodes { author { login } } } }
-    }`, n, n))
-	}
+		raw, ok := raws[n]
+		if !ok {
+			continue
+		}
 
-	query := fmt.Sprintf(`query($owner: String!, $name: String!) {
-  repository(owner: $owner, name: $name) {
-    %s
-  }
-}`, strings.Join(fragments, "\n    "))
+		var itemData struct {
+			Comments authorNodes `json:"comments"`
+		}
+		if err := json.Unmarshal(raw, &itemData); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: parsing commenters for %s#%d: %v\n", repo, n, err)
+			continue
+		}
 
-	data, err := GHGraphQL(query, map[string]interface{}{
-		"owner": owner,
-		"name":  name,
-	})
-	if err != nil {
-		return nil, fmt.Errorf("batch fetching commenters for %s: %w", repo, err)
+		result[n] = uniqueAuthors(itemData.Comments)
+		if len(itemData.Comments.Nodes) >= 100 {
+			fmt.Fprintf(os.Stderr, "Warning: %s#%d returned 100 comments (GraphQL limit); older commenters may be missing\n", repo, n)
+		}
 	}
 
-	var top struct {
-		Data struct {
-			Repository json.RawMessage `json:"repository"`
-		} `json:"data"`
-	}
-	if err := json.Unmarshal(data, &top); err != nil {
-		return nil, fmt.Errorf("parsing commenters response: %w", err)
-	}
+	return result, nil
+}
 
-	var itemMap map[string]json.RawMessage
-	if err := json.Unmarshal(top.Data.Repository, &itemMap); err != nil {
-		return nil, fmt.Errorf("parsing repository aliases: %w", err)
+// FetchItemsContributors fetches the commenter and PR reviewer logins for
+// each issue/PR number in repo with batched GraphQL queries, instead of a
+// comments call plus a reviews call per item. Returns a map from item number
+// to unique logins; items that don't resolve are omitted. Like
+// FetchItemsCommenters, only the first 100 comments and reviews per item are
+// considered.
+func FetchItemsContributors(repo string, itemNumbers []int) (map[int][]string, error) {
+	raws, err := fetchAliasedItems(repo, "issueOrPullRequest", `... on Issue { comments(first: 100) { nodes { author { login } } } }
+      ... on PullRequest {
+        comments(first: 100) { nodes { author { login } } }
+        reviews(first: 100) { nodes { author { login } } }
+      }`, itemNumbers)
+	if err != nil {
+		return nil, fmt.Errorf("batch fetching contributors for %s: %w", repo, err)
 	}
 
-	result := make(map[int][]string)
+	result := make(map[int][]string, len(raws))
 	for _, n := range itemNumbers {
-		alias := fmt.Sprintf("item_%d", n)
-		raw, ok := itemMap[alias]
+		raw, ok := raws[n]
 		if !ok {
 			continue
 		}
 
 		var itemData struct {
-			Comments struct {
-				Nodes []struct {
-					Author struct {
-						Login string `json:"login"`
-					} `json:"author"`
-				} `json:"nodes"`
-			} `json:"comments"`
+			Comments authorNodes `json:"comments"`
+			Reviews  authorNodes `json:"reviews"`
 		}
 		if err := json.Unmarshal(raw, &itemData); err != nil {
-			fmt.Fprintf(os.Stderr, "Warning: parsing commenters for %s#%d: %v\n", repo, n, err)
+			fmt.Fprintf(os.Stderr, "Warning: parsing contributors for %s#%d: %v\n", repo, n, err)
 			continue
 		}
+		result[n] = uniqueAuthors(itemData.Comments, itemData.Reviews)
+	}
+	return result, nil
+}
 
-		seen := make(map[string]bool)
-		var commenters []string
-		for _, node := range itemData.Comments.Nodes {
+// uniqueAuthors returns the distinct non-empty author logins across conns,
+// in first-seen order.
+func uniqueAuthors(conns ...authorNodes) []string {
+	seen := make(map[string]bool)
+	var logins []string
+	for _, conn := range conns {
+		for _, node := range conn.Nodes {
 			if node.Author.Login != "" && !seen[node.Author.Login] {
 				seen[node.Author.Login] = true
-				commenters = append(commenters, node.Author.Login)
+				logins = append(logins, node.Author.Login)
 			}
 		}
-		if len(itemData.Comments.Nodes) >= 100 {
-			fmt.Fprintf(os.Stderr, "Warning: %s#%d returned 100 comments (GraphQL limit); older commenters may be missing\n", repo, n)
-		}
-		result[n] = commenters
 	}
-
-	return result, nil
+	return logins
 }
 
 // FetchLastItemComment fetches the single most recent comment on an issue/PR.
@@ -693,14 +784,24 @@ func FetchItemsCommenters(repo string, itemNumbers []int) (map[int][]string, err
 func FetchLastItemComment(repo string, number int) (*GitHubComment, error) {
 	endpoint := fmt.Sprintf("/repos/%s/issues/%d/comments?per_page=1&direction=desc", repo, number)
 
-	// Use gh api without --paginate since we only want 1 result
-	cmd := exec.Command("gh", "api", endpoint)
-	output, err := cmd.Output()
-	if err != nil {
-		if exitErr, ok := err.(*exec.ExitError); ok {
-			return nil, fmt.Errorf("fetching last comment for %s#%d: %s", repo, number, string(exitErr.Stderr))
+	// Don't paginate since we only want 1 result
+	var output []byte
+	if c := directGitHubClient(); c != nil {
+		data, err := c.get(endpoint, false)
+		if err != nil {
+			return nil, fmt.Errorf("fetching last comment for %s#%d: %w", repo, number, err)
+		}
+		output = data
+	} else {
+		cmd := exec.Command("gh", "api", endpoint)
+		data, err := cmd.Output()
+		if err != nil {
+			if exitErr, ok := err.(*exec.ExitError); ok {
+				return nil, fmt.Errorf("fetching last comment for %s#%d: %s", repo, number, string(exitErr.Stderr))
+			}
+			return nil, fmt.Errorf("fetching last comment for %s#%d: %w", repo, number, err)
 		}
-		return nil, fmt.Errorf("fetching last comment for %s#%d: %w", repo, number, err)
+		output = data
 	}
 
 	var comments []GitHubComment
@@ -711,36 +812,7 @@ func FetchLastItemComment(repo string, number int) (*GitHubComment, error) {
 	if len(comments) == 0 {
 		return nil, nil
 	}
+	annotateCommentItemNumbers(comments[:1])
 
 	return &comments[0], nil
 }
-
-// FetchItemCommenters fetches commenters for an issue or PR.
-func FetchItemCommenters(repo string, number int) ([]string, error) {
-	endpoint := fmt.Sprintf("/repos/%s/issues/%d/comments", repo, number)
-	data, err := GHAPI(endpoint)
-	if err != nil {
-		return nil, err
-	}
-
-	var comments []struct {
-		User GitHubUser `json:"user"`
-	}
-	if err := json.Unmarshal(data, &comments); err != nil {
-		return nil, err
-	}
-
-	// Deduplicate commenters
-	commenterSet := make(map[string]bool)
-	for _, c := range comments {
-		if c.User.Login != "" {
-			commenterSet[c.User.Login] = true
-		}
-	}
-
-	var commenters []string
-	for login := range commenterSet {
-		commenters = append(commenters, login)
-	}
-	return commenters, nil
-}
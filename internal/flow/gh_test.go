@@ -0,0 +1,48 @@
+package flow
+
+import (
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestNormalizeJSONLines(t *testing.T) {
+	cases := []struct {
+		name string
+		in   string
+		want string
+	}{
+		{"single array", `[{"a":1},{"a":2}]`, `[{"a":1},{"a":2}]`},
+		{"single object", `{"a":1}`, `{"a":1}`},
+		{"pages on lines", "[{\"a\":1}]\n[{\"a\":2}]\n", `[{"a":1},{"a":2}]`},
+		{"pages back to back", `[{"a":1}][{"a":2}]`, `[{"a":1},{"a":2}]`},
+		{"empty page", "[]\n[{\"a\":1}]", `[{"a":1}]`},
+		{"object per line", "{\"a\":1}\n{\"a\":2}", `[{"a":1},{"a":2}]`},
+		{"padded pages", "[ {\"a\":1} ]\n[ ]\n[{\"a\":2}]", `[{"a":1},{"a":2}]`},
+	}
+	for _, c := range cases {
+		t.Run(c.name, func(t *testing.T) {
+			if got := string(normalizeJSONLines([]byte(c.in))); got != c.want {
+				t.Errorf("normalizeJSONLines(%q) = %s, want %s", c.in, got, c.want)
+			}
+		})
+	}
+}
+
+func TestAliasedItems(t *testing.T) {
+	query := aliasedItemsQuery("pullRequest", "title", []int{3, 7})
+	for _, want := range []string{"item_3: pullRequest(number: 3) {", "item_7: pullRequest(number: 7) {", "repository(owner: $owner, name: $name)"} {
+		if !strings.Contains(query, want) {
+			t.Errorf("query missing %q:\n%s", want, query)
+		}
+	}
+
+	data := []byte(`{"data":{"repository":{"item_3":{"title":"a"},"item_7":null}}}`)
+	result := map[int]json.RawMessage{}
+	if err := decodeAliasedItems(data, []int{3, 7, 9}, result); err != nil {
+		t.Fatal(err)
+	}
+	if len(result) != 1 || string(result[3]) != `{"title":"a"}` {
+		t.Errorf("result = %v, want only item 3", result)
+	}
+}
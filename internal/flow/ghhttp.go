@@ -0,0 +1,377 @@
+package flow
+
+import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"io"
+	"net/http"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/matsen/bipartite/internal/config"
+)
+
+// githubAPIBaseURL is the REST and GraphQL root for api.github.com.
+const githubAPIBaseURL = "https://api.github.com"
+
+// githubAPITimeout is the HTTP client timeout for direct GitHub API calls.
+const githubAPITimeout = 60 * time.Second
+
+// githubClient talks to the GitHub API over a single pooled HTTP client,
+// avoiding a gh subprocess (and a fresh TLS handshake) per request. It is
+// only used when a token is available for github.com; otherwise GHAPI and
+// GHGraphQL fall back to shelling out to gh.
+//
+// GET responses that carry an ETag are cached under cacheDir and revalidated
+// with If-None-Match, so unchanged resources cost a 304 with no body (which
+// GitHub doesn't count against the rate limit). An empty cacheDir disables
+// the cache. Entries unused for githubCacheMaxAge are pruned, and the cache
+// is readable only by the user since it holds private-repo responses.
+type githubClient struct {
+	baseURL    string
+	token      string
+	httpClient *http.Client
+	cacheDir   string
+	pruneOnce  sync.Once
+}
+
+// githubCacheMaxAge is how long an ETag entry may go unused before it is
+// pruned. Revalidated entries are touched, so only endpoints that stopped
+// being requested (closed items, old PRs) expire.
+const githubCacheMaxAge = 14 * 24 * time.Hour
+
+var (
+	defaultGitHubClientOnce sync.Once
+	defaultGitHubClient     *githubClient
+)
+
+// directGitHubClient returns the shared githubClient, or nil if no token is
+// available. The token is resolved once per process.
+func directGitHubClient() *githubClient {
+	defaultGitHubClientOnce.Do(func() {
+		token := githubToken()
+		if token == "" {
+			return
+		}
+		defaultGitHubClient = &githubClient{
+			baseURL:    githubAPIBaseURL,
+			token:      token,
+			httpClient: &http.Client{Timeout: githubAPITimeout},
+			cacheDir:   githubCacheDir(),
+		}
+	})
+	return defaultGitHubClient
+}
+
+// githubToken resolves a github.com token with the precedence bip documents
+// (config.GetGitHubToken: $BIP_GITHUB_TOKEN, $GITHUB_TOKEN, $GH_TOKEN, then
+// github_token in config.yml), so the direct client uses the same token as
+// bip repo. It falls back to gh's stored credentials. Returns "" when gh is
+// pointed at another host (GH_HOST), so enterprise setups keep using gh.
+func githubToken() string {
+	if host := os.Getenv("GH_HOST"); host != "" && host != "github.com" {
+		return ""
+	}
+	if token := config.GetGitHubToken(); token != "" {
+		return token
+	}
+	output, err := exec.Command("gh", "auth", "token").Output()
+	if err != nil {
+		return ""
+	}
+	return strings.TrimSpace(string(output))
+}
+
+// githubCacheDir returns the directory for cached GitHub responses, or "" if
+// the user cache directory can't be determined.
+func githubCacheDir() string {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "bip", "github")
+}
+
+// etagEntry is a cached GET response.
+type etagEntry struct {
+	ETag string          `json:"etag"`
+	Link string          `json:"link,omitempty"`
+	Body json.RawMessage `json:"body"`
+}
+
+// etagCachePath returns the cache file for url, or "" if url shouldn't be
+// cached. The token is part of the key so accounts never share entries.
+// URLs with a since= window are skipped: the window moves on every run, so
+// their entries would never be revalidated and would only accumulate.
+func (c *githubClient) etagCachePath(url string) string {
+	if c.cacheDir == "" || strings.Contains(url, "since=") {
+		return ""
+	}
+	sum := sha256.Sum256([]byte(c.token + "\x00" + url))
+	return filepath.Join(c.cacheDir, hex.EncodeToString(sum[:])+".json")
+}
+
+// loadETagEntry reads a cached response, returning nil if absent or unreadable.
+func loadETagEntry(path string) *etagEntry {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil
+	}
+	var entry etagEntry
+	if err := json.Unmarshal(data, &entry); err != nil || entry.ETag == "" {
+		return nil
+	}
+	return &entry
+}
+
+// saveETagEntry writes a cached response atomically. Failures are ignored:
+// the cache is an optimization and the response is already in hand.
+func saveETagEntry(path string, entry etagEntry) {
+	data, err := json.Marshal(entry)
+	if err != nil {
+		return
+	}
+	if err := os.MkdirAll(filepath.Dir(path), 0700); err != nil {
+		return
+	}
+	// CreateTemp creates the file 0600.
+	tmp, err := os.CreateTemp(filepath.Dir(path), ".etag-*")
+	if err != nil {
+		return
+	}
+	_, werr := tmp.Write(data)
+	cerr := tmp.Close()
+	if werr != nil || cerr != nil || os.Rename(tmp.Name(), path) != nil {
+		os.Remove(tmp.Name())
+	}
+}
+
+// githubLoginTTL bounds how long a cached login is trusted before /user is
+// asked again. Users can rename their account, so this stays short: it only
+// saves the /user round trip across back-to-back invocations.
+const githubLoginTTL = time.Hour
+
+// loginCachePath returns the file caching the token's login, or "" if the
+// cache is disabled. Like ETag entries, it is keyed by the token.
+func (c *githubClient) loginCachePath() string {
+	if c.cacheDir == "" {
+		return ""
+	}
+	sum := sha256.Sum256([]byte(c.token + "\x00login"))
+	return filepath.Join(c.cacheDir, "login-"+hex.EncodeToString(sum[:])+".txt")
+}
+
+// login returns the authenticated user's login. It is cached on disk for
+// githubLoginTTL so processes started shortly after one another skip the
+// /user request.
+func (c *githubClient) login() (string, error) {
+	path := c.loginCachePath()
+	if path != "" {
+		if info, err := os.Stat(path); err == nil && time.Since(info.ModTime()) < githubLoginTTL {
+			if data, err := os.ReadFile(path); err == nil {
+				if login := strings.TrimSpace(string(data)); login != "" {
+					return login, nil
+				}
+			}
+		}
+	}
+
+	data, err := c.get("user", false)
+	if err != nil {
+		return "", err
+	}
+	var user GitHubUser
+	if err := json.Unmarshal(data, &user); err != nil {
+		return "", fmt.Errorf("parsing GitHub user: %w", err)
+	}
+	if path != "" && user.Login != "" {
+		// Best effort, like saveETagEntry.
+		if os.MkdirAll(filepath.Dir(path), 0700) == nil {
+			os.WriteFile(path, []byte(user.Login+"\n"), 0600)
+			// WriteFile keeps the mode of an existing file.
+			os.Chmod(path, 0600)
+		}
+	}
+	return user.Login, nil
+}
+
+// pruneGitHubCache removes cache files in dir not modified within maxAge and
+// tightens the directory to 0700 (caches created before that was the default
+// were 0755). Failures are ignored, like the rest of the cache.
+func pruneGitHubCache(dir string, maxAge time.Duration) {
+	os.Chmod(dir, 0700)
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return
+	}
+	cutoff := time.Now().Add(-maxAge)
+	for _, e := range entries {
+		if !e.Type().IsRegular() {
+			continue
+		}
+		if info, err := e.Info(); err == nil && info.ModTime().Before(cutoff) {
+			os.Remove(filepath.Join(dir, e.Name()))
+		}
+	}
+}
+
+// do sends a request and returns the response body and headers. Non-2xx
+// responses are returned as errors carrying GitHub's message. GETs are
+// revalidated against the ETag cache (see githubClient).
+func (c *githubClient) do(method, url string, body []byte) ([]byte, http.Header, error) {
+	var cachePath string
+	var cached *etagEntry
+	if method == "GET" {
+		cachePath = c.etagCachePath(url)
+		if cachePath != "" {
+			cached = loadETagEntry(cachePath)
+		}
+	}
+
+	var reader io.Reader
+	if body != nil {
+		reader = bytes.NewReader(body)
+	}
+	req, err := http.NewRequest(method, url, reader)
+	if err != nil {
+		return nil, nil, fmt.Errorf("creating request: %w", err)
+	}
+	req.Header.Set("Authorization", "Bearer "+c.token)
+	req.Header.Set("Accept", "application/vnd.github+json")
+	if body != nil {
+		req.Header.Set("Content-Type", "application/json")
+	}
+	if cached != nil {
+		req.Header.Set("If-None-Match", cached.ETag)
+	}
+
+	resp, err := c.httpClient.Do(req)
+	if err != nil {
+		return nil, nil, err
+	}
+	defer resp.Body.Close()
+
+	if cached != nil && resp.StatusCode == http.StatusNotModified {
+		// Mark the entry as used so pruning keeps it.
+		now := time.Now()
+		os.Chtimes(cachePath, now, now)
+		header := http.Header{}
+		if cached.Link != "" {
+			header.Set("Link", cached.Link)
+		}
+		return cached.Body, header, nil
+	}
+
+	data, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, nil, fmt.Errorf("reading response: %w", err)
+	}
+	if resp.StatusCode < 200 || resp.StatusCode > 299 {
+		var apiErr struct {
+			Message string `json:"message"`
+		}
+		if json.Unmarshal(data, &apiErr) == nil && apiErr.Message != "" {
+			return nil, nil, fmt.Errorf("%s (HTTP %d)", apiErr.Message, resp.StatusCode)
+		}
+		return nil, nil, fmt.Errorf("HTTP %d", resp.StatusCode)
+	}
+	if etag := resp.Header.Get("ETag"); cachePath != "" && etag != "" && json.Valid(data) {
+		c.pruneOnce.Do(func() { pruneGitHubCache(c.cacheDir, githubCacheMaxAge) })
+		saveETagEntry(cachePath, etagEntry{ETag: etag, Link: resp.Header.Get("Link"), Body: data})
+	}
+	return data, resp.Header, nil
+}
+
+// get fetches a REST endpoint ("/repos/..." or "user"). With paginate set it
+// follows Link rel="next" headers and concatenates array pages, matching
+// gh api --paginate; object responses are returned as-is.
+func (c *githubClient) get(endpoint string, paginate bool) (json.RawMessage, error) {
+	url := c.baseURL + "/" + strings.TrimPrefix(endpoint, "/")
+	data, header, err := c.do("GET", url, nil)
+	if err != nil {
+		return nil, err
+	}
+	next := parseNextLink(header.Get("Link"))
+	if !paginate || next == "" {
+		return data, nil
+	}
+
+	if !isJSONArray(data) {
+		// Not an array; nothing to concatenate
+		return data, nil
+	}
+	combined := appendJSONElements([]byte{'['}, data)
+	for next != "" {
+		data, header, err = c.do("GET", next, nil)
+		if err != nil {
+			return nil, err
+		}
+		if !isJSONArray(data) {
+			return nil, fmt.Errorf("parsing page: expected a JSON array")
+		}
+		combined = appendJSONElements(combined, data)
+		next = parseNextLink(header.Get("Link"))
+	}
+	return append(combined, ']'), nil
+}
+
+// isJSONArray reports whether data is a JSON array. GitHub responses are
+// well-formed, so the first non-space byte is enough.
+func isJSONArray(data []byte) bool {
+	data = bytes.TrimSpace(data)
+	return len(data) > 0 && data[0] == '['
+}
+
+// graphql posts a GraphQL query. Like gh api graphql, a response carrying
+// errors is reported as an error.
+func (c *githubClient) graphql(query string, variables map[string]interface{}) (json.RawMessage, error) {
+	body, err := json.Marshal(map[string]interface{}{
+		"query":     query,
+		"variables": variables,
+	})
+	if err != nil {
+		return nil, fmt.Errorf("marshaling query: %w", err)
+	}
+	data, _, err := c.do("POST", c.baseURL+"/graphql", body)
+	if err != nil {
+		return nil, err
+	}
+
+	var resp struct {
+		Errors []struct {
+			Message string `json:"message"`
+		} `json:"errors"`
+	}
+	if err := json.Unmarshal(data, &resp); err == nil && len(resp.Errors) > 0 {
+		messages := make([]string, len(resp.Errors))
+		for i, e := range resp.Errors {
+			messages[i] = e.Message
+		}
+		return nil, fmt.Errorf("GraphQL: %s", strings.Join(messages, ", "))
+	}
+	return data, nil
+}
+
+// parseNextLink extracts the rel="next" URL from a GitHub Link header.
+// Returns "" when there is no next page.
+func parseNextLink(link string) string {
+	for _, part := range strings.Split(link, ",") {
+		segments := strings.Split(part, ";")
+		if len(segments) < 2 {
+			continue
+		}
+		for _, attr := range segments[1:] {
+			if strings.TrimSpace(attr) == `rel="next"` {
+				return strings.Trim(strings.TrimSpace(segments[0]), "<>")
+			}
+		}
+	}
+	return ""
+}
@@ -0,0 +1,233 @@
+package flow
+
+import (
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+)
+
+func newTestGitHubClient(t *testing.T, handler http.HandlerFunc) *githubClient {
+	t.Helper()
+	server := httptest.NewServer(handler)
+	t.Cleanup(server.Close)
+	return &githubClient{baseURL: server.URL, token: "test-token", httpClient: server.Client()}
+}
+
+func TestParseNextLink(t *testing.T) {
+	cases := []struct {
+		name string
+		link string
+		want string
+	}{
+		{"empty", "", ""},
+		{"next and last", `<https://api.github.com/x?page=2>; rel="next", <https://api.github.com/x?page=5>; rel="last"`, "https://api.github.com/x?page=2"},
+		{"last page", `<https://api.github.com/x?page=1>; rel="prev", <https://api.github.com/x?page=1>; rel="first"`, ""},
+		{"next not first", `<https://api.github.com/x?page=1>; rel="prev", <https://api.github.com/x?page=3>; rel="next"`, "https://api.github.com/x?page=3"},
+	}
+	for _, c := range cases {
+		t.Run(c.name, func(t *testing.T) {
+			if got := parseNextLink(c.link); got != c.want {
+				t.Errorf("parseNextLink(%q) = %q, want %q", c.link, got, c.want)
+			}
+		})
+	}
+}
+
+func TestGitHubClientGetPaginates(t *testing.T) {
+	var serverURL string
+	client := newTestGitHubClient(t, func(w http.ResponseWriter, r *http.Request) {
+		if got := r.Header.Get("Authorization"); got != "Bearer test-token" {
+			t.Errorf("Authorization = %q", got)
+		}
+		switch r.URL.Query().Get("page") {
+		case "":
+			w.Header().Set("Link", fmt.Sprintf(`<%s/repos/o/r/issues?page=2>; rel="next"`, serverURL))
+			fmt.Fprint(w, `[{"number":1},{"number":2}]`)
+		case "2":
+			fmt.Fprint(w, `[{"number":3}]`)
+		}
+	})
+	serverURL = client.baseURL
+
+	data, err := client.get("/repos/o/r/issues", true)
+	if err != nil {
+		t.Fatalf("get: %v", err)
+	}
+	var items []struct {
+		Number int `json:"number"`
+	}
+	if err := json.Unmarshal(data, &items); err != nil {
+		t.Fatalf("unmarshal: %v", err)
+	}
+	if len(items) != 3 || items[2].Number != 3 {
+		t.Errorf("got %+v, want numbers 1..3", items)
+	}
+
+	// Without paginate, only the first page is returned.
+	data, err = client.get("repos/o/r/issues", false)
+	if err != nil {
+		t.Fatalf("get: %v", err)
+	}
+	if err := json.Unmarshal(data, &items); err != nil || len(items) != 2 {
+		t.Errorf("unpaginated get = %s, want first page only", data)
+	}
+}
+
+func TestGitHubClientErrors(t *testing.T) {
+	client := newTestGitHubClient(t, func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path == "/graphql" {
+			fmt.Fprint(w, `{"data":null,"errors":[{"message":"Could not resolve to an Organization"}]}`)
+			return
+		}
+		w.WriteHeader(http.StatusNotFound)
+		fmt.Fprint(w, `{"message":"Not Found"}`)
+	})
+
+	if _, err := client.get("/repos/o/missing", true); err == nil || !strings.Contains(err.Error(), "Not Found (HTTP 404)") {
+		t.Errorf("get error = %v, want Not Found (HTTP 404)", err)
+	}
+	if _, err := client.graphql("query { x }", nil); err == nil || !strings.Contains(err.Error(), "Could not resolve") {
+		t.Errorf("graphql error = %v, want GraphQL error message", err)
+	}
+}
+
+func TestGitHubClientETagCache(t *testing.T) {
+	var requests, revalidated int
+	client := newTestGitHubClient(t, func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		if r.Header.Get("If-None-Match") == `"v1"` {
+			revalidated++
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		w.Header().Set("ETag", `"v1"`)
+		fmt.Fprint(w, `{"number":7}`)
+	})
+	client.cacheDir = t.TempDir()
+
+	for i := 0; i < 2; i++ {
+		data, err := client.get("/repos/o/r/issues/7", false)
+		if err != nil {
+			t.Fatalf("get #%d: %v", i, err)
+		}
+		if string(data) != `{"number":7}` {
+			t.Errorf("get #%d = %s, want cached body", i, data)
+		}
+	}
+	if requests != 2 || revalidated != 1 {
+		t.Errorf("requests=%d revalidated=%d, want 2 and 1", requests, revalidated)
+	}
+
+	// since= windows are never cached.
+	if path := client.etagCachePath(client.baseURL + "/repos/o/r/issues?since=2024-01-01T00:00:00Z"); path != "" {
+		t.Errorf("etagCachePath for since= URL = %q, want empty", path)
+	}
+}
+
+func TestGitHubClientLoginCache(t *testing.T) {
+	var requests int
+	client := newTestGitHubClient(t, func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		fmt.Fprint(w, `{"login":"octocat"}`)
+	})
+	client.cacheDir = t.TempDir()
+
+	for i := 0; i < 2; i++ {
+		login, err := client.login()
+		if err != nil {
+			t.Fatalf("login #%d: %v", i, err)
+		}
+		if login != "octocat" {
+			t.Errorf("login #%d = %q, want octocat", i, login)
+		}
+	}
+	if requests != 1 {
+		t.Errorf("requests = %d, want 1 (second login served from disk)", requests)
+	}
+	if info, err := os.Stat(client.loginCachePath()); err != nil {
+		t.Errorf("login cache file missing: %v", err)
+	} else if info.Mode().Perm() != 0600 {
+		t.Errorf("login cache file mode = %v, want 0600", info.Mode().Perm())
+	}
+
+	// An expired entry is revalidated against /user.
+	expired := time.Now().Add(-2 * githubLoginTTL)
+	if err := os.Chtimes(client.loginCachePath(), expired, expired); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := client.login(); err != nil {
+		t.Fatal(err)
+	}
+	if requests != 2 {
+		t.Errorf("requests = %d, want 2 after the cached login expired", requests)
+	}
+}
+
+func TestPruneGitHubCache(t *testing.T) {
+	dir := t.TempDir()
+	old := filepath.Join(dir, "old.json")
+	fresh := filepath.Join(dir, "fresh.json")
+	for _, path := range []string{old, fresh} {
+		if err := os.WriteFile(path, []byte(`{}`), 0600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	stale := time.Now().Add(-2 * githubCacheMaxAge)
+	if err := os.Chtimes(old, stale, stale); err != nil {
+		t.Fatal(err)
+	}
+
+	pruneGitHubCache(dir, githubCacheMaxAge)
+
+	if _, err := os.Stat(old); !os.IsNotExist(err) {
+		t.Errorf("stale entry not pruned (stat err = %v)", err)
+	}
+	if _, err := os.Stat(fresh); err != nil {
+		t.Errorf("fresh entry pruned: %v", err)
+	}
+	if info, err := os.Stat(dir); err != nil {
+		t.Errorf("cache dir missing: %v", err)
+	} else if info.Mode().Perm() != 0700 {
+		t.Errorf("cache dir mode = %v, want 0700", info.Mode().Perm())
+	}
+}
+
+func TestGitHubTokenPrecedence(t *testing.T) {
+	tests := []struct {
+		name string
+		env  map[string]string
+		want string
+	}{
+		{
+			name: "BIP_GITHUB_TOKEN wins over gh's variables",
+			env:  map[string]string{"BIP_GITHUB_TOKEN": "from-bip", "GITHUB_TOKEN": "from-github", "GH_TOKEN": "from-gh"},
+			want: "from-bip",
+		},
+		{
+			name: "GITHUB_TOKEN wins over GH_TOKEN",
+			env:  map[string]string{"GITHUB_TOKEN": "from-github", "GH_TOKEN": "from-gh"},
+			want: "from-github",
+		},
+		{
+			name: "non-github.com GH_HOST disables the direct client",
+			env:  map[string]string{"GH_HOST": "github.example.com", "BIP_GITHUB_TOKEN": "from-bip"},
+			want: "",
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			for _, name := range []string{"GH_HOST", "BIP_GITHUB_TOKEN", "GITHUB_TOKEN", "GH_TOKEN"} {
+				t.Setenv(name, tt.env[name])
+			}
+			if got := githubToken(); got != tt.want {
+				t.Errorf("githubToken() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
@@ -24,7 +24,11 @@ var (
 func ParseGitHubRef(arg string) *GitHubRef {
 	arg = strings.TrimSpace(arg)
 
-	// Try URL format first
+	// Try URL format first. Every URL form contains "github.com/", so the
+	// common org/repo#number input skips the regex entirely.
+	if !strings.Contains(arg, "github.com/") {
+		return parseHashFormat(arg)
+	}
 	if matches := urlPattern.FindStringSubmatch(arg); matches != nil {
 		number, _ := strconv.Atoi(matches[3])
 		itemType := "issue"
@@ -16,6 +16,9 @@ const (
 	// Set to 10 to stay well under typical API rate limits while providing good throughput.
 	maxSummarizeConcurrency = 10
 
+	// summaryBatchSize is the number of items per take-home summary prompt.
+	summaryBatchSize = 10
+
 	// maxCommentLength limits comment body length in take-home prompts.
 	maxCommentLength = 200
 
@@ -32,21 +35,40 @@ const (
 // truncateUTF8 safely truncates text to approximately maxLen bytes
 // without splitting multi-byte UTF-8 characters. Adds "..." if truncated.
 func truncateUTF8(text string, maxLen int) string {
-	if len(text) <= maxLen {
+	n, truncated := utf8TruncateLen(text, maxLen)
+	if !truncated {
 		return text
 	}
+	if n == 0 {
+		return ""
+	}
+	return text[:n] + "..."
+}
+
+// writeTruncatedUTF8 writes truncateUTF8(text, maxLen) to sb without
+// allocating the intermediate truncated string.
+func writeTruncatedUTF8(sb *strings.Builder, text string, maxLen int) {
+	n, truncated := utf8TruncateLen(text, maxLen)
+	sb.WriteString(text[:n])
+	if truncated && n > 0 {
+		sb.WriteString("...")
+	}
+}
+
+// utf8TruncateLen returns the length of the longest prefix of text that is at
+// most maxLen bytes and ends on a UTF-8 character boundary, and whether that
+// prefix is shorter than text.
+func utf8TruncateLen(text string, maxLen int) (int, bool) {
+	if len(text) <= maxLen {
+		return len(text), false
+	}
 
 	// Find the last valid UTF-8 character boundary before maxLen
 	validLen := maxLen
 	for validLen > 0 && !utf8.RuneStart(text[validLen]) {
 		validLen--
 	}
-
-	if validLen == 0 {
-		return ""
-	}
-
-	return text[:validLen] + "..."
+	return validLen, true
 }
 
 // CallClaude calls the claude CLI with the given prompt.
@@ -74,55 +96,69 @@ func CallClaude(prompt string, model string) (string, error) {
 }
 
 // GenerateTakehomeSummaries generates take-home summaries for a batch of items.
+//
+// Items are split into chunks of summaryBatchSize, each summarized by its own
+// Claude call, with up to maxSummarizeConcurrency calls in flight. Smaller
+// prompts return sooner, and a malformed response only loses its own chunk.
+//
+// If every chunk succeeds the error is nil. If some chunks fail, the
+// summaries from the rest are returned together with a non-nil error, so
+// callers can show a partial result while knowing it is incomplete. If every
+// chunk fails, the summaries are nil.
 func GenerateTakehomeSummaries(items []ItemDetails) (TakehomeSummary, error) {
 	if len(items) == 0 {
 		return TakehomeSummary{}, nil
 	}
 
-	prompt := buildSummaryPrompt(items)
-	response, err := CallClaude(prompt, "haiku")
-	if err != nil {
-		return nil, err
+	var chunks [][]ItemDetails
+	for start := 0; start < len(items); start += summaryBatchSize {
+		chunks = append(chunks, items[start:min(start+summaryBatchSize, len(items))])
 	}
 
-	return parseSummaryResponse(response)
-}
-
-// buildSummaryPrompt builds the prompt for take-home summary generation.
-func buildSummaryPrompt(items []ItemDetails) string {
-	var itemsText strings.Builder
-
-	for _, item := range items {
-		itemType := "Issue"
-		if item.IsPR {
-			itemType = "PR"
+	results := make([]TakehomeSummary, len(chunks))
+	errs := make([]error, len(chunks))
+	ForEachParallel(len(chunks), maxSummarizeConcurrency, func(i int) {
+		response, err := CallClaude(buildSummaryPrompt(chunks[i]), "haiku")
+		if err == nil {
+			results[i], err = parseSummaryResponse(response)
 		}
+		errs[i] = err
+	})
 
-		// Format comments (last 5, truncated to 200 chars each)
-		var commentsText strings.Builder
-		start := 0
-		if len(item.Comments) > 5 {
-			start = len(item.Comments) - 5
+	return mergeSummaryChunks(results, errs)
+}
+
+// mergeSummaryChunks combines per-chunk summaries, skipping failed chunks.
+// See GenerateTakehomeSummaries for the partial-failure contract.
+func mergeSummaryChunks(results []TakehomeSummary, errs []error) (TakehomeSummary, error) {
+	summaries := make(TakehomeSummary)
+	var firstErr error
+	failed := 0
+	for i, err := range errs {
+		if err != nil {
+			failed++
+			if firstErr == nil {
+				firstErr = err
+			}
+			continue
 		}
-		for _, c := range item.Comments[start:] {
-			body := truncateUTF8(c.Body, maxCommentLength)
-			commentsText.WriteString(fmt.Sprintf("    @%s: %s\n", c.Author, body))
+		for ref, summary := range results[i] {
+			summaries[ref] = summary
 		}
-
-		bodyPreview := truncateUTF8(item.Body, maxBodyPreviewLength)
-
-		itemsText.WriteString(fmt.Sprintf(`
----
-REF: %s
-TYPE: %s
-TITLE: %s
-AUTHOR: %s
-BODY: %s
-RECENT_COMMENTS:
-%s---`, item.Ref, itemType, item.Title, item.Author, bodyPreview, commentsText.String()))
 	}
+	if failed == len(errs) && failed > 0 {
+		return nil, firstErr
+	}
+	if failed > 0 {
+		return summaries, fmt.Errorf("%d of %d summary batches failed: %w", failed, len(errs), firstErr)
+	}
+
+	return summaries, nil
+}
 
-	return fmt.Sprintf(`You are helping triage GitHub activity. For each item below, provide a brief take-home summary (1 short sentence) that tells the user what happened and whether they need to act.
+// summaryPromptHeader is the fixed instruction block that precedes the items
+// in a take-home summary prompt.
+const summaryPromptHeader = `You are helping triage GitHub activity. For each item below, provide a brief take-home summary (1 short sentence) that tells the user what happened and whether they need to act.
 
 Focus on:
 - What's the current state/what happened?
@@ -141,9 +177,47 @@ Output format: Return a JSON object mapping each REF to its summary.
 Example: {"org/repo#123": "summary here", "org/repo#456": "another summary"}
 
 Items to summarize:
-%s
+`
+
+// summaryPromptFooter closes a take-home summary prompt.
+const summaryPromptFooter = "\n\nReturn ONLY the JSON object, no other text."
+
+// buildSummaryPrompt builds the prompt for take-home summary generation.
+// Everything is written into one builder so no per-item or whole-prompt
+// intermediate strings are allocated.
+func buildSummaryPrompt(items []ItemDetails) string {
+	var sb strings.Builder
+	sb.WriteString(summaryPromptHeader)
+
+	for _, item := range items {
+		itemType := "Issue"
+		if item.IsPR {
+			itemType = "PR"
+		}
+
+		fmt.Fprintf(&sb, "\n---\nREF: %s\nTYPE: %s\nTITLE: %s\nAUTHOR: %s\nBODY: ",
+			item.Ref, itemType, item.Title, item.Author)
+		writeTruncatedUTF8(&sb, item.Body, maxBodyPreviewLength)
+		sb.WriteString("\nRECENT_COMMENTS:\n")
+
+		// Format comments (last 5, truncated to 200 chars each), writing the
+		// truncated bodies straight into the builder
+		start := 0
+		if len(item.Comments) > 5 {
+			start = len(item.Comments) - 5
+		}
+		for _, c := range item.Comments[start:] {
+			sb.WriteString("    @")
+			sb.WriteString(c.Author)
+			sb.WriteString(": ")
+			writeTruncatedUTF8(&sb, c.Body, maxCommentLength)
+			sb.WriteByte('\n')
+		}
+		sb.WriteString("---")
+	}
 
-Return ONLY the JSON object, no other text.`, itemsText.String())
+	sb.WriteString(summaryPromptFooter)
+	return sb.String()
 }
 
 // parseSummaryResponse parses the LLM response into a TakehomeSummary.
@@ -164,21 +238,22 @@ func parseSummaryResponse(response string) (TakehomeSummary, error) {
 }
 
 // extractFromCodeBlock extracts content from a markdown code block.
+// It slices around the fence lines instead of splitting the whole response
+// into lines and joining them back.
 func extractFromCodeBlock(text string) string {
-	lines := strings.Split(text, "\n")
-	if len(lines) < 2 {
+	// Remove first line (```json or ```)
+	nl := strings.IndexByte(text, '\n')
+	if nl < 0 {
 		return text
 	}
+	body := text[nl+1:]
 
-	// Remove first line (```json or ```)
-	start := 1
 	// Remove last line if it's ```
-	end := len(lines)
-	if strings.TrimSpace(lines[len(lines)-1]) == "```" {
-		end = len(lines) - 1
+	lastNL := strings.LastIndexByte(body, '\n')
+	if strings.TrimSpace(body[lastNL+1:]) == "```" {
+		body = body[:max(lastNL, 0)]
 	}
-
-	return strings.Join(lines[start:end], "\n")
+	return body
 }
 
 // GenerateDigestPerPerson generates one digest message per author.
@@ -198,51 +273,48 @@ func GenerateDigestPerPerson(items []DigestItem, channel, dateRange string) ([]s
 		authorItems[item.Author] = append(authorItems[item.Author], item)
 	}
 
-	// Generate one message per author
-	var messages []string
-	messages = append(messages, fmt.Sprintf("*This week in %s* (%s)", channel, dateRange))
+	// Generate one message per author, running up to maxSummarizeConcurrency
+	// Claude calls in parallel. messages[0] is the header.
+	messages := make([]string, 1+len(authorOrder))
+	messages[0] = fmt.Sprintf("*This week in %s* (%s)", channel, dateRange)
+	errs := make([]error, len(authorOrder))
 
-	for _, author := range authorOrder {
+	ForEachParallel(len(authorOrder), maxSummarizeConcurrency, func(i int) {
+		author := authorOrder[i]
 		prompt := buildPersonDigestPrompt(authorItems[author], author)
 		response, err := CallClaude(prompt, "haiku")
 		if err != nil {
-			return nil, fmt.Errorf("generating summary for @%s: %w", author, err)
+			errs[i] = fmt.Errorf("generating summary for @%s: %w", author, err)
+			return
 		}
-		messages = append(messages, strings.TrimSpace(response))
-	}
-
-	return messages, nil
-}
+		messages[i+1] = strings.TrimSpace(response)
+	})
 
-// buildPersonDigestPrompt builds a prompt for a single person's digest section.
-func buildPersonDigestPrompt(items []DigestItem, author string) string {
-	var itemsText strings.Builder
-	for _, item := range items {
-		itemType := "Issue"
-		if item.IsPR {
-			itemType = "PR"
-		}
-		state := item.State
-		if item.Merged {
-			state = "merged"
+	// Report the first failure in author order, as the serial loop did
+	for _, err := range errs {
+		if err != nil {
+			return nil, err
 		}
-		itemsText.WriteString(fmt.Sprintf("- [%s] #%d: %s (%s) URL: %s\n",
-			itemType, item.Number, item.Title, state, item.HTMLURL))
 	}
 
-	return fmt.Sprintf(`Summarize this person's GitHub activity as a compact Slack message section.
-
-Author: @%s
+	return messages, nil
+}
 
-Activity:
-%s
+// personDigestPromptRequirements and personDigestPromptFormat are the fixed
+// instructions that follow the activity list in a per-person digest prompt;
+// the author's handle goes between them. They are written verbatim rather
+// than run through Sprintf on every call.
+const (
+	personDigestPromptRequirements = `
 
 CRITICAL REQUIREMENTS:
 - Include EVERY item listed above. Do NOT skip or omit any.
 - Keep descriptions very short (a few words each).
 
 Format as Slack mrkdwn:
-- Start with bold author header: *@%s*
+- Start with bold author header: *@`
+
+	personDigestPromptFormat = `*
 - Use bullet points (•) grouped by status: Merged, Open PRs, Open issues
 - Within each status bullet, list items comma-separated with short descriptions and Slack-style links
 - Skip status lines with no items
@@ -253,7 +325,30 @@ Example:
 • Open PRs: attention refactor (<https://github.com/org/repo/pull/147|#147>)
 • Open issues: OOM on large batches (<https://github.com/org/repo/issues/156|#156>)
 
-Return ONLY the formatted section, no other text.`, author, itemsText.String(), author)
+Return ONLY the formatted section, no other text.`
+)
+
+// buildPersonDigestPrompt builds a prompt for a single person's digest section.
+func buildPersonDigestPrompt(items []DigestItem, author string) string {
+	var sb strings.Builder
+	fmt.Fprintf(&sb, "Summarize this person's GitHub activity as a compact Slack message section.\n\nAuthor: @%s\n\nActivity:\n", author)
+	for _, item := range items {
+		itemType := "Issue"
+		if item.IsPR {
+			itemType = "PR"
+		}
+		state := item.State
+		if item.Merged {
+			state = "merged"
+		}
+		fmt.Fprintf(&sb, "- [%s] #%d: %s (%s) URL: %s\n",
+			itemType, item.Number, item.Title, state, item.HTMLURL)
+	}
+
+	sb.WriteString(personDigestPromptRequirements)
+	sb.WriteString(author)
+	sb.WriteString(personDigestPromptFormat)
+	return sb.String()
 }
 
 // SummarizeDigestItems generates AI summaries for digest items with controlled concurrency.
@@ -278,51 +373,36 @@ func SummarizeDigestItems(items []DigestItem) ([]DigestItem, error) {
 	result := make([]DigestItem, len(items))
 	copy(result, items)
 
-	// Semaphore for bounded concurrency
-	sem := make(chan struct{}, maxSummarizeConcurrency)
-	var wg sync.WaitGroup
 	var mu sync.Mutex
 	var firstErr error
 
-	for i := range result {
+	ForEachParallel(len(result), maxSummarizeConcurrency, func(i int) {
 		// Skip items with no body
 		if result[i].Body == "" {
-			continue
+			return
 		}
 
-		wg.Add(1)
-		go func(idx int) {
-			defer wg.Done()
-
-			// Acquire semaphore
-			sem <- struct{}{}
-			defer func() { <-sem }()
+		// Check if we should abort due to earlier error
+		mu.Lock()
+		if firstErr != nil {
+			mu.Unlock()
+			return
+		}
+		mu.Unlock()
 
-			// Check if we should abort due to earlier error
+		// Generate summary
+		summary, err := summarizeSingleItem(result[i])
+		if err != nil {
 			mu.Lock()
-			if firstErr != nil {
-				mu.Unlock()
-				return
+			if firstErr == nil {
+				firstErr = fmt.Errorf("summarizing %s: %w", result[i].Ref, err)
 			}
 			mu.Unlock()
+			return
+		}
 
-			// Generate summary
-			summary, err := summarizeSingleItem(result[idx])
-			if err != nil {
-				mu.Lock()
-				if firstErr == nil {
-					firstErr = fmt.Errorf("summarizing %s: %w", result[idx].Ref, err)
-				}
-				mu.Unlock()
-				return
-			}
-
-			// No mutex needed - each goroutine writes to its own unique index
-			result[idx].Summary = summary
-		}(i)
-	}
-
-	wg.Wait()
+		result[i].Summary = summary
+	})
 
 	if firstErr != nil {
 		return nil, firstErr
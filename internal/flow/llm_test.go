@@ -1,6 +1,7 @@
 package flow
 
 import (
+	"errors"
 	"strconv"
 	"strings"
 	"testing"
@@ -113,6 +114,21 @@ func TestExtractFromCodeBlock(t *testing.T) {
 			input:    "```json\n{\"key\": \"value\"}",
 			expected: "{\"key\": \"value\"}",
 		},
+		{
+			name:     "multi-line body with indented fence",
+			input:    "```json\n{\n  \"a\": 1\n}\n  ```  ",
+			expected: "{\n  \"a\": 1\n}",
+		},
+		{
+			name:     "empty block",
+			input:    "```json\n```",
+			expected: "",
+		},
+		{
+			name:     "single line",
+			input:    "```json",
+			expected: "```json",
+		},
 	}
 
 	for _, tt := range tests {
@@ -373,3 +389,58 @@ func TestGenerateDigestPerPersonEmpty(t *testing.T) {
 		t.Error("should contain No activity message")
 	}
 }
+
+func TestMergeSummaryChunks(t *testing.T) {
+	errBatch := errors.New("malformed response")
+	tests := []struct {
+		name      string
+		results   []TakehomeSummary
+		errs      []error
+		wantNil   bool
+		wantRefs  []string
+		wantError bool
+	}{
+		{
+			name:     "all chunks succeed",
+			results:  []TakehomeSummary{{"a#1": "one"}, {"a#2": "two"}},
+			errs:     []error{nil, nil},
+			wantRefs: []string{"a#1", "a#2"},
+		},
+		{
+			name:      "partial failure keeps the successful chunks and reports an error",
+			results:   []TakehomeSummary{{"a#1": "one"}, nil},
+			errs:      []error{nil, errBatch},
+			wantRefs:  []string{"a#1"},
+			wantError: true,
+		},
+		{
+			name:      "every chunk fails",
+			results:   []TakehomeSummary{nil, nil},
+			errs:      []error{errBatch, errBatch},
+			wantNil:   true,
+			wantError: true,
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := mergeSummaryChunks(tt.results, tt.errs)
+			if (err != nil) != tt.wantError {
+				t.Fatalf("err = %v, wantError %v", err, tt.wantError)
+			}
+			if err != nil && !errors.Is(err, errBatch) {
+				t.Errorf("err = %v, want it to wrap the chunk error", err)
+			}
+			if (got == nil) != tt.wantNil {
+				t.Fatalf("summaries = %v, wantNil %v", got, tt.wantNil)
+			}
+			if len(got) != len(tt.wantRefs) {
+				t.Errorf("got %d summaries, want %d", len(got), len(tt.wantRefs))
+			}
+			for _, ref := range tt.wantRefs {
+				if _, ok := got[ref]; !ok {
+					t.Errorf("missing summary for %s", ref)
+				}
+			}
+		})
+	}
+}
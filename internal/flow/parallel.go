@@ -0,0 +1,26 @@
+package flow
+
+import "sync"
+
+// ForEachParallel calls fn(i) for every i in [0, n), running at most limit
+// calls at once, and returns when all of them have finished. fn may only
+// write to state owned by index i (such as results[i]); callers then need no
+// mutex, and results stay in input order.
+func ForEachParallel(n, limit int, fn func(i int)) {
+	if limit < 1 {
+		limit = 1
+	}
+	sem := make(chan struct{}, limit)
+	var wg sync.WaitGroup
+	for i := 0; i < n; i++ {
+		wg.Add(1)
+		go func(idx int) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			fn(idx)
+		}(i)
+	}
+	wg.Wait()
+}
@@ -0,0 +1,47 @@
+package flow
+
+import (
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestForEachParallel(t *testing.T) {
+	tests := []struct {
+		name  string
+		n     int
+		limit int
+	}{
+		{"empty", 0, 4},
+		{"fewer items than limit", 3, 8},
+		{"more items than limit", 20, 4},
+		{"non-positive limit runs serially", 5, 0},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var running, peak int32
+			seen := make([]int, tt.n)
+			ForEachParallel(tt.n, tt.limit, func(i int) {
+				cur := atomic.AddInt32(&running, 1)
+				for {
+					old := atomic.LoadInt32(&peak)
+					if cur <= old || atomic.CompareAndSwapInt32(&peak, old, cur) {
+						break
+					}
+				}
+				time.Sleep(time.Millisecond)
+				seen[i]++
+				atomic.AddInt32(&running, -1)
+			})
+
+			for i, count := range seen {
+				if count != 1 {
+					t.Errorf("index %d called %d times, want 1", i, count)
+				}
+			}
+			if limit := max(tt.limit, 1); int(peak) > limit {
+				t.Errorf("peak concurrency = %d, want <= %d", peak, limit)
+			}
+		})
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -27,6 +28,10 @@ func newSlackHTTPClient() *http.Client {
 	return &http.Client{Timeout: slackAPITimeout}
 }
 
+// webhookHTTPClient is shared by PostToSlack so consecutive posts (e.g. a
+// digest split into several messages) reuse one keep-alive connection.
+var webhookHTTPClient = newSlackHTTPClient()
+
 // SlackClient provides read access to Slack channels via the API.
 type SlackClient struct {
 	token      string
@@ -98,24 +103,31 @@ func GetWebhookURL(channel string) string {
 
 // PostToSlack posts a message to Slack via webhook.
 func PostToSlack(webhookURL, message string) error {
-	payload := map[string]string{"text": message}
-	data, err := json.Marshal(payload)
-	if err != nil {
+	// Encode a struct rather than a map, and leave <, > and & unescaped:
+	// digest mrkdwn is full of <url|text> links, and \u003c-style escapes
+	// would bloat each one by ten bytes.
+	var body bytes.Buffer
+	enc := json.NewEncoder(&body)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(struct {
+		Text string `json:"text"`
+	}{message}); err != nil {
 		return fmt.Errorf("marshaling payload: %w", err)
 	}
 
-	client := newSlackHTTPClient()
-	req, err := http.NewRequest("POST", webhookURL, bytes.NewReader(data))
+	req, err := http.NewRequest("POST", webhookURL, &body)
 	if err != nil {
 		return fmt.Errorf("creating request: %w", err)
 	}
 	req.Header.Set("Content-Type", "application/json")
 
-	resp, err := client.Do(req)
+	resp, err := webhookHTTPClient.Do(req)
 	if err != nil {
 		return fmt.Errorf("posting to Slack: %w", err)
 	}
 	defer resp.Body.Close()
+	// Drain the body so the connection can be reused
+	_, _ = io.Copy(io.Discard, resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		return fmt.Errorf("slack API error: %s", resp.Status)
@@ -556,15 +568,31 @@ func LoadChannelIDMap(nexusPath string) (map[string]string, error) {
 // makes no assumptions about Markdown structure: markup inside code fences is
 // resolved like any other.
 func ResolveChannelMentions(text string, idToName map[string]string) string {
-	return channelMentionRe.ReplaceAllStringFunc(text, func(match string) string {
-		m := channelMentionRe.FindStringSubmatch(match)
-		id, alias := m[1], m[2]
+	// One scan collects every match with its submatch offsets; replacements
+	// are spliced in directly rather than re-matching each mention.
+	matches := channelMentionRe.FindAllStringSubmatchIndex(text, -1)
+	if matches == nil {
+		return text
+	}
+
+	var sb strings.Builder
+	sb.Grow(len(text))
+	last := 0
+	for _, m := range matches {
+		sb.WriteString(text[last:m[0]])
+		last = m[1]
+
+		id := text[m[2]:m[3]]
 		if name, ok := idToName[id]; ok {
-			return "#" + name
+			sb.WriteString("#" + name)
+			continue
 		}
-		if alias != "" {
-			return "#" + alias
+		if m[4] >= 0 && m[5] > m[4] {
+			sb.WriteString("#" + text[m[4]:m[5]])
+			continue
 		}
-		return match
-	})
+		sb.WriteString(text[m[0]:m[1]])
+	}
+	sb.WriteString(text[last:])
+	return sb.String()
 }
@@ -1,7 +1,11 @@
 package flow
 
 import (
+	"bytes"
 	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptest"
 	"os"
 	"path/filepath"
 	"testing"
@@ -456,3 +460,29 @@ func TestMessage_JSONFields(t *testing.T) {
 		}
 	}
 }
+
+func TestPostToSlackPayload(t *testing.T) {
+	message := "• Merged: fix (<https://github.com/org/repo/pull/1|#1>) & more"
+	var got []byte
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		got, _ = io.ReadAll(r.Body)
+	}))
+	defer server.Close()
+
+	if err := PostToSlack(server.URL, message); err != nil {
+		t.Fatalf("PostToSlack: %v", err)
+	}
+
+	var payload struct {
+		Text string `json:"text"`
+	}
+	if err := json.Unmarshal(got, &payload); err != nil {
+		t.Fatalf("payload is not JSON: %v (%s)", err, got)
+	}
+	if payload.Text != message {
+		t.Errorf("text = %q, want %q", payload.Text, message)
+	}
+	if !bytes.Contains(got, []byte("<https://github.com/org/repo/pull/1|#1>")) {
+		t.Errorf("payload escaped link markup: %s", got)
+	}
+}
@@ -2,11 +2,11 @@
 package spawn
 
 import (
+	"bytes"
 	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
-	"strings"
 )
 
 // IsInTmux checks if we're running inside a tmux session.
@@ -22,9 +22,21 @@ func WindowExists(windowName string) bool {
 		return false
 	}
 
-	windows := strings.Split(strings.TrimSpace(string(output)), "\n")
-	for _, w := range windows {
-		if w == windowName {
+	return hasWindow(output, windowName)
+}
+
+// hasWindow reports whether windowName is one of the lines of
+// tmux list-windows output. It scans the output in place rather than
+// splitting it into a slice of strings.
+func hasWindow(output []byte, windowName string) bool {
+	for rest := output; len(rest) > 0; {
+		line := rest
+		if i := bytes.IndexByte(rest, '\n'); i >= 0 {
+			line, rest = rest[:i], rest[i+1:]
+		} else {
+			rest = nil
+		}
+		if string(line) == windowName {
 			return true
 		}
 	}
@@ -60,13 +72,15 @@ func CreateWindow(windowName, repoPath, prompt, url string) error {
 	if url != "" {
 		urlLine = fmt.Sprintf("echo '%s'\necho ''\n", url)
 	}
+	// The prompt is read once into a variable and echoed from there, rather
+	// than cat'ing the file and then reading it again.
 	launcherContent := fmt.Sprintf(`#!/bin/bash
-%scat '%s'
-echo '---'
 prompt=$(<'%s')
 rm -f '%s' '%s'
+%sprintf '%%s\n' "$prompt"
+echo '---'
 claude --dangerously-skip-permissions "$prompt"
-`, urlLine, promptPath, promptPath, promptPath, launcherPath)
+`, promptPath, promptPath, launcherPath, urlLine)
 
 	if _, err := launcherFile.WriteString(launcherContent); err != nil {
 		os.Remove(promptPath)
@@ -82,25 +96,26 @@ claude --dangerously-skip-permissions "$prompt"
 		return fmt.Errorf("chmod launcher: %w", err)
 	}
 
-	// Create tmux window
-	cmd := exec.Command("tmux", "new-window", "-n", windowName, "-c", repoPath, "-P")
-	output, err := cmd.Output()
-	if err != nil {
+	// Create the window and start the launcher in one tmux invocation: the
+	// ";" argument chains send-keys onto new-window, and tmux stops the
+	// sequence if the window can't be created. Bash reads the launcher
+	// file safely.
+	cmd := exec.Command("tmux",
+		"new-window", "-n", windowName, "-c", repoPath, ";",
+		"send-keys", "-t", windowName, launcherPath, "Enter")
+	if _, err := cmd.Output(); err != nil {
 		os.Remove(promptPath)
 		os.Remove(launcherPath)
+		// Callers check that the window doesn't exist beforehand, so if it
+		// exists now, new-window succeeded and send-keys is what failed.
+		step := "creating window"
+		if WindowExists(windowName) {
+			step = "starting launcher in window"
+		}
 		if exitErr, ok := err.(*exec.ExitError); ok {
-			return fmt.Errorf("creating window: %s", string(exitErr.Stderr))
+			return fmt.Errorf("%s: %s", step, string(exitErr.Stderr))
 		}
-		return fmt.Errorf("creating window: %w", err)
-	}
-
-	// Window created successfully
-	_ = output // Contains the window target, not needed
-
-	// Run the launcher script — bash reads the file safely
-	cmd = exec.Command("tmux", "send-keys", "-t", windowName, launcherPath, "Enter")
-	if err := cmd.Run(); err != nil {
-		return fmt.Errorf("sending command to window: %w", err)
+		return fmt.Errorf("%s: %w", step, err)
 	}
 
 	return nil
@@ -50,3 +50,25 @@ func TestIsInTmux(t *testing.T) {
 	// The actual result depends on the test environment.
 	_ = IsInTmux()
 }
+
+func TestHasWindow(t *testing.T) {
+	tests := []struct {
+		name   string
+		output string
+		window string
+		want   bool
+	}{
+		{"first line", "netam#1\nbash\n", "netam#1", true},
+		{"last line without newline", "bash\nnetam#1", "netam#1", true},
+		{"prefix only", "netam#12\n", "netam#1", false},
+		{"empty output", "", "netam#1", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := hasWindow([]byte(tt.output), tt.window); got != tt.want {
+				t.Errorf("hasWindow(%q, %q) = %v, want %v", tt.output, tt.window, got, tt.want)
+			}
+		})
+	}
+}
@@ -2,100 +2,87 @@ package flow
 
 import (
 	"fmt"
+	"strconv"
 	"time"
 )
 
+// relativeTimeUnits drives FormatRelativeTime: the first unit whose limit
+// exceeds the elapsed time is reported, counting whole multiples of size.
+// A zero limit means unbounded.
+var relativeTimeUnits = []struct {
+	size  time.Duration
+	limit time.Duration
+	name  string
+}{
+	{time.Minute, time.Hour, "minute"},
+	{time.Hour, 24 * time.Hour, "hour"},
+	{24 * time.Hour, 30 * 24 * time.Hour, "day"},
+	{30 * 24 * time.Hour, 365 * 24 * time.Hour, "month"},
+	{365 * 24 * time.Hour, 0, "year"},
+}
+
 // FormatRelativeTime formats a time as relative to now.
 // Examples: "just now", "5 minutes ago", "2 hours ago", "3 days ago"
 func FormatRelativeTime(t time.Time) string {
-	now := time.Now().UTC()
-	if t.Location() != time.UTC {
-		t = t.UTC()
-	}
+	return FormatRelativeTimeAt(t, time.Now())
+}
 
+// FormatRelativeTimeAt is FormatRelativeTime relative to a caller-supplied
+// now. Display loops should read the clock once and pass it to every call.
+func FormatRelativeTimeAt(t, now time.Time) string {
+	// Sub compares absolute instants, so no UTC normalization is needed.
 	delta := now.Sub(t)
 
 	// Handle future timestamps
 	if delta < 0 {
 		return "in the future"
 	}
-
-	// Less than 1 minute
 	if delta < time.Minute {
 		return "just now"
 	}
 
-	// Minutes
-	minutes := int(delta.Minutes())
-	if minutes < 60 {
-		if minutes == 1 {
-			return "1 minute ago"
-		}
-		return fmt.Sprintf("%d minutes ago", minutes)
-	}
-
-	// Hours
-	hours := int(delta.Hours())
-	if hours < 24 {
-		if hours == 1 {
-			return "1 hour ago"
-		}
-		return fmt.Sprintf("%d hours ago", hours)
-	}
-
-	// Days
-	days := int(delta.Hours() / 24)
-	if days < 30 {
-		if days == 1 {
-			return "1 day ago"
+	for _, u := range relativeTimeUnits {
+		if u.limit == 0 || delta < u.limit {
+			n := int(delta / u.size)
+			if n == 1 {
+				return "1 " + u.name + " ago"
+			}
+			return strconv.Itoa(n) + " " + u.name + "s ago"
 		}
-		return fmt.Sprintf("%d days ago", days)
-	}
-
-	// Months
-	months := days / 30
-	if months < 12 {
-		if months == 1 {
-			return "1 month ago"
-		}
-		return fmt.Sprintf("%d months ago", months)
-	}
-
-	// Years
-	years := days / 365
-	if years == 1 {
-		return "1 year ago"
 	}
-	return fmt.Sprintf("%d years ago", years)
+	return "just now" // unreachable: the last unit is unbounded
 }
 
 // FormatTimeAgo formats a time as a short relative string (e.g., "2d ago", "5h ago").
 func FormatTimeAgo(t time.Time) string {
-	now := time.Now().UTC()
-	if t.Location() != time.UTC {
-		t = t.UTC()
-	}
+	return FormatTimeAgoAt(t, time.Now())
+}
 
+// FormatTimeAgoAt is FormatTimeAgo relative to a caller-supplied now.
+// Display loops should read the clock once and pass it to every call.
+func FormatTimeAgoAt(t, now time.Time) string {
+	// Sub compares absolute instants, so no UTC normalization is needed.
 	delta := now.Sub(t)
 	if delta < 0 {
 		return "future"
 	}
 
-	if delta.Hours() >= 24 {
-		days := int(delta.Hours() / 24)
-		return fmt.Sprintf("%dd ago", days)
+	hours := int(delta / time.Hour)
+	if hours >= 24 {
+		return fmt.Sprintf("%dd ago", hours/24)
 	}
-
-	if delta.Hours() >= 1 {
-		return fmt.Sprintf("%dh ago", int(delta.Hours()))
+	if hours >= 1 {
+		return fmt.Sprintf("%dh ago", hours)
 	}
-
-	return fmt.Sprintf("%dm ago", int(delta.Minutes()))
+	return fmt.Sprintf("%dm ago", int(delta/time.Minute))
 }
 
 // ParseGitHubTimestamp parses a GitHub API timestamp (ISO 8601 with Z suffix).
+//
+// time.Parse recognizes the RFC3339 layout and takes a dedicated fast path
+// that neither allocates nor rewrites the "Z" suffix, and a "Z" input comes
+// back already in time.UTC. A memoizing cache would cost more than the parse.
 func ParseGitHubTimestamp(s string) (time.Time, error) {
-	// GitHub uses RFC3339 format
 	return time.Parse(time.RFC3339, s)
 }
 
@@ -22,6 +22,7 @@ func TestFormatRelativeTime(t *testing.T) {
 		{"3 days ago", now.Add(-3 * 24 * time.Hour), "3 days ago"},
 		{"1 month ago", now.Add(-45 * 24 * time.Hour), "1 month ago"},
 		{"3 months ago", now.Add(-90 * 24 * time.Hour), "3 months ago"},
+		{"12 months ago", now.Add(-362 * 24 * time.Hour), "12 months ago"},
 		{"1 year ago", now.Add(-400 * 24 * time.Hour), "1 year ago"},
 		{"2 years ago", now.Add(-800 * 24 * time.Hour), "2 years ago"},
 	}
@@ -36,6 +37,30 @@ func TestFormatRelativeTime(t *testing.T) {
 	}
 }
 
+func TestFormatRelativeTimeAt(t *testing.T) {
+	now := time.Date(2026, 1, 20, 12, 0, 0, 0, time.UTC)
+
+	tests := []struct {
+		time     time.Time
+		expected string
+	}{
+		{now.Add(time.Minute), "in the future"},
+		{now.Add(-59 * time.Second), "just now"},
+		{now.Add(-119 * time.Minute), "1 hour ago"},
+		{now.Add(-30 * 24 * time.Hour), "1 month ago"},
+		// Non-UTC locations compare by instant, not wall clock.
+		{now.Add(-2 * time.Hour).In(time.FixedZone("PST", -8*3600)), "2 hours ago"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.expected, func(t *testing.T) {
+			if got := FormatRelativeTimeAt(tt.time, now); got != tt.expected {
+				t.Errorf("FormatRelativeTimeAt() = %q, want %q", got, tt.expected)
+			}
+		})
+	}
+}
+
 func TestFormatTimeAgo(t *testing.T) {
 	now := time.Now().UTC()
 
@@ -58,6 +83,31 @@ func TestFormatTimeAgo(t *testing.T) {
 	}
 }
 
+func TestFormatTimeAgoAt(t *testing.T) {
+	now := time.Date(2026, 1, 20, 12, 0, 0, 0, time.UTC)
+
+	tests := []struct {
+		time     time.Time
+		expected string
+	}{
+		{now.Add(time.Minute), "future"},
+		{now.Add(-59 * time.Second), "0m ago"},
+		{now.Add(-90 * time.Minute), "1h ago"},
+		{now.Add(-47 * time.Hour), "1d ago"},
+		// Non-UTC locations compare by instant, not wall clock.
+		{now.Add(-2 * time.Hour).In(time.FixedZone("PST", -8*3600)), "2h ago"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.expected, func(t *testing.T) {
+			got := FormatTimeAgoAt(tt.time, now)
+			if got != tt.expected {
+				t.Errorf("FormatTimeAgoAt() = %q, want %q", got, tt.expected)
+			}
+		})
+	}
+}
+
 func TestParseGitHubTimestamp(t *testing.T) {
 	tests := []struct {
 		input   string
@@ -81,6 +131,20 @@ func TestParseGitHubTimestamp(t *testing.T) {
 	}
 }
 
+func TestParseGitHubTimestampUTC(t *testing.T) {
+	got, err := ParseGitHubTimestamp("2026-01-20T10:30:00Z")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	want := time.Date(2026, 1, 20, 10, 30, 0, 0, time.UTC)
+	if !got.Equal(want) {
+		t.Errorf("ParseGitHubTimestamp() = %v, want %v", got, want)
+	}
+	if got.Location() != time.UTC {
+		t.Errorf("Location() = %v, want UTC", got.Location())
+	}
+}
+
 func TestParseTimeRange(t *testing.T) {
 	t.Run("with since date", func(t *testing.T) {
 		tr, err := ParseTimeRange("2026-01-15", 7)
@@ -88,6 +88,11 @@ type GitHubComment struct {
 	IssueURL  string     `json:"issue_url,omitempty"`
 	PRURL     string     `json:"pull_request_url,omitempty"`
 	HTMLURL   string     `json:"html_url"`
+
+	// ItemNumber caches the issue/PR number parsed from IssueURL/PRURL.
+	// The fetch helpers fill it in; zero means "not yet derived" and
+	// CommentItemNumber falls back to parsing the URL.
+	ItemNumber int `json:"-"`
 }
 
 // BoardItem represents an item on a GitHub project board.
@@ -1,17 +1,19 @@
 package viz
 
 import (
-	"bytes"
 	"fmt"
 	"html/template"
+	"io"
+	"strings"
+	"sync"
 )
 
-// compiledTemplate is parsed at init time to fail fast on template errors.
-var compiledTemplate *template.Template
-
-func init() {
-	compiledTemplate = template.Must(template.New("viz").Parse(htmlTemplate))
-}
+// compiledTemplate parses the page template on first use rather than at
+// init, so bip commands other than viz don't pay for it at startup. The
+// viz tests execute it, which still catches template errors early.
+var compiledTemplate = sync.OnceValue(func() *template.Template {
+	return template.Must(template.New("viz").Parse(htmlTemplate))
+})
 
 // HTMLOptions configures HTML generation.
 type HTMLOptions struct {
@@ -32,22 +34,34 @@ var ValidLayouts = []string{"force", "circle", "grid"}
 
 // GenerateHTML generates a self-contained HTML file for the graph visualization.
 func GenerateHTML(graph *GraphData, opts HTMLOptions) (string, error) {
+	var b strings.Builder
+	if err := WriteHTML(&b, graph, opts); err != nil {
+		return "", err
+	}
+	return b.String(), nil
+}
+
+// WriteHTML writes the graph visualization HTML to w. Options are validated
+// and the graph serialized before anything is written, so an error from
+// either leaves w untouched.
+func WriteHTML(w io.Writer, graph *GraphData, opts HTMLOptions) error {
 	if graph == nil {
-		return "", fmt.Errorf("graph cannot be nil")
+		return fmt.Errorf("graph cannot be nil")
 	}
 
 	// Validate layout option
 	if err := validateLayout(opts.Layout); err != nil {
-		return "", err
+		return err
 	}
 
 	if graph.IsEmpty() {
-		return generateEmptyHTML(), nil
+		_, err := io.WriteString(w, generateEmptyHTML())
+		return err
 	}
 
 	graphJSON, err := graph.ToCytoscapeJSON()
 	if err != nil {
-		return "", err
+		return err
 	}
 
 	layout := layoutToCytoscape(opts.Layout)
@@ -59,12 +73,7 @@ func GenerateHTML(graph *GraphData, opts HTMLOptions) (string, error) {
 		Layout:    layout,
 	}
 
-	var buf bytes.Buffer
-	if err := compiledTemplate.Execute(&buf, data); err != nil {
-		return "", err
-	}
-
-	return buf.String(), nil
+	return compiledTemplate().Execute(w, data)
 }
 
 // validateLayout checks if the layout option is valid.
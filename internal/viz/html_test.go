@@ -0,0 +1,40 @@
+package viz
+
+import (
+	"bytes"
+	"strings"
+	"testing"
+)
+
+func TestWriteHTML(t *testing.T) {
+	graph := &GraphData{
+		Nodes: []Node{{ID: "p1", Type: NodeTypePaper, Label: "Smith 2024"}},
+	}
+
+	var buf bytes.Buffer
+	if err := WriteHTML(&buf, graph, DefaultOptions()); err != nil {
+		t.Fatalf("WriteHTML() error = %v", err)
+	}
+	got, err := GenerateHTML(graph, DefaultOptions())
+	if err != nil {
+		t.Fatalf("GenerateHTML() error = %v", err)
+	}
+	if buf.String() != got {
+		t.Error("WriteHTML() output differs from GenerateHTML()")
+	}
+	if !strings.Contains(got, `"id":"p1"`) {
+		t.Errorf("output missing graph JSON:\n%s", got)
+	}
+
+	// Empty graphs get the placeholder page.
+	buf.Reset()
+	if err := WriteHTML(&buf, &GraphData{}, DefaultOptions()); err != nil || buf.String() != generateEmptyHTML() {
+		t.Errorf("WriteHTML(empty) = %v, want the empty-state page", err)
+	}
+
+	// Invalid options fail before anything is written.
+	buf.Reset()
+	if err := WriteHTML(&buf, graph, HTMLOptions{Layout: "spiral"}); err == nil || buf.Len() != 0 {
+		t.Errorf("WriteHTML(bad layout) = %v with %d bytes written, want error and no output", err, buf.Len())
+	}
+}